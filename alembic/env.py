@@ -24,9 +24,15 @@ from models.admin_weekly_capacity_model import (  # noqa: F401
     AdminWeeklyCapacityModel,
 )
 from models.appointment_model import AppointmentModel  # noqa: F401
+from models.appointment_series_model import (  # noqa: F401
+    AppointmentSeriesModel,
+)
 from models.appointment_service_model import (  # noqa: F401
     AppointmentServiceModel,
 )
+from models.idempotency_key_model import (  # noqa: F401
+    IdempotencyKeyModel,
+)
 from models.service_model import ServiceModel  # noqa: F401
 from models.user_model import UserModel  # noqa: F401
 
@@ -0,0 +1,55 @@
+"""keyset_pagination_indexes
+
+Revision ID: 3f9a1c2d7b84
+Revises: 0104d1d44b1a
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "3f9a1c2d7b84"
+down_revision: Union[str, None] = "0104d1d44b1a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # CREATE INDEX CONCURRENTLY não roda dentro de transação.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_appointments_created_at_id",
+            "appointments",
+            ["created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_users_role_created_at_id",
+            "users",
+            ["role", "created_at", "id"],
+            unique=False,
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_users_role_created_at_id",
+            table_name="users",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_appointments_created_at_id",
+            table_name="appointments",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
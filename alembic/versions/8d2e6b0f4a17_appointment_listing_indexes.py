@@ -0,0 +1,114 @@
+"""appointment_listing_indexes
+
+Revision ID: 8d2e6b0f4a17
+Revises: 3f9a1c2d7b84
+Create Date: 2026-10-18 14:37:05.902113
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2e6b0f4a17"
+down_revision: Union[str, None] = "3f9a1c2d7b84"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Índices compostos no formato das listagens e da disponibilidade.
+NEW_INDEXES = [
+    (
+        "ix_appointments_client_created",
+        ["client_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        None,
+    ),
+    (
+        "ix_appointments_client_status_created",
+        [
+            "client_id",
+            "status",
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+        None,
+    ),
+    (
+        "ix_appointments_admin_created",
+        ["admin_id", sa.text("created_at DESC"), sa.text("id DESC")],
+        None,
+    ),
+    (
+        "ix_appointments_admin_status_created",
+        [
+            "admin_id",
+            "status",
+            sa.text("created_at DESC"),
+            sa.text("id DESC"),
+        ],
+        None,
+    ),
+    (
+        "ix_appointments_admin_date_active",
+        ["admin_id", "date"],
+        sa.text("status <> 'cancelled'"),
+    ),
+]
+
+# Índices de FKs nunca filtradas, duplicatas da PK e prefixos cobertos
+# pelos compostos acima: só encarecem as escritas.
+DROPPED_INDEXES = [
+    ("ix_appointments_id", ["id"]),
+    ("ix_appointments_client_id", ["client_id"]),
+    ("ix_appointments_admin_id", ["admin_id"]),
+    ("ix_appointments_accepted_by", ["accepted_by"]),
+    ("ix_appointments_refused_by", ["refused_by"]),
+    ("ix_appointments_cancelled_by", ["cancelled_by"]),
+    ("ix_appointments_reschedule_requested_by", ["reschedule_requested_by"]),
+    ("ix_appointments_created_at_id", ["created_at", "id"]),
+]
+
+
+def upgrade() -> None:
+    # CREATE/DROP INDEX CONCURRENTLY não rodam dentro de transação.
+    with op.get_context().autocommit_block():
+        for name, columns, where in NEW_INDEXES:
+            op.create_index(
+                name,
+                "appointments",
+                columns,
+                unique=False,
+                postgresql_where=where,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _ in DROPPED_INDEXES:
+            op.drop_index(
+                name,
+                table_name="appointments",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, columns in DROPPED_INDEXES:
+            op.create_index(
+                name,
+                "appointments",
+                columns,
+                unique=False,
+                postgresql_concurrently=True,
+                if_not_exists=True,
+            )
+        for name, _, _ in reversed(NEW_INDEXES):
+            op.drop_index(
+                name,
+                table_name="appointments",
+                postgresql_concurrently=True,
+                if_exists=True,
+            )
@@ -0,0 +1,81 @@
+"""
+Mede o cold start de um worker (importar ``app``).
+
+Cada rodada é um processo Python novo com ``-X importtime``, como um
+container que acabou de subir. O script reporta a mediana do tempo do
+processo inteiro e do import de ``app`` e os módulos mais lentos.
+
+O orçamento e a lista de integrações carregadas sob demanda são
+verificados em ``tests/test_import_time.py``.
+
+Uso:
+    python benchmarks/import_time.py --runs 9 --top 15
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Módulo -> (tempo próprio, tempo acumulado), em microssegundos."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line.removeprefix("import time:").split("|")
+        self_us, cumulative_us, name = fields
+        if not self_us.strip().isdigit():
+            continue  # cabeçalho
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def run_once(module: str) -> tuple[float, dict[str, tuple[int, int]]]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(ROOT / "src"), str(ROOT)]),
+    }
+    started = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    elapsed = (time.perf_counter() - started) * 1000
+    if process.returncode != 0:
+        raise SystemExit(process.stderr)
+    return elapsed, parse_importtime(process.stderr)
+
+
+def main(args: argparse.Namespace) -> None:
+    runs = [run_once(args.module) for _ in range(args.runs)]
+    process_ms = statistics.median(elapsed for elapsed, _ in runs)
+    import_ms = statistics.median(
+        modules[args.module][1] / 1000 for _, modules in runs
+    )
+    modules = runs[-1][1]
+
+    print(f"process        {process_ms:8.1f}ms (median of {args.runs})")
+    print(f"import {args.module:<8}{import_ms:8.1f}ms (median of {args.runs})")
+    print(f"slowest modules (self time, last run of {len(modules)}):")
+    slowest = sorted(modules.items(), key=lambda item: item[1][0])
+    for name, (self_us, _) in reversed(slowest[len(slowest) - args.top :]):
+        print(f"  {self_us / 1000:8.1f}ms  {name}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--module", default="app")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10)
+    main(parser.parse_args())
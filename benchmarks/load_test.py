@@ -0,0 +1,458 @@
+"""
+Teste de carga da API inteira sobre a massa gerada por ``seed_data.py``.
+
+Usuários virtuais (VUs) executam, em loop e sem pausa, um mix ponderado
+de ações: clientes listam, paginam, criam e cancelam agendamentos,
+consultam o catálogo, a disponibilidade e o próprio perfil; admins
+confirmam os pendentes criados pelos clientes, buscam clientes por nome
+e listam a própria agenda. Requisições durante o aquecimento
+(``--warmup``) não entram nas estatísticas.
+
+Por padrão a aplicação roda no mesmo processo (``httpx.ASGITransport``);
+com ``--base-url`` a carga vai para um servidor já em execução, por
+exemplo ``fastapi run src/app.py --workers 4``.
+
+Para comparar commits, salve o resultado de cada um e compare:
+    python benchmarks/load_test.py --output before.json
+    git checkout outro-commit
+    python benchmarks/load_test.py --output after.json --compare before.json
+
+Uso:
+    python benchmarks/seed_data.py --clients 1000 --reset
+    python benchmarks/load_test.py --client-vus 40 --admin-vus 5
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import random
+import subprocess
+import sys
+import time
+from collections import Counter, defaultdict, deque
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from benchmarks.seed_data import (  # noqa: E402
+    FIRST_NAMES,
+    LOAD_TEST_PASSWORD,
+    admin_email,
+    client_email,
+)
+from benchmarks.stats import summarize  # noqa: E402
+
+# Peso relativo de cada ação no mix de cada perfil.
+CLIENT_ACTIONS = {
+    "list": 25,
+    "cursor": 10,
+    "get": 10,
+    "services": 15,
+    "availability": 10,
+    "me": 10,
+    "create": 12,
+    "cancel": 5,
+    "login": 3,
+}
+ADMIN_ACTIONS = {
+    "confirm": 30,
+    "search": 25,
+    "search_cursor": 10,
+    "list": 25,
+    "services": 10,
+}
+SUNDAY = 6
+
+
+class Recorder:
+    """Latências (ms) e erros por endpoint, só depois do aquecimento."""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+        self.errors: Counter[str] = Counter()
+        self.recording = False
+
+    async def request(
+        self,
+        client: httpx.AsyncClient,
+        label: str,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> httpx.Response | None:
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            response = None
+        elapsed = (time.perf_counter() - started) * 1000
+        if self.recording:
+            self.samples[label].append(elapsed)
+            if response is None or response.is_error:
+                self.errors[label] += 1
+        return (
+            response if response is not None and response.is_success else None
+        )
+
+
+class Shared:
+    """Estado compartilhado entre os VUs."""
+
+    def __init__(self):
+        # Preenchidos depois do login, com o catálogo e os ids dos admins.
+        self.service_ids: list[str] = []
+        self.admin_ids: list[str] = []
+        # Agendamentos sem admin criados pelos clientes, à espera de um
+        # admin que os confirme.
+        self.pending: deque[str] = deque(maxlen=10_000)
+
+
+class VirtualUser:
+    def __init__(  # noqa: PLR0913, PLR0917
+        self,
+        client: httpx.AsyncClient,
+        recorder: Recorder,
+        shared: Shared,
+        email: str,
+        rng: random.Random,
+    ):
+        self.client = client
+        self.recorder = recorder
+        self.shared = shared
+        self.email = email
+        self.rng = rng
+        self.headers: dict[str, str] = {}
+        self.known_ids: deque[str] = deque(maxlen=100)
+        self.cancellable: list[str] = []
+        self.next_cursor: str | None = None
+
+    async def login(self) -> bool:
+        response = await self.recorder.request(
+            self.client,
+            "POST /auth/login",
+            "POST",
+            "/auth/login",
+            data={"username": self.email, "password": LOAD_TEST_PASSWORD},
+        )
+        # O login também grava o cookie; o header Authorization tem
+        # precedência, mas o cookie só aumentaria as requisições seguintes.
+        self.client.cookies.clear()
+        if response is None:
+            return False
+        token = response.json()["access_token"]
+        self.headers = {"Authorization": f"Bearer {token}"}
+        return True
+
+    async def run(self, actions: dict[str, int], deadline: float) -> None:
+        names, weights = list(actions), list(actions.values())
+        while time.perf_counter() < deadline:
+            action = self.rng.choices(names, weights=weights)[0]
+            await getattr(self, f"do_{action}")()
+
+    async def get(self, label: str, url: str, **params) -> dict | None:
+        response = await self.recorder.request(
+            self.client,
+            label,
+            "GET",
+            url,
+            params=params,
+            headers=self.headers,
+        )
+        return response.json() if response is not None else None
+
+    async def post(self, label: str, url: str, body=None) -> dict | None:
+        response = await self.recorder.request(
+            self.client, label, "POST", url, json=body, headers=self.headers
+        )
+        return response.json() if response is not None else None
+
+    def remember(self, page: dict | None) -> None:
+        if page is not None:
+            self.known_ids.extend(item["id"] for item in page["items"])
+
+    async def do_list(self) -> None:
+        params = {"page": self.rng.randint(1, 3), "size": 20}
+        if self.rng.random() < 0.3:  # noqa: PLR2004
+            params["status"] = self.rng.choice(["pending", "confirmed"])
+        self.remember(
+            await self.get("GET /appointments/", "/appointments/", **params)
+        )
+
+    async def do_cursor(self) -> None:
+        params = {"size": 20}
+        if self.next_cursor:
+            params["cursor"] = self.next_cursor
+        page = await self.get(
+            "GET /appointments/cursor", "/appointments/cursor", **params
+        )
+        self.remember(page)
+        self.next_cursor = page["next_cursor"] if page else None
+
+    async def do_get(self) -> None:
+        if not self.known_ids:
+            await self.do_list()
+            return
+        id = self.rng.choice(self.known_ids)
+        await self.get("GET /appointments/{id}", f"/appointments/{id}")
+
+    async def do_services(self) -> None:
+        await self.get("GET /services/", "/services/")
+
+    async def do_availability(self) -> None:
+        today = datetime.now(UTC).date()
+        await self.get(
+            "GET /appointments/availability",
+            "/appointments/availability",
+            **{"from": today, "to": today + timedelta(days=13)},
+        )
+
+    async def do_me(self) -> None:
+        await self.get("GET /auth/me", "/auth/me")
+
+    async def do_login(self) -> None:
+        await self.login()
+
+    async def do_create(self) -> None:
+        day = datetime.now(UTC).date() + timedelta(
+            days=self.rng.randint(1, 30)
+        )
+        if day.weekday() == SUNDAY:
+            day += timedelta(days=1)
+        with_admin = self.rng.random() < 0.5  # noqa: PLR2004
+        body = {
+            "date": day.isoformat(),
+            "services": self.rng.sample(
+                self.shared.service_ids,
+                k=min(len(self.shared.service_ids), self.rng.randint(1, 2)),
+            ),
+            "admin_id": (
+                self.rng.choice(self.shared.admin_ids) if with_admin else None
+            ),
+        }
+        created = await self.post(
+            "POST /appointments/", "/appointments/", body
+        )
+        if created is None:
+            return
+        self.known_ids.append(created["id"])
+        # Metade fica para o próprio cliente cancelar e metade (as sem
+        # admin) vai para a fila de confirmação, sem disputa entre as duas.
+        if with_admin:
+            self.cancellable.append(created["id"])
+        else:
+            self.shared.pending.append(created["id"])
+
+    async def do_cancel(self) -> None:
+        if not self.cancellable:
+            await self.do_create()
+            return
+        id = self.cancellable.pop()
+        await self.post(
+            "POST /appointments/{id}/cancel",
+            f"/appointments/{id}/cancel",
+            {"cancel_reason": "Teste de carga"},
+        )
+
+    async def do_confirm(self) -> None:
+        if not self.shared.pending:
+            await self.do_list()
+            return
+        id = self.shared.pending.popleft()
+        await self.post(
+            "POST /appointments/{id}/confirm", f"/appointments/{id}/confirm"
+        )
+
+    async def do_search(self) -> None:
+        await self.get(
+            "GET /users/", "/users/", name=self.rng.choice(FIRST_NAMES)
+        )
+
+    async def do_search_cursor(self) -> None:
+        await self.get(
+            "GET /users/cursor",
+            "/users/cursor",
+            name=self.rng.choice(FIRST_NAMES),
+        )
+
+
+def git_revision() -> dict:
+    def git(*args: str) -> str:
+        return subprocess.run(
+            ["git", *args],
+            cwd=ROOT,
+            capture_output=True,
+            text=True,
+            check=False,
+        ).stdout.strip()
+
+    return {
+        "commit": git("rev-parse", "--short", "HEAD"),
+        "dirty": bool(git("status", "--porcelain", "--untracked-files=no")),
+    }
+
+
+def build_report(recorder: Recorder, seconds: float) -> dict:
+    endpoints = {}
+    for label in sorted(recorder.samples):
+        samples = recorder.samples[label]
+        endpoints[label] = {
+            "n": len(samples),
+            "errors": recorder.errors[label],
+            "rps": len(samples) / seconds,
+            **summarize(samples),
+        }
+    everything = [s for samples in recorder.samples.values() for s in samples]
+    endpoints["TOTAL"] = {
+        "n": len(everything),
+        "errors": sum(recorder.errors.values()),
+        "rps": len(everything) / seconds,
+        **summarize(everything),
+    }
+    return endpoints
+
+
+def print_report(endpoints: dict, baseline: dict | None) -> None:
+    print(
+        f"{'endpoint':<34} {'n':>6} {'err':>5} {'rps':>7} "
+        f"{'p50':>7} {'p95':>7} {'p99':>7} {'max':>7}"
+    )
+    for label, row in endpoints.items():
+        print(
+            f"{label:<34} {row['n']:>6} {row['errors']:>5} "
+            f"{row['rps']:>7.1f} {row['p50']:>7.1f} {row['p95']:>7.1f} "
+            f"{row['p99']:>7.1f} {row['max']:>7.1f}"
+        )
+        before = (baseline or {}).get(label)
+        if before:
+            print(
+                f"{'  vs baseline':<34} {'':>6} {'':>5} "
+                f"{delta(before['rps'], row['rps']):>7} "
+                f"{delta(before['p50'], row['p50']):>7} "
+                f"{delta(before['p95'], row['p95']):>7} "
+                f"{delta(before['p99'], row['p99']):>7}"
+            )
+
+
+def delta(before: float, after: float) -> str:
+    if not before:
+        return "-"
+    return f"{(after - before) / before:+.0%}"
+
+
+async def start_users(
+    client: httpx.AsyncClient,
+    recorder: Recorder,
+    args: argparse.Namespace,
+) -> tuple[list[VirtualUser], list[VirtualUser]]:
+    rng = random.Random(args.seed)
+    shared = Shared()
+    clients = [
+        VirtualUser(
+            client,
+            recorder,
+            shared,
+            client_email(index),
+            random.Random(rng.random()),
+        )
+        for index in rng.sample(range(args.clients), args.client_vus)
+    ]
+    admins = [
+        VirtualUser(
+            client,
+            recorder,
+            shared,
+            admin_email(index % args.admins),
+            random.Random(rng.random()),
+        )
+        for index in range(args.admin_vus)
+    ]
+    users = clients + admins
+    logged_in = await asyncio.gather(*(user.login() for user in users))
+    if not all(logged_in):
+        raise SystemExit(
+            "login failed; run benchmarks/seed_data.py first "
+            "(--clients/--admins must match the seeded dataset)"
+        )
+
+    services = await clients[0].get("GET /services/", "/services/")
+    me = await asyncio.gather(
+        *(admin.get("GET /auth/me", "/auth/me") for admin in admins)
+    )
+    shared.service_ids = [service["id"] for service in services]
+    shared.admin_ids = list({user["id"] for user in me})
+    return clients, admins
+
+
+async def main(args: argparse.Namespace) -> None:
+    # Um log por requisição distorceria a própria medição.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    if args.base_url:
+        client = httpx.AsyncClient(base_url=args.base_url, timeout=60)
+    else:
+        from app import app_fast  # noqa: PLC0415
+
+        client = httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=app_fast),
+            base_url="http://load-test",
+            timeout=60,
+        )
+
+    recorder = Recorder()
+    async with client:
+        clients, admins = await start_users(client, recorder, args)
+        started = time.perf_counter()
+        deadline = started + args.warmup + args.duration
+
+        async def start_recording() -> None:
+            await asyncio.sleep(args.warmup)
+            recorder.recording = True
+
+        await asyncio.gather(
+            start_recording(),
+            *(user.run(CLIENT_ACTIONS, deadline) for user in clients),
+            *(user.run(ADMIN_ACTIONS, deadline) for user in admins),
+        )
+        measured = time.perf_counter() - started - args.warmup
+
+    endpoints = build_report(recorder, measured)
+    baseline = None
+    if args.compare:
+        previous = Path(args.compare).read_text(encoding="utf-8")
+        baseline = json.loads(previous)["endpoints"]
+    print_report(endpoints, baseline)
+
+    if args.output:
+        result = {
+            **git_revision(),
+            "timestamp": datetime.now(UTC).isoformat(),
+            "args": vars(args),
+            "seconds": measured,
+            "endpoints": endpoints,
+        }
+        Path(args.output).write_text(
+            json.dumps(result, indent=2), encoding="utf-8"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--base-url", help="servidor externo em vez do ASGI")
+    parser.add_argument("--client-vus", type=int, default=40)
+    parser.add_argument("--admin-vus", type=int, default=5)
+    parser.add_argument("--duration", type=float, default=30.0)
+    parser.add_argument("--warmup", type=float, default=5.0)
+    parser.add_argument(
+        "--clients", type=int, default=1_000, help="clientes do seed"
+    )
+    parser.add_argument(
+        "--admins", type=int, default=10, help="admins do seed"
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", help="grava o resultado em JSON")
+    parser.add_argument("--compare", help="JSON de uma execução anterior")
+    asyncio.run(main(parser.parse_args()))
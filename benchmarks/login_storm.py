@@ -0,0 +1,125 @@
+"""
+Mede a latência de um endpoint não relacionado (GET /services/) durante
+uma rajada de logins.
+
+A aplicação roda no mesmo processo e event loop do cliente (via
+``httpx.ASGITransport``), como um único worker: qualquer trabalho de CPU
+que bloqueie o loop aparece diretamente na latência do endpoint medido.
+
+Requer o banco configurado em ``.env`` com as migrações aplicadas.
+
+Uso:
+    python benchmarks/login_storm.py --logins 200 --concurrency 50
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+from uuid import uuid4
+
+import httpx
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from app import app_fast  # noqa: E402
+from benchmarks.stats import report  # noqa: E402
+from core.security import create_access_token  # noqa: E402
+
+PASSWORD = "benchmark-password"
+
+
+async def probe(
+    client: httpx.AsyncClient,
+    headers: dict,
+    stop: asyncio.Event,
+    interval: float,
+) -> list[float]:
+    samples = []
+    while not stop.is_set():
+        started = time.perf_counter()
+        response = await client.get("/services/", headers=headers)
+        response.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(interval)
+    return samples
+
+
+async def login_storm(
+    client: httpx.AsyncClient,
+    email: str,
+    logins: int,
+    concurrency: int,
+) -> tuple[float, int]:
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = 0
+
+    async def login() -> None:
+        nonlocal failures
+        async with semaphore:
+            response = await client.post(
+                "/auth/login",
+                data={"username": email, "password": PASSWORD},
+            )
+            if response.status_code != 200:  # noqa: PLR2004
+                failures += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(login() for _ in range(logins)))
+    return time.perf_counter() - started, failures
+
+
+async def main(args: argparse.Namespace) -> None:
+    transport = httpx.ASGITransport(app=app_fast)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://benchmark"
+    ) as client:
+        email = f"benchmark-{uuid4().hex[:8]}@example.com"
+        response = await client.post(
+            "/users/",
+            json={
+                "name": "Benchmark",
+                "email": email,
+                "phone": "0",
+                "role": "client",
+                "password": PASSWORD,
+            },
+        )
+        response.raise_for_status()
+        token, _ = create_access_token({"sub": response.json()["id"]})
+        headers = {"Authorization": f"Bearer {token}"}
+
+        stop = asyncio.Event()
+        baseline = asyncio.create_task(
+            probe(client, headers, stop, args.interval)
+        )
+        await asyncio.sleep(args.baseline_seconds)
+        stop.set()
+        report("baseline", await baseline)
+
+        stop = asyncio.Event()
+        during = asyncio.create_task(
+            probe(client, headers, stop, args.interval)
+        )
+        elapsed, failures = await login_storm(
+            client, email, args.logins, args.concurrency
+        )
+        stop.set()
+        report("during storm", await during)
+        print(
+            f"logins         n={args.logins} failures={failures} "
+            f"elapsed={elapsed:.2f}s "
+            f"throughput={args.logins / elapsed:.1f}/s"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--logins", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--interval", type=float, default=0.01)
+    parser.add_argument("--baseline-seconds", type=float, default=3.0)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,118 @@
+"""
+Satura o pool de conexões com mais tarefas concorrentes do que conexões
+disponíveis e mede a espera pelo checkout e a latência total.
+
+Cada tarefa abre uma sessão, segura a conexão por ``--hold-ms`` (via
+``pg_sleep``, simulando uma requisição) e a devolve, em loop. Com
+concorrência acima de ``DB_POOL_SIZE + DB_MAX_OVERFLOW``, o excedente
+espera na fila do pool; acima de ``DB_POOL_TIMEOUT_SECONDS`` de espera, o
+checkout falha.
+
+As configurações do pool vêm do ``.env``/ambiente, então dá para
+comparar variações, por exemplo:
+    DB_POOL_SIZE=10 DB_MAX_OVERFLOW=0 python benchmarks/pool_saturation.py
+
+Uso:
+    python benchmarks/pool_saturation.py --multipliers 1,2 --hold-ms 20
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from benchmarks.stats import report  # noqa: E402
+from core.db.session import AsyncSessionLocal, engine  # noqa: E402
+from core.settings import get_settings  # noqa: E402
+
+settings = get_settings()
+
+
+async def worker(
+    deadline: float,
+    hold_seconds: float,
+    waits: list[float],
+    latencies: list[float],
+) -> int:
+    timeouts = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            async with AsyncSessionLocal() as session:
+                await session.connection()
+                checked_out = time.perf_counter()
+                await session.execute(
+                    text("SELECT pg_sleep(:seconds)"),
+                    {"seconds": hold_seconds},
+                )
+        except PoolTimeoutError:
+            timeouts += 1
+            continue
+        waits.append((checked_out - started) * 1000)
+        latencies.append((time.perf_counter() - started) * 1000)
+    return timeouts
+
+
+async def run(
+    label: str, concurrency: int, seconds: float, hold_ms: float
+) -> None:
+    waits: list[float] = []
+    latencies: list[float] = []
+    deadline = time.perf_counter() + seconds
+    started = time.perf_counter()
+    timeouts = await asyncio.gather(
+        *(
+            worker(deadline, hold_ms / 1000, waits, latencies)
+            for _ in range(concurrency)
+        )
+    )
+    elapsed = time.perf_counter() - started
+
+    print(f"\n{label} concurrency={concurrency}")
+    report("checkout wait", waits)
+    report("latency", latencies)
+    print(
+        f"throughput     {len(latencies) / elapsed:.1f} req/s "
+        f"timeouts={sum(timeouts)}"
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    capacity = settings.DB_POOL_SIZE + settings.DB_MAX_OVERFLOW
+    print(
+        f"pool_size={settings.DB_POOL_SIZE} "
+        f"max_overflow={settings.DB_MAX_OVERFLOW} "
+        f"pool_timeout={settings.DB_POOL_TIMEOUT_SECONDS}s "
+        f"hold={args.hold_ms}ms"
+    )
+    # Abre as conexões do pool antes de medir.
+    await run("warm-up", capacity, 0.5, args.hold_ms)
+    for multiplier in args.multipliers:
+        await run(
+            f"{multiplier:g}x",
+            max(1, round(capacity * multiplier)),
+            args.seconds,
+            args.hold_ms,
+        )
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--multipliers",
+        type=lambda value: [float(item) for item in value.split(",")],
+        default=[1.0, 2.0],
+        help="concorrência como múltiplo de pool_size + max_overflow",
+    )
+    parser.add_argument("--hold-ms", type=float, default=20.0)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    args = parser.parse_args()
+    asyncio.run(main(args))
@@ -0,0 +1,262 @@
+"""
+Gera uma massa de dados realista para os testes de carga.
+
+Cria N clientes, A admins (com capacidade semanal), M serviços e K
+agendamentos espalhados entre o passado e o futuro próximo, com status
+coerentes com a data: no passado a maioria foi confirmada, no futuro a
+maioria ainda está pendente. A mesma ``--seed`` gera sempre os mesmos
+dados, para que resultados de commits diferentes sejam comparáveis.
+
+Todos os usuários usam a senha ``LOAD_TEST_PASSWORD`` e emails no formato
+``loadtest-client-{i}@example.com`` / ``loadtest-admin-{i}@example.com``.
+
+Requer o banco configurado em ``.env`` com as migrações aplicadas.
+
+Uso:
+    python benchmarks/seed_data.py --clients 1000 --appointments 50000 --reset
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from datetime import UTC, datetime, timedelta
+from datetime import time as day_time
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import insert, text
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from core.db.session import AsyncSessionLocal, engine  # noqa: E402
+from core.security import password_hash  # noqa: E402
+from enums import AppointmentStatus, UserRole, WeekDay  # noqa: E402
+from models import (  # noqa: E402
+    AdminWeeklyCapacityModel,
+    AppointmentModel,
+    AppointmentServiceModel,
+    ServiceModel,
+    UserModel,
+)
+
+LOAD_TEST_PASSWORD = "load-test-password"
+BATCH_SIZE = 5_000
+
+FIRST_NAMES = [
+    "Ana", "Bruno", "Carla", "Daniel", "Eduarda", "Felipe", "Gabriela",
+    "Henrique", "Isabela", "João", "Larissa", "Marcos", "Natália",
+    "Otávio", "Paula", "Rafael", "Sofia", "Thiago", "Vitória", "Yuri",
+]  # fmt: skip
+LAST_NAMES = [
+    "Almeida", "Barbosa", "Cardoso", "Dias", "Ferreira", "Gomes",
+    "Lima", "Martins", "Oliveira", "Pereira", "Ribeiro", "Santos",
+    "Silva", "Souza", "Teixeira",
+]  # fmt: skip
+SERVICE_NAMES = [
+    "Corte", "Escova", "Coloração", "Hidratação", "Manicure", "Pedicure",
+    "Barba", "Sobrancelha", "Maquiagem", "Depilação", "Massagem",
+    "Limpeza de pele",
+]  # fmt: skip
+
+# Peso de cada dia da semana (segunda = 0); domingo não tem expediente.
+WEEKDAY_WEIGHTS = [1.0, 1.0, 1.1, 1.2, 1.5, 1.8, 0.0]
+PAST_STATUS_WEIGHTS = {
+    AppointmentStatus.CONFIRMED: 0.80,
+    AppointmentStatus.CANCELLED: 0.15,
+    AppointmentStatus.PENDING: 0.05,
+}
+FUTURE_STATUS_WEIGHTS = {
+    AppointmentStatus.PENDING: 0.50,
+    AppointmentStatus.CONFIRMED: 0.40,
+    AppointmentStatus.CANCELLED: 0.10,
+}
+# Fração dos agendamentos não confirmados que já têm um admin atribuído.
+ASSIGNED_RATIO = 0.5
+
+
+def client_email(index: int) -> str:
+    return f"loadtest-client-{index}@example.com"
+
+
+def admin_email(index: int) -> str:
+    return f"loadtest-admin-{index}@example.com"
+
+
+def build_users(
+    rng: random.Random, clients: int, admins: int
+) -> tuple[list[dict], list[dict]]:
+    # Um único hash para todos: Argon2 por usuário tornaria o seed lento.
+    hashed = password_hash.hash(LOAD_TEST_PASSWORD)
+
+    def user(email: str, role: UserRole) -> dict:
+        return {
+            "id": uuid4(),
+            "name": f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+            "email": email,
+            "password_hash": hashed,
+            "role": role,
+            "phone": f"+55119{rng.randrange(10**8):08d}",
+        }
+
+    return (
+        [user(client_email(i), UserRole.CLIENT) for i in range(clients)],
+        [user(admin_email(i), UserRole.ADMIN) for i in range(admins)],
+    )
+
+
+def build_services(rng: random.Random, count: int) -> list[dict]:
+    return [
+        {
+            "id": uuid4(),
+            "name": (
+                f"{SERVICE_NAMES[i % len(SERVICE_NAMES)]} "
+                f"{i // len(SERVICE_NAMES) + 1}"
+            ),
+            "description": "Serviço gerado para testes de carga",
+            "price": Decimal(rng.randrange(2_000, 30_000)) / 100,
+        }
+        for i in range(count)
+    ]
+
+
+def build_capacity(admins: list[dict], daily_limit: int) -> list[dict]:
+    return [
+        {"id": uuid4(), "admin_id": admin["id"], "week_day": week_day,
+         "limit": daily_limit}
+        for admin in admins
+        for week_day in WeekDay
+        if week_day != WeekDay.SUNDAY
+    ]  # fmt: skip
+
+
+def build_appointments(  # noqa: PLR0913, PLR0917
+    rng: random.Random,
+    count: int,
+    clients: list[dict],
+    admins: list[dict],
+    services: list[dict],
+    past_days: int,
+    future_days: int,
+) -> tuple[list[dict], list[dict]]:
+    today = datetime.now(UTC).date()
+    days = [
+        today + timedelta(days=offset)
+        for offset in range(-past_days, future_days + 1)
+    ]
+    day_weights = [WEEKDAY_WEIGHTS[day.weekday()] for day in days]
+    # Poucos serviços concentram a maior parte da procura (Zipf).
+    service_weights = [1 / (rank + 1) for rank in range(len(services))]
+
+    appointments, links = [], []
+    for day in rng.choices(days, weights=day_weights, k=count):
+        weights = PAST_STATUS_WEIGHTS if day < today else FUTURE_STATUS_WEIGHTS
+        status = rng.choices(list(weights), weights=list(weights.values()))[0]
+        booked_at = datetime.combine(
+            day - timedelta(days=rng.randint(1, 30)),
+            day_time(rng.randint(8, 20), rng.randrange(60)),
+            tzinfo=UTC,
+        )
+        created_at = min(booked_at, datetime.now(UTC))
+        assigned = (
+            status == AppointmentStatus.CONFIRMED
+            or rng.random() < ASSIGNED_RATIO
+        )
+        appointment = {
+            "id": uuid4(),
+            "date": day,
+            "status": status,
+            "client_id": rng.choice(clients)["id"],
+            "admin_id": rng.choice(admins)["id"] if assigned else None,
+            "created_at": created_at,
+            "updated_at": created_at,
+            "cancel_reason": None,
+            "cancelled_at": None,
+        }
+        if status == AppointmentStatus.CANCELLED:
+            appointment["cancel_reason"] = "Cancelado pelo cliente"
+            appointment["cancelled_at"] = created_at + timedelta(hours=2)
+        appointments.append(appointment)
+
+        chosen = {
+            rng.choices(services, weights=service_weights)[0]["id"]
+            for _ in range(rng.choice([1, 1, 1, 2, 2, 3]))
+        }
+        links.extend(
+            {"appointment_id": appointment["id"], "service_id": service_id}
+            for service_id in chosen
+        )
+    return appointments, links
+
+
+async def insert_batches(session, model, rows: list[dict]) -> None:
+    for start in range(0, len(rows), BATCH_SIZE):
+        await session.execute(insert(model), rows[start : start + BATCH_SIZE])
+
+
+async def main(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    started = time.perf_counter()
+
+    clients, admins = build_users(rng, args.clients, args.admins)
+    services = build_services(rng, args.services)
+    capacity = build_capacity(admins, args.daily_limit)
+    appointments, links = build_appointments(
+        rng,
+        args.appointments,
+        clients,
+        admins,
+        services,
+        args.past_days,
+        args.future_days,
+    )
+
+    async with AsyncSessionLocal() as session:
+        if args.reset:
+            await session.execute(
+                text(
+                    "TRUNCATE users, services, appointments, "
+                    "appointment_services, admin_weekly_capacity, "
+                    "admin_daily_override CASCADE"
+                )
+            )
+        await insert_batches(session, UserModel, clients + admins)
+        await insert_batches(session, ServiceModel, services)
+        await insert_batches(session, AdminWeeklyCapacityModel, capacity)
+        await insert_batches(session, AppointmentModel, appointments)
+        await insert_batches(session, AppointmentServiceModel, links)
+        await session.commit()
+        await session.execute(text("ANALYZE"))
+    await engine.dispose()
+
+    print(
+        f"seeded clients={len(clients)} admins={len(admins)} "
+        f"services={len(services)} appointments={len(appointments)} "
+        f"links={len(links)} in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--clients", type=int, default=1_000)
+    parser.add_argument("--admins", type=int, default=10)
+    parser.add_argument("--services", type=int, default=24)
+    parser.add_argument("--appointments", type=int, default=50_000)
+    parser.add_argument("--past-days", type=int, default=120)
+    parser.add_argument("--future-days", type=int, default=60)
+    parser.add_argument(
+        "--daily-limit",
+        type=int,
+        default=1_000,
+        help="vagas por admin e dia; alto para a carga não esgotar vagas",
+    )
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument(
+        "--reset",
+        action="store_true",
+        help="apaga usuários, serviços e agendamentos antes de gerar",
+    )
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,184 @@
+"""
+Micro-benchmarks da serialização de AppointmentRead e ServiceRead.
+
+Para cada tamanho de página, mede separadamente:
+- orm -> pydantic: ``AppointmentRead.model_validate`` dos modelos ORM com
+  os serviços resolvidos pelo catálogo, como em ``AppointmentsService``;
+- fastapi: o caminho padrão de uma rota que retorna o modelo (nova
+  validação contra o ``response_model``, dump para dicts e ``json.dumps``
+  do ``JSONResponse``);
+- fastapi+orjson: o mesmo com o ``ORJSONResponse``, classe de resposta
+  padrão da aplicação;
+- adapter: ``dump_json`` do TypeAdapter do schema, usado pelas rotas de
+  agendamento via ``json_response``.
+
+Também compara a listagem de serviços pelo caminho padrão com os bytes
+pré-serializados do catálogo. Antes de medir, confere que todos os
+caminhos produzem exatamente o mesmo JSON.
+
+Não usa banco: os modelos ORM são montados em memória.
+
+Uso:
+    python benchmarks/serialization.py --sizes 10,50,100 --services 3
+"""
+
+import argparse
+import sys
+import timeit
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from pathlib import Path
+from uuid import uuid4
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path[:0] = [str(ROOT / "src"), str(ROOT)]
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+from fastapi.routing import serialize_response  # noqa: E402
+from fastapi.utils import create_model_field  # noqa: E402
+from fastapi_pagination import Page  # noqa: E402
+
+from enums import AppointmentStatus  # noqa: E402
+from models import (  # noqa: E402
+    AppointmentModel,
+    AppointmentServiceModel,
+    ServiceModel,
+)
+from schemas.appointments_schema import (  # noqa: E402
+    AppointmentRead,
+    appointment_page_adapter,
+)
+from schemas.services_schema import (  # noqa: E402
+    ServiceRead,
+    service_list_adapter,
+)
+
+
+def build_catalog(count: int) -> dict:
+    now = datetime.now(UTC)
+    services = [
+        ServiceModel(
+            id=uuid4(),
+            name=f"Serviço {index}",
+            description="Descrição do serviço",
+            price=Decimal("49.9"),
+            created_at=now,
+            updated_at=now,
+        )
+        for index in range(count)
+    ]
+    return {
+        service.id: ServiceRead.model_validate(service) for service in services
+    }
+
+
+def build_rows(size: int, catalog: dict, per_row: int) -> list:
+    now = datetime.now(UTC)
+    service_ids = list(catalog)
+    return [
+        AppointmentModel(
+            id=uuid4(),
+            date=date.today() + timedelta(days=index % 30),
+            status=AppointmentStatus.PENDING,
+            client_id=uuid4(),
+            admin_id=None,
+            created_at=now,
+            updated_at=now,
+            services=[
+                AppointmentServiceModel(service_id=service_ids[offset])
+                for offset in range(per_row)
+            ],
+        )
+        for index in range(size)
+    ]
+
+
+def fastapi_render(field, content, response_class) -> bytes:
+    # Com is_coroutine=True a corrotina nunca suspende; conduzi-la à mão
+    # evita somar o custo de um event loop a cada medida.
+    coroutine = serialize_response(
+        field=field, response_content=content, is_coroutine=True
+    )
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        data = stop.value
+    else:
+        raise RuntimeError("serialize_response suspended")
+    return response_class(data).body
+
+
+def measure(label: str, func, number: int, baseline: float | None) -> float:
+    elapsed = min(timeit.repeat(func, number=number, repeat=5)) / number
+    speedup = f"{baseline / elapsed:5.2f}x" if baseline else ""
+    print(f"  {label:<18} {elapsed * 1e6:9.1f}us  {speedup}")
+    return elapsed
+
+
+def main(args: argparse.Namespace) -> None:
+    catalog = build_catalog(max(args.services, 12))
+    page_field = create_model_field("response", Page[AppointmentRead])
+    for size in args.sizes:
+        rows = build_rows(size, catalog, args.services)
+        context = {"services": catalog}
+
+        def to_pydantic(rows=rows, context=context):
+            return [
+                AppointmentRead.model_validate(row, context=context)
+                for row in rows
+            ]
+
+        page = Page[AppointmentRead](
+            items=to_pydantic(), total=size, page=1, size=size, pages=1
+        )
+        expected = appointment_page_adapter.dump_json(page)
+        assert fastapi_render(page_field, page, JSONResponse) == expected
+        assert fastapi_render(page_field, page, ORJSONResponse) == expected
+
+        number = max(10, 2_000 // size)
+        print(f"page of {size} appointments x {args.services} services")
+        measure("orm -> pydantic", to_pydantic, number, None)
+        baseline = measure(
+            "fastapi",
+            lambda page=page: fastapi_render(page_field, page, JSONResponse),
+            number,
+            None,
+        )
+        measure(
+            "fastapi+orjson",
+            lambda page=page: fastapi_render(page_field, page, ORJSONResponse),
+            number,
+            baseline,
+        )
+        measure(
+            "adapter",
+            lambda page=page: appointment_page_adapter.dump_json(page),
+            number,
+            baseline,
+        )
+
+    services = list(catalog.values())
+    services_field = create_model_field("response", list[ServiceRead])
+    snapshot = service_list_adapter.dump_json(services)
+    assert fastapi_render(services_field, services, JSONResponse) == snapshot
+    print(f"services catalog ({len(services)} services)")
+    baseline = measure(
+        "fastapi",
+        lambda: fastapi_render(services_field, services, JSONResponse),
+        500,
+        None,
+    )
+    measure("snapshot", lambda: snapshot, 500, baseline)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument(
+        "--sizes",
+        type=lambda value: [int(size) for size in value.split(",")],
+        default=[10, 50, 100],
+    )
+    parser.add_argument(
+        "--services", type=int, default=3, help="serviços por agendamento"
+    )
+    main(parser.parse_args())
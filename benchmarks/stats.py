@@ -0,0 +1,33 @@
+"""Estatísticas e relatórios compartilhados pelos scripts de benchmark."""
+
+
+def percentile(samples: list[float], pct: float) -> float:
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, round(pct / 100 * (len(ordered) - 1)))
+    return ordered[index]
+
+
+def summarize(samples: list[float]) -> dict[str, float]:
+    """p50/p95/p99/max em ms de uma lista de latências (em ms)."""
+    if not samples:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "max": 0.0}
+    return {
+        "p50": percentile(samples, 50),
+        "p95": percentile(samples, 95),
+        "p99": percentile(samples, 99),
+        "max": max(samples),
+    }
+
+
+def report(label: str, samples: list[float]) -> None:
+    if not samples:
+        print(f"{label:<14} n=0")
+        return
+    summary = summarize(samples)
+    print(
+        f"{label:<14} n={len(samples):<5} "
+        f"p50={summary['p50']:7.1f}ms "
+        f"p95={summary['p95']:7.1f}ms "
+        f"p99={summary['p99']:7.1f}ms "
+        f"max={summary['max']:7.1f}ms"
+    )
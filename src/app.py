@@ -1,10 +1,18 @@
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi_pagination import add_pagination
 from starlette.middleware.cors import CORSMiddleware
 from starlette.middleware.sessions import SessionMiddleware
 
+from core.db.query_stats import instrument_engine
+from core.db.session import engine, replica_engine
 from core.exceptions.error_handlers import register_error_handlers
 from core.logging_config import setup_logging
+from core.middleware import (
+    MetricsMiddleware,
+    QueryStatsMiddleware,
+    ReadYourWritesMiddleware,
+)
 from core.settings import get_settings
 from routers.admin_daily_limit_router import protected_admin_daily_router
 from routers.appointments_router import (
@@ -14,6 +22,8 @@ from routers.appointments_router import (
     protected_user_router as appointments_user_router,
 )
 from routers.auth_router import auth_public_router
+from routers.availability_router import protected_availability_router
+from routers.metrics_router import metrics_router
 from routers.services_router import public_services_router, services_router
 from routers.user_router import protected_user_router, user_public_router
 
@@ -26,6 +36,9 @@ def create_app() -> FastAPI:
     app = FastAPI(
         title="Appointment",
         description="API for appointment services",
+        # Mesmo JSON do JSONResponse: o conteúdo já chega convertido pelo
+        # response_model (UUID, datas e Decimal como string).
+        default_response_class=ORJSONResponse,
     )
     app.add_middleware(
         CORSMiddleware,
@@ -38,6 +51,21 @@ def create_app() -> FastAPI:
         SessionMiddleware,  # ty:ignore[invalid-argument-type]
         secret_key=config.SECRET_KEY.get_secret_value(),
     )
+    if replica_engine is not None:
+        app.add_middleware(ReadYourWritesMiddleware)  # ty:ignore[invalid-argument-type]
+    if config.SQL_STATS_ENABLED:
+        instrument_engine(engine)
+        if replica_engine is not None:
+            instrument_engine(replica_engine)
+        app.add_middleware(
+            QueryStatsMiddleware,  # ty:ignore[invalid-argument-type]
+            statement_budget=config.SQL_STATEMENT_BUDGET,
+            repeat_limit=config.SQL_REPEAT_LIMIT,
+            raise_on_violation=config.SQL_BUDGET_RAISE,
+        )
+    if config.METRICS_ENABLED:
+        app.add_middleware(MetricsMiddleware)  # ty:ignore[invalid-argument-type]
+        app.include_router(metrics_router)
 
     app.include_router(user_public_router)
     app.include_router(protected_user_router)
@@ -47,6 +75,8 @@ def create_app() -> FastAPI:
     app.include_router(public_services_router)
     app.include_router(services_router)
 
+    # Registrado antes de /appointments/{id} para não ser capturado por ele.
+    app.include_router(protected_availability_router)
     app.include_router(appointments_user_router)
     app.include_router(appointments_admin_router)
 
@@ -0,0 +1,271 @@
+"""
+Grade densa de vagas por admin mantida em memória.
+
+Cada admin tem um ``array`` de inteiros com as vagas restantes de cada dia
+da janela ``[hoje, hoje + horizonte)``. A grade é preenchida pela consulta
+de disponibilidade e recalculada de forma incremental: commits que tocam
+agendamentos, capacidade semanal ou overrides diários marcam apenas os
+dias afetados como sujos, e a próxima leitura recarrega somente esse
+trecho em uma única consulta.
+"""
+
+import asyncio
+import time
+from array import array
+from collections.abc import Iterable
+from datetime import UTC, date, datetime, timedelta
+from uuid import UUID
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from core.settings import get_settings
+from enums import FutureDateFilter, UserRole
+from models import (
+    AdminDailyOverrideModel,
+    AdminWeeklyCapacityModel,
+    AppointmentModel,
+    UserModel,
+)
+from repositories.interfaces.availability_interface import (
+    IAvailabilityRepository,
+)
+from schemas.availability_schema import AdminDayAvailability
+from utils import FUTURE_DATE_FILTERS
+
+settings = get_settings()
+
+AVAILABILITY_HORIZON_DAYS = FUTURE_DATE_FILTERS[
+    FutureDateFilter.NEXT_90_DAYS
+].days
+
+_SESSION_CHANGES_KEY = "availability_changes"
+_ROSTER = object()
+
+
+def _today() -> date:
+    return datetime.now(UTC).date()
+
+
+class AvailabilityGrid:
+    def __init__(self, horizon_days: int, ttl_seconds: float):
+        self.horizon_days = horizon_days
+        self.ttl_seconds = ttl_seconds
+        self._anchor: date | None = None
+        self._rows: dict[UUID, array] = {}
+        self._loaded_at: dict[UUID, float] = {}
+        self._dirty: dict[UUID, set[int]] = {}
+        self._roster_loaded_at: float | None = None
+        self._lock = asyncio.Lock()
+
+    def covers(self, start: date, end: date) -> bool:
+        today = _today()
+        return start >= today and end < today + timedelta(
+            days=self.horizon_days
+        )
+
+    def invalidate(self, admin_id: UUID, day: date | None = None) -> None:
+        """Marca um dia (ou o admin inteiro) para recarga."""
+        if day is None:
+            self._loaded_at.pop(admin_id, None)
+            return
+        if self._anchor is None or admin_id not in self._rows:
+            return
+        offset = (day - self._anchor).days
+        if 0 <= offset < self.horizon_days:
+            self._dirty.setdefault(admin_id, set()).add(offset)
+
+    def invalidate_roster(self) -> None:
+        self._roster_loaded_at = None
+
+    async def get(
+        self,
+        repository: IAvailabilityRepository,
+        start: date,
+        end: date,
+        admin_id: UUID | None = None,
+    ) -> dict[UUID, list[int]]:
+        if self._needs_refresh(admin_id):
+            async with self._lock:
+                if self._needs_refresh(admin_id):
+                    await self._refresh(repository, admin_id)
+
+        low = (start - self._anchor).days
+        high = (end - self._anchor).days + 1
+        admin_ids = [admin_id] if admin_id is not None else self._rows
+        return {
+            id: self._rows[id][low:high].tolist()
+            for id in admin_ids
+            if id in self._rows
+        }
+
+    def _stale(self, admin_id: UUID, now: float) -> bool:
+        loaded_at = self._loaded_at.get(admin_id)
+        return loaded_at is None or now - loaded_at > self.ttl_seconds
+
+    def _needs_refresh(self, admin_id: UUID | None) -> bool:
+        if self._anchor != _today():
+            return True
+        now = time.monotonic()
+        if admin_id is None:
+            if (
+                self._roster_loaded_at is None
+                or now - self._roster_loaded_at > self.ttl_seconds
+            ):
+                return True
+            admin_ids = self._rows
+        else:
+            admin_ids = [admin_id]
+        return any(
+            self._stale(id, now) or self._dirty.get(id) for id in admin_ids
+        )
+
+    async def _refresh(
+        self,
+        repository: IAvailabilityRepository,
+        admin_id: UUID | None,
+    ) -> None:
+        today = _today()
+        if self._anchor != today:
+            self._anchor = today
+            self._rows.clear()
+            self._loaded_at.clear()
+            self._dirty.clear()
+            self._roster_loaded_at = None
+
+        now = time.monotonic()
+        last_day = self._anchor + timedelta(days=self.horizon_days - 1)
+
+        if admin_id is None and (
+            self._roster_loaded_at is None
+            or now - self._roster_loaded_at > self.ttl_seconds
+        ):
+            pending = {id: set(offsets) for id, offsets in self._dirty.items()}
+            rows = await repository.get_range(self._anchor, last_day)
+            self._rows.clear()
+            self._store(rows, now)
+            self._clear_dirty(pending)
+            self._roster_loaded_at = now
+            return
+
+        admin_ids = list(self._rows) if admin_id is None else [admin_id]
+        full = [id for id in admin_ids if self._stale(id, now)]
+        partial = {
+            id: set(self._dirty[id])
+            for id in admin_ids
+            if id not in full and self._dirty.get(id)
+        }
+
+        if full:
+            pending = {id: set(self._dirty.get(id, ())) for id in full}
+            rows = await repository.get_range(self._anchor, last_day, full)
+            self._store(rows, now)
+            # Um id sem linhas (desconhecido ou que não é admin) também
+            # fica carregado até o TTL; senão toda leitura repetiria a
+            # consulta do horizonte inteiro sob o lock.
+            self._loaded_at.update(dict.fromkeys(full, now))
+            self._clear_dirty(pending)
+
+        if partial:
+            low = min(min(offsets) for offsets in partial.values())
+            high = max(max(offsets) for offsets in partial.values())
+            rows = await repository.get_range(
+                self._anchor + timedelta(days=low),
+                self._anchor + timedelta(days=high),
+                list(partial),
+            )
+            self._store(rows)
+            self._clear_dirty(partial)
+
+    def _store(
+        self,
+        rows: list[AdminDayAvailability],
+        loaded_at: float | None = None,
+    ) -> None:
+        for row in rows:
+            grid_row = self._rows.get(row.admin_id)
+            if grid_row is None:
+                grid_row = array("i", [0]) * self.horizon_days
+                self._rows[row.admin_id] = grid_row
+            grid_row[(row.date - self._anchor).days] = row.remaining
+            if loaded_at is not None:
+                self._loaded_at[row.admin_id] = loaded_at
+
+    def _clear_dirty(self, pending: dict[UUID, set[int]]) -> None:
+        for admin_id, offsets in pending.items():
+            remaining = self._dirty.get(admin_id)
+            if remaining is None:
+                continue
+            remaining -= offsets
+            if not remaining:
+                del self._dirty[admin_id]
+
+
+availability_grid = AvailabilityGrid(
+    horizon_days=AVAILABILITY_HORIZON_DAYS,
+    ttl_seconds=settings.AVAILABILITY_GRID_TTL_SECONDS,
+)
+
+
+def _history_values(obj, attribute: str) -> set:
+    history = inspect(obj).attrs[attribute].history
+    return {
+        value
+        for value in (*history.deleted, *history.unchanged, *history.added)
+        if value is not None
+    }
+
+
+def _collect_changes(obj) -> set:
+    if isinstance(obj, AppointmentModel):
+        return {
+            (admin_id, day)
+            for admin_id in _history_values(obj, "admin_id")
+            for day in _history_values(obj, "date")
+        }
+    if isinstance(obj, AdminWeeklyCapacityModel):
+        return {
+            (admin_id, None) for admin_id in _history_values(obj, "admin_id")
+        }
+    if isinstance(obj, AdminDailyOverrideModel):
+        return {
+            (admin_id, day)
+            for admin_id in _history_values(obj, "admin_id")
+            for day in _history_values(obj, "date_modified")
+        }
+    if isinstance(obj, UserModel) and UserRole.ADMIN in _history_values(
+        obj, "role"
+    ):
+        return {_ROSTER}
+    return set()
+
+
+def track_availability_changes(
+    session: Session, changes: Iterable[tuple[UUID, date]]
+) -> None:
+    """
+    Registra os (admin, dia) tocados por um UPDATE em massa, que não passa
+    pelo flush do ORM. São invalidados no commit, como os demais.
+    """
+    session.info.setdefault(_SESSION_CHANGES_KEY, set()).update(changes)
+
+
+@event.listens_for(Session, "after_flush")
+def _track_availability_changes(session: Session, flush_context) -> None:
+    changes = session.info.setdefault(_SESSION_CHANGES_KEY, set())
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        changes |= _collect_changes(obj)
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_availability_changes(session: Session) -> None:
+    for change in session.info.pop(_SESSION_CHANGES_KEY, ()):
+        if change is _ROSTER:
+            availability_grid.invalidate_roster()
+        else:
+            availability_grid.invalidate(*change)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_availability_changes(session: Session) -> None:
+    session.info.pop(_SESSION_CHANGES_KEY, None)
@@ -0,0 +1,166 @@
+"""
+Cache dos documentos OIDC do provedor (discovery e JWKS).
+
+Três camadas, todas com o mesmo TTL contado a partir do download: memória
+do worker, Redis (opcional, compartilhado entre workers) e um diretório
+em disco (opcional, sobrevive a restarts do container). Um worker novo
+encontra o documento em uma das camadas compartilhadas e não precisa ir
+ao provedor. Falhas no Redis ou no disco só são logadas: o documento é
+baixado de novo.
+
+Cada entrada guarda o momento do download, para que uma cópia lida do
+Redis ou do disco expire junto com a original.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from redis.exceptions import RedisError
+
+from core.cache.ttl_cache import TTLCache
+from core.redis import get_redis
+from core.settings import get_settings
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+MAX_DOCUMENTS = 16
+
+Fetch = Callable[[], Awaitable[dict]]
+
+
+class OIDCDocumentCache:
+    def __init__(
+        self,
+        ttl_seconds: int,
+        redis_enabled: bool = False,
+        directory: str | None = None,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.redis_enabled = redis_enabled
+        self.directory = Path(directory) if directory else None
+        self._entries: TTLCache[str, dict] = TTLCache(
+            MAX_DOCUMENTS, ttl_seconds
+        )
+        self._locks: dict[str, asyncio.Lock] = {}
+
+    async def get(self, url: str, fetch: Fetch, force: bool = False) -> dict:
+        """
+        Documento de ``url``, baixado com ``fetch`` quando nenhuma camada
+        tem uma cópia válida. ``force`` ignora as cópias anteriores ao
+        pedido (por exemplo, JWKS sem a chave que assinou o token, depois
+        de uma rotação).
+        """
+        requested_at = time.time()
+        entry = self._entries.get(url)
+        if entry is not None and not force:
+            return entry["document"]
+
+        lock = self._locks.setdefault(url, asyncio.Lock())
+        async with lock:
+            # Depois da espera, aproveita o download de quem segurava o
+            # lock ou de outro worker.
+            entry = self._entries.get(url) or await self._load_shared(url)
+            if entry is None or (force and entry["fetched_at"] < requested_at):
+                # O horário é marcado ao fim do download: pedidos forçados
+                # que chegaram durante ele já são atendidos pela cópia nova.
+                document = await fetch()
+                entry = {"fetched_at": time.time(), "document": document}
+                await self._store_shared(url, entry)
+            self._remember(url, entry)
+            return entry["document"]
+
+    def _remember(self, url: str, entry: dict) -> None:
+        age = time.time() - entry["fetched_at"]
+        self._entries.set(url, entry, self.ttl_seconds - age)
+
+    def _is_fresh(self, entry: dict | None) -> bool:
+        return (
+            entry is not None
+            and time.time() - entry["fetched_at"] < self.ttl_seconds
+        )
+
+    async def _load_shared(self, url: str) -> dict | None:
+        entry = await self._load_redis(url)
+        if self._is_fresh(entry):
+            return entry
+        entry = self._load_disk(url)
+        if self._is_fresh(entry):
+            if self.redis_enabled:
+                await self._store_redis(url, entry)
+            return entry
+        return None
+
+    async def _store_shared(self, url: str, entry: dict) -> None:
+        await self._store_redis(url, entry)
+        self._store_disk(url, entry)
+
+    async def _load_redis(self, url: str) -> dict | None:
+        if not self.redis_enabled:
+            return None
+        try:
+            raw = await get_redis().get(self._key(url))
+        except RedisError as exc:
+            logger.warning(f"OIDC cache read failed: {exc}")
+            return None
+        return json.loads(raw) if raw is not None else None
+
+    async def _store_redis(self, url: str, entry: dict) -> None:
+        if not self.redis_enabled:
+            return
+        ttl = int(self.ttl_seconds - (time.time() - entry["fetched_at"]))
+        if ttl <= 0:
+            return
+        try:
+            await get_redis().set(self._key(url), json.dumps(entry), ex=ttl)
+        except RedisError as exc:
+            logger.warning(f"OIDC cache write failed: {exc}")
+
+    def _load_disk(self, url: str) -> dict | None:
+        if self.directory is None:
+            return None
+        try:
+            return json.loads(self._path(url).read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as exc:
+            logger.warning(f"OIDC cache read failed: {exc}")
+            return None
+
+    def _store_disk(self, url: str, entry: dict) -> None:
+        if self.directory is None:
+            return
+        path = self._path(url)
+        # Grava em um arquivo temporário e troca de uma vez, para que
+        # outro processo nunca leia um JSON pela metade.
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temporary.write_text(json.dumps(entry), encoding="utf-8")
+            temporary.replace(path)
+        except OSError as exc:
+            logger.warning(f"OIDC cache write failed: {exc}")
+
+    @staticmethod
+    def _digest(url: str) -> str:
+        return hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+
+    def _key(self, url: str) -> str:
+        return f"{settings.APP_NAME}:oidc:{self._digest(url)}"
+
+    def _path(self, url: str) -> Path:
+        return self.directory / f"oidc-{self._digest(url)}.json"
+
+
+oidc_cache = OIDCDocumentCache(
+    ttl_seconds=settings.GOOGLE_OIDC_CACHE_TTL_SECONDS,
+    redis_enabled=settings.GOOGLE_OIDC_CACHE_REDIS_ENABLED,
+    directory=settings.GOOGLE_OIDC_CACHE_DIR,
+)
@@ -0,0 +1,181 @@
+"""
+Catálogo de serviços mantido em memória por worker.
+
+O catálogo inteiro (poucas dezenas de linhas) é carregado de uma vez e
+identificado por uma versão. ``ServicesService`` incrementa a versão a
+cada escrita: localmente o snapshot é descartado na hora e, com Redis
+habilitado, os demais workers percebem a nova versão na próxima
+verificação. Sem Redis, o TTL limita a defasagem entre workers.
+
+Cada snapshot é serializado para JSON uma única vez, na carga: a
+listagem responde com esses bytes prontos. A impressão digital é o hash
+desse JSON, igual em todos os workers que carregaram os mesmos dados, e
+serve de base para os ETags de serviços e agendamentos.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections.abc import Iterable
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from core.redis import get_redis
+from core.settings import get_settings
+from repositories.interfaces.services_interface import IServiceRepository
+from schemas.services_schema import ServiceRead, service_list_adapter
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+class ServiceCatalog:
+    def __init__(
+        self,
+        ttl_seconds: float,
+        version_check_seconds: float,
+        redis_enabled: bool = False,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self.redis_enabled = redis_enabled
+        self._services: dict[UUID, ServiceRead] | None = None
+        self._json = b"[]"
+        self._fingerprint = ""
+        self._version: int | None = None
+        # Incrementada a cada ``bump``: uma carga que começou antes dele
+        # leu linhas possivelmente anteriores à escrita.
+        self._generation = 0
+        self._loaded_at = 0.0
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def get_all(
+        self, repository: IServiceRepository
+    ) -> list[ServiceRead]:
+        """Serviços na ordem de criação."""
+        return list((await self._snapshot(repository)).values())
+
+    async def get_all_json(self, repository: IServiceRepository) -> bytes:
+        """A mesma lista de ``get_all``, já serializada."""
+        await self._snapshot(repository)
+        return self._json
+
+    async def resolve(
+        self, repository: IServiceRepository, ids: Iterable[UUID]
+    ) -> dict[UUID, ServiceRead]:
+        """
+        Retorna os serviços pedidos que existem. Um id ausente recarrega
+        o catálogo, para cobrir serviços criados em outro worker ainda não
+        vistos por este, no máximo uma vez a cada
+        ``version_check_seconds``: ids inexistentes repetidos não viram
+        uma recarga por requisição.
+        """
+        ids = set(ids)
+        services = await self._snapshot(repository)
+        if not ids <= services.keys():
+            services = await self._reload_missing(repository, ids)
+        return {id: services[id] for id in ids if id in services}
+
+    async def fingerprint(self, repository: IServiceRepository) -> str:
+        """Impressão digital do snapshot vigente."""
+        await self._snapshot(repository)
+        return self._fingerprint
+
+    async def bump(self) -> None:
+        """Invalida o catálogo neste worker e, via Redis, nos demais."""
+        self._generation += 1
+        self._services = None
+        if not self.redis_enabled:
+            return
+        try:
+            await get_redis().incr(self._redis_key())
+        except RedisError as exc:
+            logger.warning(f"Service catalog version bump failed: {exc}")
+
+    async def _snapshot(
+        self, repository: IServiceRepository
+    ) -> dict[UUID, ServiceRead]:
+        if await self._is_fresh():
+            return self._services
+        async with self._lock:
+            if not await self._is_fresh():
+                await self._load(repository)
+        return self._services
+
+    async def _reload_missing(
+        self, repository: IServiceRepository, ids: set[UUID]
+    ) -> dict[UUID, ServiceRead]:
+        # O snapshot atual continua atendendo as demais leituras durante a
+        # recarga. Depois da espera pelo lock, outro pedido pode já ter
+        # recarregado o catálogo.
+        async with self._lock:
+            services = self._services
+            if services is None or (
+                not ids <= services.keys()
+                and time.monotonic() - self._loaded_at
+                >= self.version_check_seconds
+            ):
+                await self._load(repository)
+        return self._services
+
+    async def _is_fresh(self) -> bool:
+        if self._services is None:
+            return False
+        now = time.monotonic()
+        if now - self._loaded_at > self.ttl_seconds:
+            return False
+        if (
+            not self.redis_enabled
+            or now - self._checked_at < self.version_check_seconds
+        ):
+            return True
+        self._checked_at = now
+        if await self._remote_version() != self._version:
+            self._services = None
+            return False
+        return True
+
+    async def _load(self, repository: IServiceRepository) -> None:
+        # A versão é lida antes das linhas: se uma escrita acontecer no
+        # meio, o snapshot fica com a versão antiga e é recarregado. Uma
+        # escrita deste worker durante a carga (``bump`` não espera o
+        # lock) descarta as linhas lidas, e a carga é refeita.
+        while True:
+            generation = self._generation
+            version = await self._remote_version()
+            rows = await repository.get_all()
+            if generation == self._generation:
+                break
+        services = {row.id: ServiceRead.model_validate(row) for row in rows}
+        self._services = services
+        self._json = service_list_adapter.dump_json(list(services.values()))
+        self._fingerprint = hashlib.blake2b(
+            self._json, digest_size=16
+        ).hexdigest()
+        self._version = version
+        self._loaded_at = self._checked_at = time.monotonic()
+
+    async def _remote_version(self) -> int | None:
+        if not self.redis_enabled:
+            return None
+        try:
+            version = await get_redis().get(self._redis_key())
+        except RedisError as exc:
+            logger.warning(f"Service catalog version check failed: {exc}")
+            return self._version
+        return int(version) if version is not None else 0
+
+    @staticmethod
+    def _redis_key() -> str:
+        return f"{settings.APP_NAME}:service_catalog:version"
+
+
+service_catalog = ServiceCatalog(
+    ttl_seconds=settings.SERVICE_CATALOG_TTL_SECONDS,
+    version_check_seconds=settings.SERVICE_CATALOG_VERSION_CHECK_SECONDS,
+    redis_enabled=settings.SERVICE_CATALOG_REDIS_ENABLED,
+)
@@ -0,0 +1,103 @@
+"""
+Cache do usuário autenticado.
+
+Duas camadas: um LRU com TTL em memória por worker e, opcionalmente, o
+Redis compartilhado entre workers. O token decodificado é guardado à
+parte (token -> id do usuário) até a expiração do próprio JWT, e o
+snapshot do usuário (``CurrentUser``) é guardado por id, para que uma
+atualização ou remoção invalide todos os tokens daquele usuário de uma
+vez.
+"""
+
+import logging
+import time
+from uuid import UUID
+
+from pydantic import ValidationError
+from redis.exceptions import RedisError
+
+from core.cache.ttl_cache import TTLCache
+from core.redis import get_redis
+from core.settings import get_settings
+from schemas.user_schema import CurrentUser
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+class UserCache:
+    def __init__(
+        self,
+        max_entries: int,
+        ttl_seconds: int,
+        redis_enabled: bool = False,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.redis_enabled = redis_enabled
+        self._tokens: TTLCache[str, UUID] = TTLCache(max_entries, ttl_seconds)
+        self._users: TTLCache[UUID, CurrentUser] = TTLCache(
+            max_entries, ttl_seconds
+        )
+
+    def get_token_subject(self, token: str) -> UUID | None:
+        return self._tokens.get(token)
+
+    def set_token_subject(
+        self, token: str, user_id: UUID, expires_at: float
+    ) -> None:
+        """Guarda o id do token até o ``exp`` do JWT (epoch em segundos)."""
+        self._tokens.set(token, user_id, expires_at - time.time())
+
+    async def get(self, user_id: UUID) -> CurrentUser | None:
+        user = self._users.get(user_id)
+        if user is not None or not self.redis_enabled:
+            return user
+
+        try:
+            raw = await get_redis().get(self._redis_key(user_id))
+        except RedisError as exc:
+            logger.warning(f"Current user cache read failed: {exc}")
+            return None
+        if raw is None:
+            return None
+
+        try:
+            user = CurrentUser.model_validate_json(raw)
+        except ValidationError:
+            return None
+        self._users.set(user_id, user)
+        return user
+
+    async def set(self, user: CurrentUser) -> None:
+        self._users.set(user.id, user)
+        if not self.redis_enabled:
+            return
+        try:
+            await get_redis().set(
+                self._redis_key(user.id),
+                user.model_dump_json(),
+                ex=self.ttl_seconds,
+            )
+        except RedisError as exc:
+            logger.warning(f"Current user cache write failed: {exc}")
+
+    async def invalidate(self, user_id: UUID) -> None:
+        self._users.delete(user_id)
+        if not self.redis_enabled:
+            return
+        try:
+            await get_redis().delete(self._redis_key(user_id))
+        except RedisError as exc:
+            logger.warning(f"Current user cache invalidation failed: {exc}")
+
+    @staticmethod
+    def _redis_key(user_id: UUID) -> str:
+        return f"{settings.APP_NAME}:current_user:{user_id}"
+
+
+user_cache = UserCache(
+    max_entries=settings.USER_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.USER_CACHE_TTL_SECONDS,
+    redis_enabled=settings.USER_CACHE_REDIS_ENABLED,
+)
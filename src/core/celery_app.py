@@ -0,0 +1,48 @@
+"""
+Aplicação Celery usada pelos workers.
+
+Uso:
+    celery --workdir src -A core.celery_app worker --beat --loglevel=info
+"""
+
+from celery import Celery
+
+from core.settings import get_settings
+
+settings = get_settings()
+
+celery_app = Celery(
+    settings.APP_NAME,
+    broker=settings.REDIS_URL,
+    include=[
+        "tasks.email_tasks",
+        "tasks.appointment_series_tasks",
+        "tasks.idempotency_tasks",
+    ],
+)
+celery_app.conf.update(
+    task_ignore_result=True,
+    broker_connection_retry_on_startup=True,
+    beat_schedule={
+        "drain-email-outbox": {
+            "task": "tasks.email_tasks.drain_email_outbox",
+            "schedule": settings.EMAIL_OUTBOX_POLL_SECONDS,
+            # Um tick atrasado é redundante com o próximo.
+            "options": {"expires": settings.EMAIL_OUTBOX_POLL_SECONDS},
+        },
+        "materialize-appointment-series": {
+            "task": (
+                "tasks.appointment_series_tasks.materialize_appointment_series"
+            ),
+            "schedule": settings.APPOINTMENT_SERIES_MATERIALIZE_SECONDS,
+            "options": {
+                "expires": settings.APPOINTMENT_SERIES_MATERIALIZE_SECONDS
+            },
+        },
+        "purge-idempotency-keys": {
+            "task": "tasks.idempotency_tasks.purge_idempotency_keys",
+            "schedule": settings.IDEMPOTENCY_PURGE_SECONDS,
+            "options": {"expires": settings.IDEMPOTENCY_PURGE_SECONDS},
+        },
+    },
+)
@@ -1,10 +1,35 @@
 from typing import AsyncGenerator
 
+from fastapi import Request
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.db.session import AsyncSessionLocal
+from core.db.read_your_writes import read_your_writes
+from core.db.session import (
+    AsyncSessionLocal,
+    ReplicaSessionLocal,
+    replica_engine,
+)
 
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with AsyncSessionLocal() as session:
         yield session
+
+
+async def get_read_session(
+    request: Request,
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Sessão para dependências só de leitura: usa a réplica, exceto quando
+    o usuário autenticado escreveu há pouco (read-your-writes). O usuário
+    é registrado em ``request.state`` por ``get_current_user``, que as
+    rotas protegidas resolvem antes das demais dependências.
+    """
+    session_factory = AsyncSessionLocal
+    if replica_engine is not None:
+        user_id = getattr(request.state, "current_user_id", None)
+        if user_id is None or not await read_your_writes.is_pinned(user_id):
+            session_factory = ReplicaSessionLocal
+
+    async with session_factory() as session:
+        yield session
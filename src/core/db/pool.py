@@ -0,0 +1,54 @@
+import time
+
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from core.metrics import (
+    db_pool_checked_out,
+    db_pool_checkout_timeouts,
+    db_pool_checkout_wait,
+    db_pool_overflow,
+)
+
+
+class InstrumentedAsyncQueuePool(AsyncAdaptedQueuePool):
+    """
+    Pool padrão do engine async, medindo a espera de cada checkout e
+    publicando conexões em uso e overflow a cada checkout/checkin.
+
+    As métricas levam o rótulo ``pool`` com ``metrics_label``. É um
+    atributo de classe porque ``engine.dispose()`` recria o pool a partir
+    da classe, sem copiar atributos da instância.
+    """
+
+    metrics_label = "primary"
+
+    def _do_get(self):
+        started_at = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except PoolTimeoutError:
+            db_pool_checkout_timeouts.labels(self.metrics_label).inc()
+            raise
+        finally:
+            db_pool_checkout_wait.labels(self.metrics_label).observe(
+                time.perf_counter() - started_at
+            )
+        self._report()
+        return connection
+
+    def _do_return_conn(self, record) -> None:
+        super()._do_return_conn(record)
+        self._report()
+
+    def _report(self) -> None:
+        db_pool_checked_out.labels(self.metrics_label).set(self.checkedout())
+        db_pool_overflow.labels(self.metrics_label).set(
+            max(self.overflow(), 0)
+        )
+
+
+class InstrumentedReplicaQueuePool(InstrumentedAsyncQueuePool):
+    """O mesmo pool, publicado com ``pool="replica"``."""
+
+    metrics_label = "replica"
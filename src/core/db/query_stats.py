@@ -0,0 +1,89 @@
+"""
+Contagem de statements SQL por requisição.
+
+Os eventos do engine acumulam quantidade, tempo e formato de cada
+statement no ``QueryStats`` do ContextVar corrente, aberto pelo
+``QueryStatsMiddleware`` a cada requisição. Fora de uma requisição
+(worker, scripts) nada é contado.
+"""
+
+import re
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+# Listas de parâmetros expandidas (IN, VALUES de várias linhas) viram um
+# único marcador: a mesma consulta com N ids conta como um só formato.
+_PARAM_LIST = re.compile(r"\$\d+(?:::\w+)?(?:\s*,\s*\$\d+(?:::\w+)?)*")
+_STARTED_AT_KEY = "query_stats_started_at"
+
+
+class QueryBudgetExceededError(AssertionError):
+    """
+    Rota acima do orçamento de statements. Só é levantada com
+    SQL_BUDGET_RAISE, para que a falha apareça nos testes.
+    """
+
+
+@dataclass
+class QueryStats:
+    count: int = 0
+    duration: float = 0.0
+    shapes: Counter[str] = field(default_factory=Counter)
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.duration += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def most_repeated(self) -> tuple[str, int]:
+        """Formato mais repetido e quantas vezes apareceu."""
+        if not self.shapes:
+            return "", 0
+        return self.shapes.most_common(1)[0]
+
+
+current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def statement_shape(statement: str) -> str:
+    return " ".join(_PARAM_LIST.sub("?", statement).split())
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """Registra os eventos de contagem no engine (uma única vez)."""
+    sync_engine = engine.sync_engine
+    if event.contains(
+        sync_engine, "before_cursor_execute", _before_cursor_execute
+    ):
+        return
+    event.listen(
+        sync_engine,
+        "before_cursor_execute",
+        _before_cursor_execute,
+        named=True,
+    )
+    event.listen(
+        sync_engine,
+        "after_cursor_execute",
+        _after_cursor_execute,
+        named=True,
+    )
+
+
+def _before_cursor_execute(conn, **kw) -> None:
+    if current_query_stats.get() is not None:
+        conn.info[_STARTED_AT_KEY] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, statement, **kw) -> None:
+    stats = current_query_stats.get()
+    started_at = conn.info.pop(_STARTED_AT_KEY, None)
+    if stats is not None and started_at is not None:
+        stats.record(statement, time.perf_counter() - started_at)
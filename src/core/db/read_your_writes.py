@@ -0,0 +1,72 @@
+"""
+Janela de read-your-writes por usuário.
+
+Depois de uma escrita bem-sucedida, o usuário fica "fixado" no primário
+por alguns segundos, para que a leitura seguinte não venha de uma réplica
+que ainda não recebeu a alteração. A marca fica em memória no worker e,
+opcionalmente, no Redis, para valer em todos os workers.
+"""
+
+import logging
+from uuid import UUID
+
+from redis.exceptions import RedisError
+
+from core.cache.ttl_cache import TTLCache
+from core.redis import get_redis
+from core.settings import get_settings
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+_MAX_PINNED_USERS = 10_000
+
+
+class ReadYourWrites:
+    def __init__(self, window_seconds: float, redis_enabled: bool = False):
+        self.window_seconds = window_seconds
+        self.redis_enabled = redis_enabled
+        self._pinned: TTLCache[UUID, bool] = TTLCache(
+            _MAX_PINNED_USERS, window_seconds
+        )
+
+    async def pin(self, user_id: UUID) -> None:
+        """Fixa o usuário no primário pela duração da janela."""
+        if self.window_seconds <= 0:
+            return
+        self._pinned.set(user_id, True)
+        if not self.redis_enabled:
+            return
+        try:
+            await get_redis().set(
+                self._redis_key(user_id),
+                1,
+                px=int(self.window_seconds * 1000),
+            )
+        except RedisError as exc:
+            logger.warning(f"Read-your-writes pin failed: {exc}")
+
+    async def is_pinned(self, user_id: UUID) -> bool:
+        if self.window_seconds <= 0:
+            return False
+        if self._pinned.get(user_id):
+            return True
+        if not self.redis_enabled:
+            return False
+        try:
+            return bool(await get_redis().exists(self._redis_key(user_id)))
+        except RedisError as exc:
+            # Na dúvida, lê do primário.
+            logger.warning(f"Read-your-writes check failed: {exc}")
+            return True
+
+    @staticmethod
+    def _redis_key(user_id: UUID) -> str:
+        return f"{settings.APP_NAME}:read_your_writes:{user_id}"
+
+
+read_your_writes = ReadYourWrites(
+    window_seconds=settings.DB_READ_YOUR_WRITES_SECONDS,
+    redis_enabled=settings.DB_READ_YOUR_WRITES_REDIS_ENABLED,
+)
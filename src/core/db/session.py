@@ -4,17 +4,72 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 
+from core.db.pool import (
+    InstrumentedAsyncQueuePool,
+    InstrumentedReplicaQueuePool,
+)
 from core.settings import get_settings
 
 settings = get_settings()
 
 
+def connect_args() -> dict:
+    """
+    Argumentos de conexão do asyncpg: caches de prepared statements (do
+    asyncpg e do adaptador do SQLAlchemy) e timeouts aplicados pelo
+    servidor em cada sessão.
+    """
+    return {
+        "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+        "server_settings": {
+            "statement_timeout": str(settings.DB_STATEMENT_TIMEOUT_MS),
+            "idle_in_transaction_session_timeout": str(
+                settings.DB_IDLE_IN_TRANSACTION_TIMEOUT_MS
+            ),
+        },
+    }
+
+
 engine = create_async_engine(
     settings.ASYNC_DATABASE_URL,
-    echo=settings.DEBUG,
+    echo=settings.DB_ECHO,
     future=True,
+    poolclass=InstrumentedAsyncQueuePool,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_pre_ping=settings.DB_POOL_PRE_PING,
+    connect_args=connect_args(),
 )
 
 AsyncSessionLocal = async_sessionmaker(
     bind=engine, class_=AsyncSession, expire_on_commit=False
 )
+
+# Réplica opcional para leituras; sem ela, as leituras usam o primário.
+# As transações na réplica são somente leitura, então uma escrita por
+# engano falha mesmo que a URL aponte para o primário.
+replica_engine = (
+    create_async_engine(
+        settings.DB_REPLICA_URL,
+        echo=settings.DB_ECHO,
+        poolclass=InstrumentedReplicaQueuePool,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args(),
+        execution_options={"postgresql_readonly": True},
+    )
+    if settings.DB_REPLICA_URL
+    else None
+)
+
+ReplicaSessionLocal = async_sessionmaker(
+    bind=replica_engine or engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
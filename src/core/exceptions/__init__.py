@@ -9,11 +9,22 @@ from core.exceptions.appointment_exception import (
     AppointmentAlreadyAcceptedException,
     AppointmentAlreadyExistsException,
     AppointmentNotFoundException,
+    AppointmentSeriesNotFoundException,
     AppointmentsNotFoundException,
+    AppointmentVersionConflictException,
     InvalidAppointmentDataException,
     InvalidAppointmentStateException,
 )
+from core.exceptions.availability_exception import (
+    InvalidAvailabilityRangeException,
+)
 from core.exceptions.base_exception import BaseAppException
+from core.exceptions.idempotency_exception import (
+    IdempotencyKeyInProgressException,
+    IdempotencyKeyMismatchException,
+)
+from core.exceptions.pagination_exception import InvalidCursorException
+from core.exceptions.security_exception import PasswordHashingBusyException
 from core.exceptions.services_exception import (
     InvalidServiceDataException,
     ServiceAlreadyExistsException,
@@ -40,10 +51,17 @@ __all__ = [
     "AppointmentNotFoundException",
     "AppointmentAlreadyExistsException",
     "AppointmentsNotFoundException",
+    "AppointmentSeriesNotFoundException",
+    "AppointmentVersionConflictException",
     "InvalidAppointmentDataException",
     "AppointmentAlreadyAcceptedException",
     "AdminNotAvailableException",
     "InvalidAppointmentStateException",
     "AdminDailyLimitNotFoundException",
     "AdminDailyLimitAlreadyExistsException",
+    "InvalidAvailabilityRangeException",
+    "InvalidCursorException",
+    "PasswordHashingBusyException",
+    "IdempotencyKeyMismatchException",
+    "IdempotencyKeyInProgressException",
 ]
@@ -79,3 +79,27 @@ class InvalidAppointmentStateException(BaseAppException):
             status_code=400,
             detail=detail or "The appointment state is invalid",
         )
+
+
+class AppointmentSeriesNotFoundException(BaseAppException):
+    """Exception raised when an appointment series is not found."""
+
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Appointment series not found",
+            status_code=404,
+            detail=detail or "The requested appointment series does not exist",
+        )
+
+
+class AppointmentVersionConflictException(BaseAppException):
+    """Exception raised when an appointment changed since it was read."""
+
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Appointment was modified",
+            status_code=412,
+            detail=detail
+            or "The appointment was modified by another request; "
+            "fetch it again and retry",
+        )
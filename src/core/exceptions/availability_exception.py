@@ -0,0 +1,12 @@
+from core.exceptions.base_exception import BaseAppException
+
+
+class InvalidAvailabilityRangeException(BaseAppException):
+    """Exception raised when an availability date range is invalid."""
+
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Invalid availability range",
+            status_code=400,
+            detail=detail or "The requested availability range is invalid",
+        )
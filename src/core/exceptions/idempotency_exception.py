@@ -0,0 +1,25 @@
+from core.exceptions.base_exception import BaseAppException
+
+
+class IdempotencyKeyMismatchException(BaseAppException):
+    """Exception raised when an idempotency key is reused elsewhere."""
+
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Idempotency key mismatch",
+            status_code=422,
+            detail=detail
+            or "This Idempotency-Key was already used for a different request",
+        )
+
+
+class IdempotencyKeyInProgressException(BaseAppException):
+    """Exception raised when the request for a key has not finished."""
+
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Request in progress",
+            status_code=409,
+            detail=detail
+            or "A request with this Idempotency-Key is still in progress",
+        )
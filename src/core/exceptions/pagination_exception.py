@@ -0,0 +1,12 @@
+from core.exceptions.base_exception import BaseAppException
+
+
+class InvalidCursorException(BaseAppException):
+    """Exception raised when a pagination cursor cannot be decoded."""
+
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Invalid cursor",
+            status_code=400,
+            detail=detail or "The provided pagination cursor is invalid",
+        )
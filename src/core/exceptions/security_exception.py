@@ -0,0 +1,12 @@
+from core.exceptions.base_exception import BaseAppException
+
+
+class PasswordHashingBusyException(BaseAppException):
+    """Exception raised when the password hashing queue is full."""
+
+    def __init__(self, detail: str | None = None):
+        super().__init__(
+            message="Password hashing busy",
+            status_code=503,
+            detail=detail or "Too many concurrent logins, try again shortly",
+        )
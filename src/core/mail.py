@@ -1,7 +1,19 @@
-import resend
+"""
+Envio de emails pelo Resend.
+
+O SDK do Resend (e o ``requests`` que ele carrega) só é importado no
+primeiro envio real: a API apenas enfileira mensagens no outbox, quem
+envia é o worker do Celery.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING, Protocol
 
 from core.settings import get_settings
 
+if TYPE_CHECKING:
+    import resend
+
 
 def _get_resend_api_key() -> str:
     """Obtém a API key do Resend do ambiente ou das configurações."""
@@ -16,42 +28,56 @@ def _get_resend_api_key() -> str:
     )
 
 
-def _init_resend():
-    """Inicializa a API key do Resend."""
-    try:
-        resend.api_key = _get_resend_api_key()
-    except ValueError:
-        # Não falha na importação, apenas quando tentar enviar
-        pass
+class EmailTransport(Protocol):
+    def send(self, params: "resend.Emails.SendParams") -> dict: ...
 
 
-def send_signup_success_email(to: str, user_name: str):
-    settings = get_settings()
+class ResendTransport:
+    """Envia pela API do Resend."""
 
-    if not settings.RESEND_TEMPLATE_SIGNUP_SUCCESS:
-        raise ValueError("RESEND_TEMPLATE_SIGNUP_SUCCESS não configurado")
+    @staticmethod
+    def send(params: "resend.Emails.SendParams") -> dict:
+        import resend  # noqa: PLC0415
 
-    return send_email(
-        to=to,
-        template_id=settings.RESEND_TEMPLATE_SIGNUP_SUCCESS,
-        template_variables={
-            "USER_NAME": user_name,
-        },
-    )
+        if not resend.api_key:
+            resend.api_key = _get_resend_api_key()
+        return resend.Emails.send(params)
 
 
-def send_email(
+class FakeEmailTransport:
+    """
+    Transporte em memória para testes e desenvolvimento: guarda as
+    mensagens em ``sent`` em vez de chamar o Resend. Atribuir uma exceção
+    a ``fail_with`` faz os próximos envios falharem.
+    """
+
+    def __init__(self):
+        self.sent: list["resend.Emails.SendParams"] = []
+        self.fail_with: Exception | None = None
+
+    def send(self, params: "resend.Emails.SendParams") -> dict:
+        if self.fail_with is not None:
+            raise self.fail_with
+        self.sent.append(params)
+        return {"id": f"fake-{len(self.sent)}"}
+
+
+@lru_cache(maxsize=1)
+def get_email_transport() -> EmailTransport:
+    if get_settings().EMAIL_TRANSPORT == "fake":
+        return FakeEmailTransport()
+    return ResendTransport()
+
+
+def build_send_params(
     to: str,
     subject: str | None = None,
     from_email: str | None = None,
     template_id: str | None = None,
     template_variables: dict | None = None,
-) -> resend.Emails.SendResponse:
-    if not resend.api_key:
-        resend.api_key = _get_resend_api_key()
-
+) -> "resend.Emails.SendParams":
     settings = get_settings()
-    params: resend.Emails.SendParams = {
+    params: "resend.Emails.SendParams" = {
         "from": from_email or settings.RESEND_FROM_EMAIL,
         "to": to,
     }
@@ -64,7 +90,18 @@ def send_email(
         if subject:
             params["subject"] = subject
 
-    return resend.Emails.send(params)
+    return params
 
 
-_init_resend()
+def send_email(
+    to: str,
+    subject: str | None = None,
+    from_email: str | None = None,
+    template_id: str | None = None,
+    template_variables: dict | None = None,
+) -> dict:
+    return get_email_transport().send(
+        build_send_params(
+            to, subject, from_email, template_id, template_variables
+        )
+    )
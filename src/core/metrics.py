@@ -0,0 +1,95 @@
+"""
+Métricas Prometheus da aplicação, expostas em ``/metrics``.
+
+Com vários workers (``uvicorn --workers``, gunicorn), defina
+``PROMETHEUS_MULTIPROC_DIR`` com um diretório vazio antes de subir os
+processos: cada worker grava seus valores em arquivos nesse diretório e
+o worker que atende ``/metrics`` agrega todos. Os gauges por processo
+usam "livesum" (soma dos processos vivos); os calculados no scrape, como
+o atraso do outbox, usam o valor mais recente.
+"""
+
+import os
+
+from prometheus_client import (
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+http_request_duration = Histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP por rota.",
+    ["method", "route", "status"],
+)
+http_requests_in_progress = Gauge(
+    "http_requests_in_progress",
+    "Requisições HTTP em andamento.",
+    ["method"],
+    multiprocess_mode="livesum",
+)
+
+db_pool_checkout_wait = Histogram(
+    "db_pool_checkout_wait_seconds",
+    "Espera por uma conexão do pool do SQLAlchemy.",
+    ["pool"],
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5, 30),
+)
+db_pool_checkout_timeouts = Counter(
+    "db_pool_checkout_timeouts_total",
+    "Checkouts que estouraram o pool_timeout.",
+    ["pool"],
+)
+db_pool_checked_out = Gauge(
+    "db_pool_checked_out_connections",
+    "Conexões do pool em uso.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+db_pool_overflow = Gauge(
+    "db_pool_overflow_connections",
+    "Conexões abertas além de pool_size.",
+    ["pool"],
+    multiprocess_mode="livesum",
+)
+
+password_hash_in_flight = Gauge(
+    "password_hash_in_flight",
+    "Hashes Argon2 em execução.",
+    multiprocess_mode="livesum",
+)
+password_hash_waiting = Gauge(
+    "password_hash_waiting",
+    "Chamadas aguardando uma thread do pool de Argon2.",
+    multiprocess_mode="livesum",
+)
+
+email_outbox_due = Gauge(
+    "email_outbox_due_messages",
+    "Mensagens do outbox prontas para envio.",
+    multiprocess_mode="mostrecent",
+)
+email_outbox_lag = Gauge(
+    "email_outbox_lag_seconds",
+    "Há quanto tempo a mensagem vencida mais antiga aguarda envio.",
+    multiprocess_mode="mostrecent",
+)
+
+appointment_transitions = Counter(
+    "appointment_transitions_total",
+    "Agendamentos que entraram em cada status.",
+    ["status"],
+)
+
+
+def render_metrics() -> bytes:
+    """Exposição no formato texto, agregando os workers se houver."""
+    if "PROMETHEUS_MULTIPROC_DIR" not in os.environ:
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
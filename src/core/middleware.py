@@ -0,0 +1,149 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.db.query_stats import (
+    QueryBudgetExceededError,
+    QueryStats,
+    current_query_stats,
+)
+from core.db.read_your_writes import read_your_writes
+from core.metrics import http_request_duration, http_requests_in_progress
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    """
+    Mede a latência de cada requisição por rota (o template do path, para
+    não explodir a cardinalidade) e as requisições em andamento.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        in_progress = http_requests_in_progress.labels(method)
+        in_progress.inc()
+        started_at = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            in_progress.dec()
+            route = getattr(scope.get("route"), "path", "<unmatched>")
+            http_request_duration.labels(
+                method, route, str(status_code)
+            ).observe(time.perf_counter() - started_at)
+
+
+class ReadYourWritesMiddleware:
+    """
+    Fixa no primário o usuário que acabou de escrever (método não seguro
+    com resposta de sucesso), antes de a resposta chegar ao cliente.
+    """
+
+    SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or scope["method"] in self.SAFE_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message: Message) -> None:
+            if (
+                message["type"] == "http.response.start"
+                and message["status"] < 400  # noqa: PLR2004
+            ):
+                user_id = scope.get("state", {}).get("current_user_id")
+                if user_id is not None:
+                    await read_your_writes.pin(user_id)
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
+
+
+class QueryStatsMiddleware:
+    """
+    Conta os statements SQL e o tempo de banco de cada requisição e os
+    devolve no cabeçalho ``Server-Timing``.
+
+    Uma rota que passa de ``statement_budget`` statements, ou repete o
+    mesmo statement ``repeat_limit`` vezes (sinal de N+1), é logada; com
+    ``raise_on_violation`` a requisição falha com
+    ``QueryBudgetExceededError``.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        statement_budget: int,
+        repeat_limit: int,
+        raise_on_violation: bool = False,
+    ):
+        self.app = app
+        self.statement_budget = statement_budget
+        self.repeat_limit = repeat_limit
+        self.raise_on_violation = raise_on_violation
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+        started_at = time.perf_counter()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                self._check_budget(scope, stats)
+                total = (time.perf_counter() - started_at) * 1000
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} '
+                    f'queries", app;dur={total:.1f}',
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_query_stats.reset(token)
+
+    def _check_budget(self, scope: Scope, stats: QueryStats) -> None:
+        shape, repeats = stats.most_repeated()
+        problems = []
+        if stats.count > self.statement_budget:
+            problems.append(
+                f"{stats.count} statements (budget {self.statement_budget})"
+            )
+        if repeats >= self.repeat_limit:
+            problems.append(f"statement repeated {repeats}x: {shape[:200]}")
+        if not problems:
+            return
+
+        route = scope.get("route")
+        path = getattr(route, "path", scope["path"])
+        message = f"{scope['method']} {path}: {'; '.join(problems)}"
+        if self.raise_on_violation:
+            raise QueryBudgetExceededError(message)
+        logger.warning(f"SQL budget exceeded on {message}")
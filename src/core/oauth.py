@@ -1,16 +1,32 @@
-from authlib.integrations.starlette_client import OAuth
+"""
+Cliente OAuth do Google, criado no primeiro uso.
+
+O authlib (e o httpx que ele carrega) só é importado quando alguém usa o
+login com Google, e não na inicialização de cada worker.
+"""
+
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from core.settings import get_settings
 
-oauth = OAuth()
+if TYPE_CHECKING:
+    from core.oidc_client import CachedOIDCApp
+
 
+@lru_cache(maxsize=1)
+def get_google_oauth() -> "CachedOIDCApp":
+    from authlib.integrations.starlette_client import OAuth  # noqa: PLC0415
 
-settings = get_settings()
+    from core.oidc_client import CachedOIDCApp  # noqa: PLC0415
 
-oauth.register(
-    name="google",
-    client_id=settings.GOOGLE_CLIENT_ID,
-    client_secret=settings.GOOGLE_CLIENT_SECRET.get_secret_value(),
-    server_metadata_url="https://accounts.google.com/.well-known/openid-configuration",
-    client_kwargs={"scope": "openid profile email"},
-)
+    settings = get_settings()
+    oauth = OAuth()
+    return oauth.register(
+        name="google",
+        client_cls=CachedOIDCApp,
+        client_id=settings.GOOGLE_CLIENT_ID,
+        client_secret=settings.GOOGLE_CLIENT_SECRET.get_secret_value(),
+        server_metadata_url=settings.GOOGLE_DISCOVERY_URL,
+        client_kwargs={"scope": "openid profile email"},
+    )
@@ -0,0 +1,39 @@
+"""
+Cliente OAuth/OIDC do authlib com discovery e JWKS vindos do
+``oidc_cache``.
+
+O ``StarletteOAuth2App`` baixa o discovery uma vez por processo e nunca o
+renova; o JWKS só é renovado quando falta a chave que assinou o token.
+Aqui os dois passam pelo cache compartilhado, com TTL, e a renovação
+forçada do JWKS (rotação de chaves) também é coalescida pelo cache.
+"""
+
+from authlib.integrations.starlette_client import StarletteOAuth2App
+
+from core.cache.oidc_cache import oidc_cache
+
+
+class CachedOIDCApp(StarletteOAuth2App):
+    async def load_server_metadata(self) -> dict:
+        if self._server_metadata_url:
+            metadata = await oidc_cache.get(
+                self._server_metadata_url,
+                lambda: self._fetch_json(self._server_metadata_url),
+            )
+            self.server_metadata.update(metadata)
+        return self.server_metadata
+
+    async def fetch_jwk_set(self, force: bool = False) -> dict:
+        metadata = await self.load_server_metadata()
+        uri = metadata.get("jwks_uri")
+        if not uri:
+            raise RuntimeError('Missing "jwks_uri" in metadata')
+        return await oidc_cache.get(
+            uri, lambda: self._fetch_json(uri), force=force
+        )
+
+    async def _fetch_json(self, url: str) -> dict:
+        async with self.client_cls(**self.client_kwargs) as client:
+            response = await client.request("GET", url, withhold_token=True)
+            response.raise_for_status()
+            return response.json()
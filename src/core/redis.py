@@ -0,0 +1,20 @@
+from functools import lru_cache
+
+from redis.asyncio import Redis
+
+from core.settings import get_settings
+
+settings = get_settings()
+
+
+@lru_cache(maxsize=1)
+def get_redis() -> Redis:
+    """
+    Cliente Redis compartilhado pelo processo. A conexão só é aberta no
+    primeiro comando, então importar este módulo não exige Redis no ar.
+    """
+    return Redis.from_url(
+        settings.REDIS_URL,
+        socket_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+        socket_connect_timeout=settings.REDIS_SOCKET_TIMEOUT_SECONDS,
+    )
@@ -1,9 +1,14 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from typing import Callable, TypeVar
 
 import jwt
 from fastapi.security import HTTPBearer
 from pwdlib import PasswordHash
 
+from core.exceptions import PasswordHashingBusyException
+from core.metrics import password_hash_in_flight, password_hash_waiting
 from core.settings import get_settings
 
 settings = get_settings()
@@ -14,13 +19,68 @@ AUTH_COOKIE_NAME = "access_token"
 
 oauth2_scheme = HTTPBearer(auto_error=False)
 
+T = TypeVar("T")
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return password_hash.verify(plain_password, hashed_password)
 
+class PasswordHasherPool:
+    """
+    Executa o Argon2 em um pool de threads dedicado, fora do event loop.
 
-def get_password_hash(password: str) -> str:
-    return password_hash.hash(password)
+    O semáforo limita as chamadas simultâneas ao tamanho do pool; quem
+    excede o limite aguarda na fila, que também é limitada. ``in_flight``
+    e ``waiting`` são publicados como métricas a cada mudança.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.in_flight = 0
+        self.waiting = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="argon2"
+        )
+        self._semaphore = asyncio.Semaphore(max_workers)
+
+    async def run(self, func: Callable[..., T], *args) -> T:
+        if self._semaphore.locked() and self.waiting >= self.max_queue:
+            raise PasswordHashingBusyException()
+
+        self.waiting += 1
+        self._report()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.waiting -= 1
+
+        self.in_flight += 1
+        self._report()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.in_flight -= 1
+            self._semaphore.release()
+            self._report()
+
+    def _report(self) -> None:
+        password_hash_in_flight.set(self.in_flight)
+        password_hash_waiting.set(self.waiting)
+
+
+password_hasher_pool = PasswordHasherPool(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return await password_hasher_pool.run(
+        password_hash.verify, plain_password, hashed_password
+    )
+
+
+async def get_password_hash(password: str) -> str:
+    return await password_hasher_pool.run(password_hash.hash, password)
 
 
 def create_access_token(
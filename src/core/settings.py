@@ -39,16 +39,85 @@ class Settings(BaseSettings):
 
     DATABASE_URL: str | None = None
 
+    # Database engine / pool
+    # DB_ECHO loga todo SQL executado e é independente de DEBUG. Cada
+    # worker abre até POOL_SIZE + MAX_OVERFLOW conexões; quem passa disso
+    # espera até POOL_TIMEOUT_SECONDS por uma conexão livre. Use
+    # STATEMENT_CACHE_SIZE=0 atrás de um PgBouncer em modo transaction.
+    # Os timeouts (em ms, 0 desliga) valem no próprio Postgres, por
+    # conexão.
+    DB_ECHO: bool = False
+    DB_POOL_SIZE: int = Field(default=5, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=10, ge=0)
+    DB_POOL_TIMEOUT_SECONDS: float = Field(default=30.0, gt=0)
+    DB_POOL_RECYCLE_SECONDS: int = Field(default=1800, ge=-1)
+    DB_POOL_PRE_PING: bool = True
+    DB_STATEMENT_CACHE_SIZE: int = Field(default=100, ge=0)
+    DB_STATEMENT_TIMEOUT_MS: int = Field(default=30_000, ge=0)
+    DB_IDLE_IN_TRANSACTION_TIMEOUT_MS: int = Field(default=60_000, ge=0)
+
+    # Read replica
+    # Com DB_REPLICA_URL (mesmo formato de DATABASE_URL), as listagens leem
+    # da réplica. Depois de uma escrita, o mesmo usuário volta a ler do
+    # primário por READ_YOUR_WRITES_SECONDS, que deve cobrir o atraso de
+    # replicação. Sem Redis, a janela só vale no worker que atendeu a
+    # escrita.
+    DB_REPLICA_URL: str | None = None
+    DB_READ_YOUR_WRITES_SECONDS: float = Field(default=5.0, ge=0)
+    DB_READ_YOUR_WRITES_REDIS_ENABLED: bool = False
+
     # JWT Settings
     JWT_SECRET_KEY: SecretStr = SecretStr("...")
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(default=30, ge=1)
 
+    # Métricas Prometheus em /metrics. Com vários workers, exporte também
+    # PROMETHEUS_MULTIPROC_DIR (lido direto pelo prometheus_client).
+    METRICS_ENABLED: bool = True
+
+    # SQL statement budget
+    # Cada requisição pode executar até STATEMENT_BUDGET statements e
+    # repetir o mesmo statement menos de REPEAT_LIMIT vezes (acima disso,
+    # provável N+1). Violações são logadas; com BUDGET_RAISE (nos testes)
+    # a requisição falha.
+    SQL_STATS_ENABLED: bool = True
+    SQL_STATEMENT_BUDGET: int = Field(default=15, ge=1)
+    SQL_REPEAT_LIMIT: int = Field(default=5, ge=2)
+    SQL_BUDGET_RAISE: bool = False
+
+    # Password hashing
+    # Argon2 roda em um pool de threads; acima de MAX_QUEUE chamadas
+    # aguardando, novas requisições recebem 503 em vez de enfileirar.
+    PASSWORD_HASH_WORKERS: int = Field(default=2, ge=1)
+    PASSWORD_HASH_MAX_QUEUE: int = Field(default=64, ge=0)
+
+    # Availability
+    # Cada worker mantém sua própria grade; o TTL limita por quanto tempo
+    # um worker pode servir vagas alteradas por outro processo.
+    AVAILABILITY_GRID_TTL_SECONDS: int = Field(default=60, ge=1)
+
     # Redis / Celery
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = Field(default=6379, ge=1, le=65535)
     REDIS_DB: int = Field(default=0, ge=0)
     REDIS_PASSWORD: SecretStr | None = None
+    REDIS_SOCKET_TIMEOUT_SECONDS: float = Field(default=0.5, gt=0)
+
+    # Current user cache
+    # O cache local de cada worker só é invalidado no próprio processo;
+    # o TTL limita por quanto tempo outro worker pode servir um snapshot
+    # desatualizado. Com Redis habilitado, a camada compartilhada é
+    # invalidada para todos.
+    USER_CACHE_TTL_SECONDS: int = Field(default=30, ge=1)
+    USER_CACHE_MAX_ENTRIES: int = Field(default=10_000, ge=1)
+    USER_CACHE_REDIS_ENABLED: bool = False
+
+    # Service catalog cache
+    # Com Redis, cada worker compara a versão do catálogo a cada
+    # VERSION_CHECK_SECONDS; sem Redis, só o TTL limita a defasagem.
+    SERVICE_CATALOG_TTL_SECONDS: int = Field(default=300, ge=1)
+    SERVICE_CATALOG_VERSION_CHECK_SECONDS: float = Field(default=1.0, ge=0)
+    SERVICE_CATALOG_REDIS_ENABLED: bool = False
 
     # Email (Resend)
     RESEND_API_KEY: SecretStr | None = None
@@ -59,6 +128,40 @@ class Settings(BaseSettings):
     RESEND_TEMPLATE_SIGNUP_SUCCESS: str | None = None
     RESEND_TEMPLATE_PASSWORD_RESET: str | None = None
     RESEND_TEMPLATE_APPOINTMENT_COMPLETED: str | None = None
+    # "fake" guarda os emails em memória em vez de chamar o Resend.
+    EMAIL_TRANSPORT: Literal["resend", "fake"] = "resend"
+
+    # Email outbox
+    # O worker busca até BATCH_SIZE mensagens a cada POLL_SECONDS. Falhas
+    # são reagendadas com backoff exponencial (BASE * 2^(tentativa - 1),
+    # limitado a MAX) até MAX_ATTEMPTS. Mensagens reservadas por um worker
+    # que morreu voltam à fila após LEASE_SECONDS.
+    EMAIL_OUTBOX_POLL_SECONDS: float = Field(default=5.0, gt=0)
+    EMAIL_OUTBOX_BATCH_SIZE: int = Field(default=50, ge=1)
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = Field(default=8, ge=1)
+    EMAIL_OUTBOX_RETRY_BASE_SECONDS: int = Field(default=30, ge=1)
+    EMAIL_OUTBOX_RETRY_MAX_SECONDS: int = Field(default=3600, ge=1)
+    EMAIL_OUTBOX_LEASE_SECONDS: int = Field(default=300, ge=1)
+
+    # Appointment series
+    # Ocorrências com data até hoje + WINDOW_DAYS existem como agendamentos;
+    # as seguintes são virtuais. O worker avança a janela de até
+    # BATCH_SIZE séries por lote a cada MATERIALIZE_SECONDS.
+    APPOINTMENT_SERIES_WINDOW_DAYS: int = Field(default=28, ge=1)
+    APPOINTMENT_SERIES_MATERIALIZE_SECONDS: float = Field(default=3600, gt=0)
+    APPOINTMENT_SERIES_BATCH_SIZE: int = Field(default=100, ge=1)
+
+    # Idempotency keys
+    # Respostas de requisições com Idempotency-Key ficam guardadas por
+    # KEY_TTL_SECONDS. Uma repetição concorrente espera a original por até
+    # WAIT_SECONDS antes de receber 409. Uma reserva sem resposta gravada
+    # (processo caiu no meio) é liberada depois de LEASE_SECONDS, que deve
+    # passar da duração máxima da operação. O worker remove as chaves
+    # vencidas a cada PURGE_SECONDS.
+    IDEMPOTENCY_KEY_TTL_SECONDS: int = Field(default=86_400, ge=1)
+    IDEMPOTENCY_WAIT_SECONDS: float = Field(default=10.0, ge=0)
+    IDEMPOTENCY_LEASE_SECONDS: int = Field(default=120, ge=1)
+    IDEMPOTENCY_PURGE_SECONDS: float = Field(default=3600, gt=0)
 
     # MinIO / S3 Storage
     MINIO_ENDPOINT: str = "localhost"
@@ -75,6 +178,15 @@ class Settings(BaseSettings):
     GOOGLE_REDIRECT_URI: str | None = None
     SECRET_KEY: SecretStr = SecretStr("...")
     FRONTEND_URL: str = "http://localhost:5173/auth/google/callback"
+    GOOGLE_DISCOVERY_URL: str = (
+        "https://accounts.google.com/.well-known/openid-configuration"
+    )
+    # O discovery e o JWKS do Google ficam em cache por
+    # GOOGLE_OIDC_CACHE_TTL_SECONDS. Com Redis e/ou GOOGLE_OIDC_CACHE_DIR
+    # (um volume do container), workers novos começam com o cache quente.
+    GOOGLE_OIDC_CACHE_TTL_SECONDS: int = Field(default=3600, ge=1)
+    GOOGLE_OIDC_CACHE_REDIS_ENABLED: bool = False
+    GOOGLE_OIDC_CACHE_DIR: str | None = None
 
     @computed_field
     def MINIO_URL(self) -> str:
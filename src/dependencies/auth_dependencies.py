@@ -5,7 +5,7 @@ from fastapi.security import HTTPAuthorizationCredentials
 
 from core.security import AUTH_COOKIE_NAME, oauth2_scheme
 from enums import UserRole
-from models import UserModel
+from schemas.user_schema import CurrentUser
 from services.auth_service import AuthService, get_auth_service
 
 
@@ -15,7 +15,7 @@ async def get_current_user(
         HTTPAuthorizationCredentials | None, Depends(oauth2_scheme)
     ],
     service: Annotated[AuthService, Depends(get_auth_service)],
-) -> UserModel:
+) -> CurrentUser:
     """
     Extrai o token do header Authorization ou de cookie e retorna o usuário autenticado.
     """
@@ -31,12 +31,15 @@ async def get_current_user(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    return await service.get_current_user(token)
+    current_user = await service.get_current_user(token)
+    # Lido por get_read_session e pelo ReadYourWritesMiddleware.
+    request.state.current_user_id = current_user.id
+    return current_user
 
 
 def require_admin_user(
-    current_user: Annotated[UserModel, Depends(get_current_user)],
-) -> UserModel:
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+) -> CurrentUser:
     if current_user.role != UserRole.ADMIN:
         raise HTTPException(status_code=403, detail="User not authorized")
     return current_user
@@ -0,0 +1,27 @@
+from collections.abc import Callable
+
+from fastapi import Response
+
+# Respostas autenticadas nunca vão para caches compartilhados. Leituras
+# com ETag usam "no-cache": o cliente guarda a resposta, mas revalida a
+# cada uso (um 304 barato quando nada mudou).
+PRIVATE_REVALIDATE = "private, no-cache"
+# Tokens e dados pessoais que não devem ficar gravados em cache algum.
+NO_STORE = "no-store"
+
+
+def cache_control(policy: str) -> Callable[[Response], None]:
+    """
+    Dependency factory that sets the Cache-Control header.
+
+    Args:
+        policy: Cache-Control value for the router or route
+
+    Returns:
+        Dependency that applies the policy to the response
+    """
+
+    def set_cache_control(response: Response) -> None:
+        response.headers["Cache-Control"] = policy
+
+    return set_cache_control
@@ -0,0 +1,104 @@
+import hashlib
+from collections.abc import Awaitable, Callable
+from typing import Annotated, TypeVar
+from uuid import UUID
+
+from fastapi import Depends, Header, Request, Response
+from sqlalchemy import Row
+
+from dependencies.auth_dependencies import get_current_user
+from schemas.user_schema import CurrentUser
+from services.idempotency_service import (
+    IdempotencyService,
+    get_idempotency_service,
+)
+from utils.responses import json_response
+
+REPLAYED_HEADER = "Idempotent-Replayed"
+
+T = TypeVar("T")
+
+
+class IdempotentRequest:
+    """
+    Requisição com ``Idempotency-Key`` já resolvida. Se a chave foi usada
+    antes, ``replay`` traz a resposta original (com o ``ETag``) e a rota
+    não executa nada; caso contrário a rota executa a operação passando
+    ``before_commit``, que grava a resposta na reserva ``claim_id`` no
+    mesmo commit da operação. Sem o cabeçalho, não há o que gravar.
+    """
+
+    def __init__(
+        self,
+        service: IdempotencyService,
+        claim_id: UUID | None = None,
+        replay: Response | None = None,
+    ):
+        self.service = service
+        self.claim_id = claim_id
+        self.replay = replay
+
+    def before_commit(
+        self, render: Callable[[T], Response]
+    ) -> Callable[[T], Awaitable[None]] | None:
+        """
+        Hook para o service chamar antes do commit da operação: a resposta
+        gerada por ``render`` é gravada na mesma transação, então uma
+        operação confirmada sempre tem a resposta para repetir. Erros não
+        são gravados: a reserva é desfeita com a transação, e uma nova
+        tentativa executa de novo.
+        """
+        if self.claim_id is None:
+            return None
+
+        async def complete(result: T) -> None:
+            rendered = render(result)
+            await self.service.complete(
+                self.claim_id,
+                rendered.status_code,
+                bytes(rendered.body),
+                rendered.headers.get("ETag"),
+            )
+
+        return complete
+
+
+async def get_idempotent_request(
+    request: Request,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: Annotated[IdempotencyService, Depends(get_idempotency_service)],
+    idempotency_key: Annotated[
+        str | None, Header(min_length=1, max_length=255)
+    ] = None,
+) -> IdempotentRequest:
+    """
+    Dependency for routes that accept an ``Idempotency-Key`` header.
+
+    The key is scoped to the user and bound to the method, path and body
+    of the first request; reusing it for another request fails with 422.
+
+    Returns:
+        The request state, with the stored response when it is a replay
+    """
+    if idempotency_key is None:
+        return IdempotentRequest(service)
+
+    request_hash = hashlib.sha256(
+        b"\n".join([
+            request.method.encode(),
+            request.url.path.encode(),
+            await request.body(),
+        ])
+    ).hexdigest()
+    claim = await service.begin(current_user.id, idempotency_key, request_hash)
+    if not isinstance(claim, Row):
+        return IdempotentRequest(service, claim_id=claim)
+
+    if claim.response_etag is not None:
+        response.headers["ETag"] = claim.response_etag
+    replay = json_response(
+        claim.response_body, response, claim.response_status
+    )
+    replay.headers[REPLAYED_HEADER] = "true"
+    return IdempotentRequest(service, replay=replay)
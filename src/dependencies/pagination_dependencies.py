@@ -1,18 +1,42 @@
+from typing import Annotated
+
+from fastapi import Query
 from fastapi_pagination import Params
 
+from schemas.pagination_schema import CursorParams
+
 
 def get_pagination_params(
-    page: int = 1,
-    size: int = 20,
+    page: Annotated[int, Query(ge=1)] = 1,
+    size: Annotated[int, Query(ge=1, le=100)] = 20,
 ) -> Params:
     """
     Dependency function to get pagination parameters with default size of 20.
 
     Args:
         page: Page number (default: 1)
-        size: Page size (default: 20)
+        size: Page size, 1 to 100 (default: 20)
 
     Returns:
         Params object with page and size
     """
     return Params(page=page, size=size)
+
+
+def get_cursor_params(
+    cursor: str | None = None,
+    size: Annotated[int, Query(ge=1, le=100)] = 20,
+    include_total: bool = False,
+) -> CursorParams:
+    """
+    Dependency function to get keyset pagination parameters.
+
+    Args:
+        cursor: Opaque cursor returned as `next_cursor` by the previous page
+        size: Page size, 1 to 100 (default: 20)
+        include_total: Also run a COUNT(*) for the total (default: False)
+
+    Returns:
+        CursorParams object with cursor, size and include_total
+    """
+    return CursorParams(cursor=cursor, size=size, include_total=include_total)
@@ -1,6 +1,7 @@
 from enums.appointment_status import AppointmentStatus
 from enums.appointment_weekday import WeekDay
 from enums.date_filter import DateFilter, FutureDateFilter
+from enums.recurrence_frequency import RecurrenceFrequency
 from enums.user_role import UserRole
 
 __all__ = [
@@ -9,4 +10,5 @@ __all__ = [
     "WeekDay",
     "AppointmentStatus",
     "FutureDateFilter",
+    "RecurrenceFrequency",
 ]
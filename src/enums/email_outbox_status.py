@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class EmailOutboxStatus(StrEnum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
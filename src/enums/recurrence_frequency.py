@@ -0,0 +1,7 @@
+from enum import StrEnum
+
+
+class RecurrenceFrequency(StrEnum):
+    WEEKLY = "weekly"
+    BIWEEKLY = "biweekly"
+    MONTHLY = "monthly"
@@ -1,8 +1,10 @@
 from models.admin_daily_override_model import AdminDailyOverrideModel
-from models.admin_daily_limit_model import AdminDailyLimitModel
 from models.admin_weekly_capacity_model import AdminWeeklyCapacityModel
 from models.appointment_model import AppointmentModel
+from models.appointment_series_model import AppointmentSeriesModel
 from models.appointment_service_model import AppointmentServiceModel
+from models.email_outbox_model import EmailOutboxModel
+from models.idempotency_key_model import IdempotencyKeyModel
 from models.service_model import ServiceModel
 from models.user_model import UserModel
 
@@ -10,8 +12,10 @@ __all__ = [
     "UserModel",
     "ServiceModel",
     "AppointmentModel",
-    "AdminDailyLimitModel",
+    "AppointmentSeriesModel",
     "AdminDailyOverrideModel",
     "AdminWeeklyCapacityModel",
     "AppointmentServiceModel",
+    "EmailOutboxModel",
+    "IdempotencyKeyModel",
 ]
@@ -5,7 +5,18 @@ from datetime import datetime
 from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
-from sqlalchemy import Date, DateTime, Enum, ForeignKey, String, func
+from sqlalchemy import (
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    String,
+    desc,
+    func,
+    text,
+)
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
@@ -21,9 +32,63 @@ if TYPE_CHECKING:
 
 class AppointmentModel(Base):
     __tablename__ = "appointments"
+    # Índices seguem o formato das listagens: dono (cliente ou admin),
+    # status opcional e ordenação por (created_at, id) decrescente, que
+    # também é a chave da paginação por cursor. O índice parcial atende a
+    # contagem de agendamentos ativos por admin e dia da disponibilidade.
+    __table_args__ = (
+        Index(
+            "ix_appointments_client_created",
+            "client_id",
+            desc("created_at"),
+            desc("id"),
+        ),
+        Index(
+            "ix_appointments_client_status_created",
+            "client_id",
+            "status",
+            desc("created_at"),
+            desc("id"),
+        ),
+        Index(
+            "ix_appointments_admin_created",
+            "admin_id",
+            desc("created_at"),
+            desc("id"),
+        ),
+        Index(
+            "ix_appointments_admin_status_created",
+            "admin_id",
+            "status",
+            desc("created_at"),
+            desc("id"),
+        ),
+        Index(
+            "ix_appointments_admin_date_active",
+            "admin_id",
+            "date",
+            postgresql_where=text("status <> 'cancelled'"),
+        ),
+    )
+
+    # Ocorrência de uma série ainda não materializada: montada só para
+    # as listagens, nunca adicionada à sessão.
+    virtual = False
+
+    # Trava otimista: todo UPDATE pelo ORM filtra pela versão carregada e
+    # a incrementa; se outra escrita veio antes, nenhuma linha é alterada
+    # e o flush falha com StaleDataError. UPDATEs em lote (Core) precisam
+    # incrementar a versão explicitamente.
+    version: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="1"
+    )
+
+    # Busca status/created_at/updated_at via RETURNING no próprio INSERT/
+    # UPDATE, evitando recarregar o agendamento após cada escrita.
+    __mapper_args__ = {"eager_defaults": True, "version_id_col": version}
 
     id: Mapped[UUID] = mapped_column(
-        PG_UUID(as_uuid=True), primary_key=True, default=uuid4, index=True
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
     )
 
     date: Mapped[DateType] = mapped_column(
@@ -104,13 +169,11 @@ class AppointmentModel(Base):
         PG_UUID(as_uuid=True),
         ForeignKey(USER_ID_FOREIGN_KEY),
         nullable=False,
-        index=True,
     )
     admin_id: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey(USER_ID_FOREIGN_KEY),
         nullable=True,
-        index=True,
     )
     created_by: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -122,24 +185,26 @@ class AppointmentModel(Base):
         PG_UUID(as_uuid=True),
         ForeignKey(USER_ID_FOREIGN_KEY),
         nullable=True,
-        index=True,
     )
     refused_by: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey(USER_ID_FOREIGN_KEY),
         nullable=True,
-        index=True,
     )
     cancelled_by: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey(USER_ID_FOREIGN_KEY),
         nullable=True,
-        index=True,
     )
     reschedule_requested_by: Mapped[UUID | None] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey(USER_ID_FOREIGN_KEY),
         nullable=True,
+    )
+    series_id: Mapped[UUID | None] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey("appointment_series.id"),
+        nullable=True,
         index=True,
     )
 
@@ -0,0 +1,91 @@
+from datetime import date as DateType
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    CheckConstraint,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    Integer,
+    func,
+    text,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.db.base import Base
+from enums import RecurrenceFrequency
+from models.constants import USER_ID_FOREIGN_KEY
+
+
+class AppointmentSeriesModel(Base):
+    """
+    Série de agendamentos recorrentes de um cliente. As ocorrências até
+    ``materialized_until`` existem em ``appointments``; as seguintes são
+    calculadas (``utils.recurrence``) e materializadas aos poucos, numa
+    janela móvel, pelo worker (``tasks.appointment_series_tasks``).
+    """
+
+    __tablename__ = "appointment_series"
+    __mapper_args__ = {"eager_defaults": True}
+    # O worker só procura séries ativas que ainda têm ocorrências a
+    # materializar.
+    __table_args__ = (
+        CheckConstraint(
+            "until IS NOT NULL OR occurrences IS NOT NULL",
+            name="ck_appointment_series_bounded",
+        ),
+        Index(
+            "ix_appointment_series_pending_materialization",
+            "materialized_until",
+            postgresql_where=text(
+                "cancelled_at IS NULL AND (materialized_until IS NULL "
+                "OR materialized_until < ends_on)"
+            ),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    client_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey(USER_ID_FOREIGN_KEY),
+        nullable=False,
+        index=True,
+    )
+    frequency: Mapped[RecurrenceFrequency] = mapped_column(
+        Enum(
+            RecurrenceFrequency,
+            name="recurrence_frequency",
+            values_callable=lambda values: [value.value for value in values],
+        ),
+        nullable=False,
+    )
+    start_date: Mapped[DateType] = mapped_column(Date, nullable=False)
+    until: Mapped[DateType | None] = mapped_column(Date, nullable=True)
+    occurrences: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Data da última ocorrência, calculada na criação.
+    ends_on: Mapped[DateType] = mapped_column(Date, nullable=False)
+    service_ids: Mapped[list[UUID]] = mapped_column(
+        ARRAY(PG_UUID(as_uuid=True)), nullable=False
+    )
+    materialized_until: Mapped[DateType | None] = mapped_column(
+        Date, nullable=True
+    )
+    cancelled_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        nullable=False,
+        server_default=func.now(),
+        onupdate=func.now(),
+    )
@@ -0,0 +1,59 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import DateTime, Enum, Index, Integer, String, Text, func, text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.db.base import Base
+from enums.email_outbox_status import EmailOutboxStatus
+
+
+class EmailOutboxModel(Base):
+    """
+    Email pendente de envio. Gravado na mesma transação da operação que o
+    originou e enviado depois pelo worker (``tasks.email_tasks``).
+    """
+
+    __tablename__ = "email_outbox"
+    # O worker só lê mensagens pendentes, na ordem de next_attempt_at.
+    __table_args__ = (
+        Index(
+            "ix_email_outbox_pending_next_attempt_at",
+            "next_attempt_at",
+            postgresql_where=text("status = 'pending'"),
+        ),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    recipient: Mapped[str] = mapped_column(String(255), nullable=False)
+    template_id: Mapped[str] = mapped_column(String(255), nullable=False)
+    template_variables: Mapped[dict] = mapped_column(
+        JSONB, nullable=False, server_default=text("'{}'::jsonb")
+    )
+    status: Mapped[EmailOutboxStatus] = mapped_column(
+        Enum(
+            EmailOutboxStatus,
+            name="email_outbox_status",
+            values_callable=lambda values: [value.value for value in values],
+        ),
+        nullable=False,
+        default=EmailOutboxStatus.PENDING,
+        server_default=EmailOutboxStatus.PENDING.value,
+    )
+    attempts: Mapped[int] = mapped_column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
+    last_error: Mapped[str | None] = mapped_column(Text, nullable=True)
+    next_attempt_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    sent_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
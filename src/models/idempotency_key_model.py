@@ -0,0 +1,64 @@
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlalchemy import (
+    DateTime,
+    ForeignKey,
+    Index,
+    Integer,
+    LargeBinary,
+    String,
+    func,
+)
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
+from sqlalchemy.orm import Mapped, mapped_column
+
+from core.db.base import Base
+from models.constants import USER_ID_FOREIGN_KEY
+
+
+class IdempotencyKeyModel(Base):
+    """
+    Resposta de uma requisição enviada com ``Idempotency-Key``. A chave é
+    reservada na mesma transação da operação e a resposta é gravada logo
+    depois; sem ``response_status`` a requisição ainda está em andamento.
+    Até a resposta ser gravada, ``expires_at`` é o prazo curto da reserva,
+    e não o TTL da chave.
+    """
+
+    __tablename__ = "idempotency_keys"
+    __table_args__ = (
+        Index(
+            "uq_idempotency_keys_user_id_key",
+            "user_id",
+            "key",
+            unique=True,
+        ),
+        # A limpeza percorre as chaves vencidas.
+        Index("ix_idempotency_keys_expires_at", "expires_at"),
+    )
+
+    id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True), primary_key=True, default=uuid4
+    )
+    user_id: Mapped[UUID] = mapped_column(
+        PG_UUID(as_uuid=True),
+        ForeignKey(USER_ID_FOREIGN_KEY),
+        nullable=False,
+    )
+    key: Mapped[str] = mapped_column(String(255), nullable=False)
+    # sha256 do método, caminho e corpo da requisição original.
+    request_hash: Mapped[str] = mapped_column(String(64), nullable=False)
+    response_status: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    response_body: Mapped[bytes | None] = mapped_column(
+        LargeBinary, nullable=True
+    )
+    response_etag: Mapped[str | None] = mapped_column(
+        String(255), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, server_default=func.now()
+    )
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False
+    )
@@ -4,7 +4,7 @@ from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from enums import WeekDay
-from models import AdminDailyLimitModel
+from models import AdminWeeklyCapacityModel
 from repositories.interfaces.admin_daily_limit_interface import (
     IAdminDailyLimitRepository,
 )
@@ -14,43 +14,47 @@ class AdminDailyLimitRepository(IAdminDailyLimitRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def get_by_id(self, id: UUID) -> AdminDailyLimitModel | None:
+    async def get_by_id(self, id: UUID) -> AdminWeeklyCapacityModel | None:
         result = await self.session.execute(
-            select(AdminDailyLimitModel).where(AdminDailyLimitModel.id == id)
+            select(AdminWeeklyCapacityModel).where(
+                AdminWeeklyCapacityModel.id == id
+            )
         )
         return result.scalar_one_or_none()
 
     async def get_by_week_day(
         self, admin_id: UUID, week_day: WeekDay
-    ) -> AdminDailyLimitModel | None:
+    ) -> AdminWeeklyCapacityModel | None:
         result = await self.session.execute(
-            select(AdminDailyLimitModel).where(
-                AdminDailyLimitModel.admin_id == admin_id,
-                AdminDailyLimitModel.week_day == week_day,
+            select(AdminWeeklyCapacityModel).where(
+                AdminWeeklyCapacityModel.admin_id == admin_id,
+                AdminWeeklyCapacityModel.week_day == week_day,
             )
         )
         return result.scalar_one_or_none()
 
-    async def get_all(self) -> list[AdminDailyLimitModel]:
-        result = await self.session.execute(select(AdminDailyLimitModel))
+    async def get_all(self) -> list[AdminWeeklyCapacityModel]:
+        result = await self.session.execute(select(AdminWeeklyCapacityModel))
         return result.scalars().all()
 
     async def save(
-        self, admin_daily_limit: AdminDailyLimitModel
-    ) -> AdminDailyLimitModel:
+        self, admin_daily_limit: AdminWeeklyCapacityModel
+    ) -> AdminWeeklyCapacityModel:
         self.session.add(admin_daily_limit)
         await self.session.commit()
         await self.session.refresh(admin_daily_limit)
         return admin_daily_limit
 
     async def update(
-        self, admin_daily_limit: AdminDailyLimitModel
-    ) -> AdminDailyLimitModel:
+        self, admin_daily_limit: AdminWeeklyCapacityModel
+    ) -> AdminWeeklyCapacityModel:
         merged_limit = await self.session.merge(admin_daily_limit)
         await self.session.commit()
         await self.session.refresh(merged_limit)
         return merged_limit
 
-    async def delete(self, admin_daily_limit: AdminDailyLimitModel) -> None:
+    async def delete(
+        self, admin_daily_limit: AdminWeeklyCapacityModel
+    ) -> None:
         await self.session.delete(admin_daily_limit)
         await self.session.commit()
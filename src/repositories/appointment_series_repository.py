@@ -0,0 +1,69 @@
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import AppointmentSeriesModel
+from repositories.interfaces.appointment_series_interface import (
+    IAppointmentSeriesRepository,
+)
+
+
+class AppointmentSeriesRepository(IAppointmentSeriesRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def add(
+        self, series: AppointmentSeriesModel
+    ) -> AppointmentSeriesModel:
+        """
+        Adiciona a série e faz o flush sem commit, para que id e
+        created_at fiquem disponíveis às ocorrências gravadas na mesma
+        transação.
+        """
+        self.session.add(series)
+        await self.session.flush()
+        return series
+
+    async def update(
+        self, series: AppointmentSeriesModel
+    ) -> AppointmentSeriesModel:
+        self.session.add(series)
+        await self.session.commit()
+        return series
+
+    async def get_for_update(self, id: UUID) -> AppointmentSeriesModel | None:
+        result = await self.session.execute(
+            select(AppointmentSeriesModel)
+            .where(AppointmentSeriesModel.id == id)
+            .with_for_update()
+        )
+        return result.scalar_one_or_none()
+
+    async def claim_due(
+        self, window_end: date, limit: int
+    ) -> list[AppointmentSeriesModel]:
+        """
+        Séries ativas com ocorrências ainda não materializadas até
+        ``window_end``. As linhas ficam travadas até o commit; workers
+        concorrentes pulam as já reservadas.
+        """
+        series = AppointmentSeriesModel
+        result = await self.session.scalars(
+            select(series)
+            .where(
+                # Mesmo predicado do índice parcial.
+                series.cancelled_at.is_(None),
+                or_(
+                    series.materialized_until.is_(None),
+                    series.materialized_until < series.ends_on,
+                ),
+                func.coalesce(series.materialized_until, series.start_date - 1)
+                < func.least(series.ends_on, window_end),
+            )
+            .order_by(series.materialized_until)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(result)
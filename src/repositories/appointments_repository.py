@@ -1,85 +1,349 @@
-from datetime import UTC, datetime
+import heapq
+from collections.abc import AsyncIterator, Iterator
+from datetime import UTC, date, datetime, time
 from uuid import UUID
 
 from fastapi_pagination import Page, Params
+from fastapi_pagination.api import apply_items_transformer, create_page
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import select
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    Select,
+    String,
+    any_,
+    cast,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from core.cache.availability_grid import track_availability_changes
 from enums import AppointmentStatus
 from enums.date_filter import FutureDateFilter
-from models import AppointmentModel
-from models.appointment_service_model import AppointmentServiceModel
+from models import AppointmentModel, AppointmentSeriesModel
 from repositories.interfaces.appointments_interface import (
+    BeforeCommit,
     IAppointmentRepository,
 )
+from schemas.appointments_schema import AppointmentVersion
+from schemas.pagination_schema import CursorPage, CursorParams
 from utils import FUTURE_DATE_FILTERS
+from utils.cursor import keyset_paginate
+from utils.recurrence import build_occurrences
+
+
+def _listing_key(item) -> tuple[datetime, UUID]:
+    return item.created_at, item.id
+
+
+async def _merge_occurrences(
+    rows: AsyncIterator,
+    occurrences: Iterator[AppointmentModel],
+) -> AsyncIterator:
+    """
+    Intercala, do mais recente ao mais antigo, as chaves vindas do banco
+    com as ocorrências virtuais, ambas já nessa ordem.
+    """
+    pending = next(occurrences, None)
+    async for row in rows:
+        while pending is not None and _listing_key(pending) > _listing_key(
+            row
+        ):
+            yield pending
+            pending = next(occurrences, None)
+        yield row
+    while pending is not None:
+        yield pending
+        pending = next(occurrences, None)
+
+
+def _id_array(ids: list[UUID]) -> ColumnElement:
+    """
+    Ids como um único parâmetro array, para ``= ANY(...)``: o SQL é o
+    mesmo para qualquer tamanho de lote.
+    """
+    return literal(ids, ARRAY(PG_UUID(as_uuid=True)))
+
+
+def admin_day_lock_key(admin_id, day) -> ColumnElement:
+    """
+    Chave do advisory lock de um (admin, dia), calculada no banco para que
+    valores Python e colunas gerem a mesma chave.
+    """
+    return func.hashtextextended(
+        func.concat(cast(admin_id, String), ":", cast(day, String)), 0
+    )
 
 
 class AppointmentsRepository(IAppointmentRepository):
     def __init__(self, session: AsyncSession):
         self.session = session
 
-    async def save(self, appointment: AppointmentModel) -> AppointmentModel:
+    async def save(
+        self,
+        appointment: AppointmentModel,
+        before_commit: BeforeCommit | None = None,
+    ) -> AppointmentModel:
         self.session.add(appointment)
-        await self.session.flush()
+        await self._commit(before_commit)
+        return appointment
 
-        appointment_id = appointment.id
+    async def save_all(
+        self, appointments: list[AppointmentModel]
+    ) -> list[AppointmentModel]:
+        """
+        Persiste vários agendamentos em um único commit. O flush agrupa os
+        INSERTs de cada tabela em instruções de várias linhas.
+        """
+        self.session.add_all(appointments)
         await self.session.commit()
+        return appointments
 
-        self.session.expunge(appointment)
-        loaded_appointment = await self.get_by_id(appointment_id)
-        if not loaded_appointment:
-            raise ValueError(
-                f"Failed to reload appointment {appointment_id} after save"
-            )
-        return loaded_appointment
-
-    async def update(self, appointment: AppointmentModel) -> AppointmentModel:
+    async def update(
+        self,
+        appointment: AppointmentModel,
+        before_commit: BeforeCommit | None = None,
+    ) -> AppointmentModel:
         self.session.add(appointment)
-        await self.session.commit()
+        await self._commit(before_commit)
+        return appointment
 
-        appointment_id = appointment.id
-        self.session.expunge(appointment)
-        loaded_appointment = await self.get_by_id(appointment_id)
-        if not loaded_appointment:
-            raise ValueError(
-                f"Failed to reload appointment {appointment_id} after update"
-            )
-        return loaded_appointment
+    async def _commit(self, before_commit: BeforeCommit | None) -> None:
+        """
+        Com ``before_commit``, a escrita vai ao banco (flush) e a função
+        roda antes do commit: o que ela gravar é confirmado ou desfeito
+        junto com a escrita.
+        """
+        if before_commit is not None:
+            await self.session.flush()
+            await before_commit()
+        await self.session.commit()
 
     async def delete(self, appointment: AppointmentModel) -> None:
         await self.session.delete(appointment)
         await self.session.commit()
 
+    async def lock_admin_day(self, admin_id: UUID, day: date) -> None:
+        """
+        Serializa reservas concorrentes do mesmo admin no mesmo dia até o
+        fim da transação corrente.
+        """
+        await self.session.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    admin_day_lock_key(str(admin_id), day.isoformat())
+                )
+            )
+        )
+
+    async def lock_admin_days(self, slots: list[tuple[UUID, date]]) -> None:
+        """
+        Trava vários (admin, dia) em uma única consulta, sempre na mesma
+        ordem, para que reservas em lote concorrentes não entrem em
+        deadlock.
+        """
+        admin_ids, days = zip(*sorted(set(slots)), strict=True)
+        pairs = select(
+            func.unnest(
+                literal([str(id) for id in admin_ids], ARRAY(String))
+            ).label("admin_id"),
+            func.unnest(
+                literal([day.isoformat() for day in days], ARRAY(String))
+            ).label("day"),
+        ).subquery("pairs")
+        await self.session.execute(
+            select(
+                func.pg_advisory_xact_lock(
+                    admin_day_lock_key(pairs.c.admin_id, pairs.c.day)
+                )
+            )
+        )
+
+    async def get_for_transition(self, ids: list[UUID]) -> list[Row]:
+        """
+        Estado atual dos agendamentos pedidos. As linhas não são travadas:
+        o UPDATE que aplica a transição repete as condições de estado ou
+        confere a versão lida.
+        """
+        result = await self.session.execute(
+            select(
+                AppointmentModel.id,
+                AppointmentModel.status,
+                AppointmentModel.client_id,
+                AppointmentModel.admin_id,
+                AppointmentModel.date,
+                AppointmentModel.version,
+            ).where(AppointmentModel.id == any_(_id_array(ids)))
+        )
+        return list(result)
+
+    async def confirm_many(
+        self, versions: dict[UUID, int], admin_id: UUID
+    ) -> list[Row]:
+        """
+        Confirma os agendamentos pendentes atribuindo o admin, em um único
+        UPDATE, e faz o commit. ``versions`` traz a versão lida de cada id:
+        um agendamento alterado depois da leitura (remarcado para um dia
+        cuja vaga não foi conferida, por exemplo) fica de fora. Retorna
+        (id, status, date) das linhas alteradas.
+        """
+        expected = (
+            func
+            .unnest(
+                _id_array(list(versions)),
+                literal(list(versions.values()), ARRAY(Integer)),
+            )
+            .table_valued("id", "version")
+            .render_derived()
+        )
+        result = await self.session.execute(
+            update(AppointmentModel)
+            .where(
+                tuple_(AppointmentModel.id, AppointmentModel.version).in_(
+                    select(expected.c.id, expected.c.version)
+                ),
+                AppointmentModel.status == AppointmentStatus.PENDING,
+                or_(
+                    AppointmentModel.admin_id.is_(None),
+                    AppointmentModel.admin_id == admin_id,
+                ),
+            )
+            .values(
+                status=AppointmentStatus.CONFIRMED,
+                admin_id=admin_id,
+                version=AppointmentModel.version + 1,
+            )
+            .returning(
+                AppointmentModel.id,
+                AppointmentModel.status,
+                AppointmentModel.date,
+            )
+        )
+        rows = list(result)
+        track_availability_changes(
+            self.session.sync_session,
+            [(admin_id, row.date) for row in rows],
+        )
+        await self.session.commit()
+        return rows
+
+    async def cancel_many(
+        self,
+        ids: list[UUID],
+        cancel_reason: str,
+        client_id: UUID | None = None,
+        admin_id: UUID | None = None,
+    ) -> list[Row]:
+        """
+        Cancela, em uma única instrução, os agendamentos ativos do cliente
+        ou do admin atribuído, e faz o commit.
+
+        Retorna uma linha por id pedido: ``cancelled`` indica se ele foi
+        alterado; para os demais, status e donos vêm do snapshot anterior
+        ao UPDATE, o que permite explicar a falha sem outra consulta.
+        """
+        owners = []
+        if client_id is not None:
+            owners.append(AppointmentModel.client_id == client_id)
+        if admin_id is not None:
+            owners.append(AppointmentModel.admin_id == admin_id)
+
+        requested = select(func.unnest(_id_array(ids)).label("id")).cte(
+            "requested"
+        )
+        cancelled = (
+            update(AppointmentModel)
+            .where(
+                AppointmentModel.id == any_(_id_array(ids)),
+                AppointmentModel.status.in_([
+                    AppointmentStatus.PENDING,
+                    AppointmentStatus.CONFIRMED,
+                ]),
+                or_(*owners),
+            )
+            .values(
+                status=AppointmentStatus.CANCELLED,
+                cancel_reason=cancel_reason,
+                cancelled_at=func.now(),
+                version=AppointmentModel.version + 1,
+            )
+            .returning(
+                AppointmentModel.id,
+                AppointmentModel.admin_id,
+                AppointmentModel.date,
+            )
+            .cte("cancelled")
+        )
+        result = await self.session.execute(
+            select(
+                requested.c.id,
+                cancelled.c.id.is_not(None).label("cancelled"),
+                cancelled.c.admin_id.label("cancelled_admin_id"),
+                cancelled.c.date.label("cancelled_date"),
+                AppointmentModel.status,
+                AppointmentModel.client_id,
+                AppointmentModel.admin_id,
+            )
+            .select_from(requested)
+            .outerjoin(cancelled, cancelled.c.id == requested.c.id)
+            .outerjoin(AppointmentModel, AppointmentModel.id == requested.c.id)
+        )
+        rows = list(result)
+        track_availability_changes(
+            self.session.sync_session,
+            [
+                (row.cancelled_admin_id, row.cancelled_date)
+                for row in rows
+                if row.cancelled_admin_id is not None
+            ],
+        )
+        await self.session.commit()
+        return rows
+
     async def get_by_id(self, id: UUID) -> AppointmentModel | None:
         result = await self.session.execute(
             select(AppointmentModel)
-            .options(
-                selectinload(AppointmentModel.services).selectinload(
-                    AppointmentServiceModel.service
-                )
-            )
+            .options(selectinload(AppointmentModel.services))
             .where(AppointmentModel.id == id)
         )
         return result.scalar_one_or_none()
 
-    async def get_all(
-        self,
-        params: Params,
+    async def get_version(self, id: UUID) -> AppointmentVersion | None:
+        """
+        Busca só o necessário para o GET condicional, pela chave primária,
+        sem carregar os serviços vinculados.
+        """
+        result = await self.session.execute(
+            select(
+                AppointmentModel.id,
+                AppointmentModel.client_id,
+                AppointmentModel.admin_id,
+                AppointmentModel.updated_at,
+                AppointmentModel.version,
+            ).where(AppointmentModel.id == id)
+        )
+        row = result.one_or_none()
+        return AppointmentVersion.model_validate(row) if row else None
+
+    @staticmethod
+    def _list_stmt(
         client_id: UUID | None = None,
         admin_id: UUID | None = None,
         status: AppointmentStatus | None = None,
         date_filter: FutureDateFilter | None = None,
-    ) -> Page[AppointmentModel]:
+    ) -> Select:
         stmt = (
             select(AppointmentModel)
-            .options(
-                selectinload(AppointmentModel.services).selectinload(
-                    AppointmentServiceModel.service
-                )
-            )
+            .options(selectinload(AppointmentModel.services))
             .order_by(AppointmentModel.created_at.desc())
         )
 
@@ -97,4 +361,192 @@ class AppointmentsRepository(IAppointmentRepository):
                 AppointmentModel.date.between(now, now + date_filter_timedelta)
             )
 
-        return await paginate(self.session, stmt, params)
+        return stmt
+
+    async def get_all(
+        self,
+        params: Params,
+        client_id: UUID | None = None,
+        admin_id: UUID | None = None,
+        status: AppointmentStatus | None = None,
+        date_filter: FutureDateFilter | None = None,
+    ) -> Page[AppointmentModel]:
+        """
+        Lista os agendamentos. Na listagem de um cliente com séries em
+        andamento, as ocorrências ainda não materializadas entram na
+        página como agendamentos virtuais.
+        """
+        stmt = self._list_stmt(client_id, admin_id, status, date_filter)
+        series = []
+        if (
+            client_id is not None
+            and admin_id is None
+            and status in {None, AppointmentStatus.PENDING}
+        ):
+            series = await self._series_with_occurrences(client_id)
+        if not series:
+            return await paginate(self.session, stmt, params)
+        return await self._paginate_with_occurrences(
+            stmt, params, series, date_filter
+        )
+
+    async def _series_with_occurrences(
+        self, client_id: UUID
+    ) -> list[AppointmentSeriesModel]:
+        result = await self.session.scalars(
+            select(AppointmentSeriesModel).where(
+                AppointmentSeriesModel.client_id == client_id,
+                AppointmentSeriesModel.cancelled_at.is_(None),
+                or_(
+                    AppointmentSeriesModel.materialized_until.is_(None),
+                    AppointmentSeriesModel.materialized_until
+                    < AppointmentSeriesModel.ends_on,
+                ),
+            )
+        )
+        return list(result)
+
+    @staticmethod
+    def _virtual_occurrences(
+        series: list[AppointmentSeriesModel],
+        date_filter: FutureDateFilter | None,
+    ) -> Iterator[AppointmentModel]:
+        """
+        Ocorrências virtuais de todas as séries, do mais recente ao mais
+        antigo, geradas sob demanda.
+        """
+        in_range = None
+        if date_filter is not None and date_filter in FUTURE_DATE_FILTERS:
+            # Mesma comparação que o banco faz entre date e timestamptz.
+            now = datetime.now(UTC)
+            end = now + FUTURE_DATE_FILTERS[date_filter]
+
+            def in_range(item: AppointmentModel) -> bool:
+                return now <= datetime.combine(item.date, time.min, UTC) <= end
+
+        streams = [
+            build_occurrences(
+                item, after=item.materialized_until, virtual=True
+            )
+            for item in series
+        ]
+        occurrences = heapq.merge(*streams, key=_listing_key, reverse=True)
+        if in_range is None:
+            return occurrences
+        return filter(in_range, occurrences)
+
+    async def _paginate_with_occurrences(
+        self,
+        stmt: Select,
+        params: Params,
+        series: list[AppointmentSeriesModel],
+        date_filter: FutureDateFilter | None,
+    ) -> Page[AppointmentModel]:
+        """
+        Pagina a junção das linhas do banco com as ocorrências virtuais.
+        Só as chaves (created_at, id) das linhas são lidas em streaming até
+        o fim da página; os agendamentos da página são carregados depois,
+        em uma consulta pelos ids.
+        """
+        raw_params = params.to_raw_params()
+        stmt = stmt.order_by(None)
+        total = await self.session.scalar(
+            select(func.count()).select_from(stmt.subquery())
+        )
+        total += sum(1 for _ in self._virtual_occurrences(series, date_filter))
+
+        keys = await self.session.stream(
+            stmt
+            .with_only_columns(
+                AppointmentModel.created_at, AppointmentModel.id
+            )
+            .order_by(
+                AppointmentModel.created_at.desc(), AppointmentModel.id.desc()
+            )
+            .limit(raw_params.offset + raw_params.limit)
+            .execution_options(yield_per=raw_params.limit)
+        )
+        merged = _merge_occurrences(
+            keys, self._virtual_occurrences(series, date_filter)
+        )
+        page = []
+        position = 0
+        async for item in merged:
+            if position >= raw_params.offset:
+                page.append(item)
+            position += 1
+            if len(page) == raw_params.limit:
+                break
+        await merged.aclose()
+        await keys.close()
+
+        ids = [
+            item.id for item in page if not isinstance(item, AppointmentModel)
+        ]
+        rows = {}
+        if ids:
+            result = await self.session.scalars(
+                select(AppointmentModel)
+                .options(selectinload(AppointmentModel.services))
+                .where(AppointmentModel.id.in_(ids))
+            )
+            rows = {row.id: row for row in result}
+        items = [
+            item if isinstance(item, AppointmentModel) else rows[item.id]
+            for item in page
+        ]
+        items = await apply_items_transformer(items, async_=True)
+        return create_page(items, total=total, params=params)
+
+    async def cancel_by_series(
+        self,
+        series_id: UUID,
+        start: date,
+        cancel_reason: str,
+        cancelled_at: datetime,
+    ) -> int:
+        """
+        Cancela, em um único UPDATE e sem commit, as ocorrências ativas já
+        materializadas da série a partir de ``start``.
+        """
+        result = await self.session.execute(
+            update(AppointmentModel)
+            .where(
+                AppointmentModel.series_id == series_id,
+                AppointmentModel.date >= start,
+                AppointmentModel.status.in_([
+                    AppointmentStatus.PENDING,
+                    AppointmentStatus.CONFIRMED,
+                ]),
+            )
+            .values(
+                status=AppointmentStatus.CANCELLED,
+                cancel_reason=cancel_reason,
+                cancelled_at=cancelled_at,
+                version=AppointmentModel.version + 1,
+            )
+            .returning(AppointmentModel.admin_id, AppointmentModel.date)
+        )
+        rows = result.all()
+        track_availability_changes(
+            self.session.sync_session,
+            [(row.admin_id, row.date) for row in rows if row.admin_id],
+        )
+        return len(rows)
+
+    async def get_all_by_cursor(
+        self,
+        params: CursorParams,
+        client_id: UUID | None = None,
+        admin_id: UUID | None = None,
+        status: AppointmentStatus | None = None,
+        date_filter: FutureDateFilter | None = None,
+    ) -> CursorPage[AppointmentModel]:
+        stmt = self._list_stmt(client_id, admin_id, status, date_filter)
+        return await keyset_paginate(
+            self.session,
+            stmt,
+            params,
+            (AppointmentModel.created_at, AppointmentModel.id),
+            descending=True,
+        )
@@ -0,0 +1,143 @@
+from datetime import date
+from uuid import UUID
+
+from sqlalchemy import (
+    Date,
+    Select,
+    String,
+    and_,
+    case,
+    cast,
+    func,
+    literal_column,
+    select,
+    true,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from enums import AppointmentStatus, UserRole
+from models import (
+    AdminDailyOverrideModel,
+    AdminWeeklyCapacityModel,
+    AppointmentModel,
+    UserModel,
+)
+from repositories.interfaces.availability_interface import (
+    IAvailabilityRepository,
+)
+from schemas.availability_schema import AdminDayAvailability
+
+
+def build_availability_query(
+    start: date,
+    end: date,
+    admin_ids: list[UUID] | None = None,
+) -> Select:
+    """
+    Monta a consulta que resolve capacidade, ocupação e vagas restantes
+    de cada admin em cada dia do intervalo, em um único SELECT.
+
+    A capacidade efetiva vem do override diário quando existe (zero se o
+    admin estiver indisponível) e, caso contrário, da capacidade semanal.
+    """
+    days = select(
+        cast(
+            func.generate_series(
+                cast(start, Date),
+                cast(end, Date),
+                literal_column("interval '1 day'"),
+            ),
+            Date,
+        ).label("day")
+    ).subquery("days")
+
+    admins = select(UserModel.id.label("admin_id")).where(
+        UserModel.role == UserRole.ADMIN
+    )
+    if admin_ids is not None:
+        admins = admins.where(UserModel.id.in_(admin_ids))
+    admins = admins.subquery("admins")
+
+    booked = (
+        select(
+            AppointmentModel.admin_id,
+            AppointmentModel.date,
+            func.count().label("booked"),
+        )
+        .where(
+            AppointmentModel.admin_id.in_(select(admins.c.admin_id)),
+            AppointmentModel.status != AppointmentStatus.CANCELLED,
+            AppointmentModel.date.between(start, end),
+        )
+        .group_by(AppointmentModel.admin_id, AppointmentModel.date)
+        .subquery("booked")
+    )
+
+    capacity = case(
+        (
+            AdminDailyOverrideModel.id.is_not(None),
+            case(
+                (
+                    AdminDailyOverrideModel.is_available,
+                    AdminDailyOverrideModel.limit,
+                ),
+                else_=0,
+            ),
+        ),
+        else_=func.coalesce(AdminWeeklyCapacityModel.limit, 0),
+    )
+    booked_count = func.coalesce(booked.c.booked, 0)
+
+    return (
+        select(
+            admins.c.admin_id,
+            days.c.day.label("date"),
+            capacity.label("capacity"),
+            booked_count.label("booked"),
+            func.greatest(capacity - booked_count, 0).label("remaining"),
+        )
+        .select_from(admins)
+        .join(days, true())
+        .outerjoin(
+            AdminWeeklyCapacityModel,
+            and_(
+                AdminWeeklyCapacityModel.admin_id == admins.c.admin_id,
+                cast(AdminWeeklyCapacityModel.week_day, String)
+                == func.to_char(days.c.day, "FMday"),
+            ),
+        )
+        .outerjoin(
+            AdminDailyOverrideModel,
+            and_(
+                AdminDailyOverrideModel.admin_id == admins.c.admin_id,
+                AdminDailyOverrideModel.date_modified == days.c.day,
+            ),
+        )
+        .outerjoin(
+            booked,
+            and_(
+                booked.c.admin_id == admins.c.admin_id,
+                booked.c.date == days.c.day,
+            ),
+        )
+        .order_by(admins.c.admin_id, days.c.day)
+    )
+
+
+class AvailabilityRepository(IAvailabilityRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def get_range(
+        self,
+        start: date,
+        end: date,
+        admin_ids: list[UUID] | None = None,
+    ) -> list[AdminDayAvailability]:
+        result = await self.session.execute(
+            build_availability_query(start, end, admin_ids)
+        )
+        return [
+            AdminDayAvailability.model_validate(row)
+            for row in result.mappings()
+        ]
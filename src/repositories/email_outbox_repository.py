@@ -0,0 +1,106 @@
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from enums.email_outbox_status import EmailOutboxStatus
+from models import EmailOutboxModel
+from repositories.interfaces.email_outbox_interface import (
+    IEmailOutboxRepository,
+)
+
+
+class EmailOutboxRepository(IEmailOutboxRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    def add(self, message: EmailOutboxModel) -> None:
+        """
+        Adiciona a mensagem à sessão sem commit: ela é gravada junto com
+        a operação que a originou, na mesma transação.
+        """
+        self.session.add(message)
+
+    async def claim_batch(
+        self, limit: int, lease_seconds: int
+    ) -> list[EmailOutboxModel]:
+        """
+        Reserva até ``limit`` mensagens vencidas, contando a tentativa e
+        adiando ``next_attempt_at`` pelo lease. Workers concorrentes pulam
+        as linhas já travadas, e a transação termina antes do envio.
+        """
+        claimable = (
+            select(EmailOutboxModel.id)
+            .where(
+                EmailOutboxModel.status == EmailOutboxStatus.PENDING,
+                EmailOutboxModel.next_attempt_at <= func.now(),
+            )
+            .order_by(EmailOutboxModel.next_attempt_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        result = await self.session.scalars(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(claimable.scalar_subquery()))
+            .values(
+                attempts=EmailOutboxModel.attempts + 1,
+                next_attempt_at=func.now()
+                + func.make_interval(0, 0, 0, 0, 0, 0, lease_seconds),
+            )
+            .returning(EmailOutboxModel)
+        )
+        messages = list(result)
+        await self.session.commit()
+        return messages
+
+    async def due_backlog(self) -> tuple[int, float]:
+        """
+        Quantidade de mensagens vencidas e há quantos segundos a mais
+        antiga aguarda. Mensagens reservadas ficam de fora até o lease.
+        """
+        oldest_due = func.min(EmailOutboxModel.next_attempt_at)
+        result = await self.session.execute(
+            select(
+                func.count(),
+                func.coalesce(
+                    func.extract("epoch", func.now() - oldest_due), 0
+                ),
+            ).where(
+                EmailOutboxModel.status == EmailOutboxStatus.PENDING,
+                EmailOutboxModel.next_attempt_at <= func.now(),
+            )
+        )
+        due, lag = result.one()
+        return due, float(lag)
+
+    async def mark_sent(self, ids: list[UUID]) -> None:
+        await self.session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id.in_(ids))
+            .values(
+                status=EmailOutboxStatus.SENT,
+                sent_at=func.now(),
+                last_error=None,
+            )
+        )
+        await self.session.commit()
+
+    async def mark_failed(
+        self, id: UUID, error: str, retry_at: datetime | None
+    ) -> None:
+        """
+        Registra a falha. Sem ``retry_at`` a mensagem é abandonada;
+        caso contrário volta para a fila nesse horário.
+        """
+        values = {"last_error": error}
+        if retry_at is None:
+            values["status"] = EmailOutboxStatus.FAILED
+        else:
+            values["next_attempt_at"] = retry_at
+        await self.session.execute(
+            update(EmailOutboxModel)
+            .where(EmailOutboxModel.id == id)
+            .values(**values)
+        )
+        await self.session.commit()
@@ -0,0 +1,125 @@
+from uuid import UUID
+
+from sqlalchemy import Row, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from models import IdempotencyKeyModel
+from repositories.interfaces.idempotency_keys_interface import (
+    IIdempotencyKeysRepository,
+)
+
+
+class IdempotencyKeysRepository(IIdempotencyKeysRepository):
+    def __init__(self, session: AsyncSession):
+        self.session = session
+
+    async def claim(
+        self, user_id: UUID, key: str, request_hash: str, lease_seconds: int
+    ) -> UUID | None:
+        """
+        Reserva a chave sem commit e retorna o id da reserva: ela é gravada
+        junto com a operação e desaparece se a operação falhar. Enquanto a
+        transação que reservou a chave não termina, o índice único faz
+        outra reserva da mesma chave esperar.
+
+        A reserva vence em ``lease_seconds``, e não no TTL da chave: se a
+        operação fizer commit sem gravar a resposta, a chave volta a ficar
+        livre depois desse prazo.
+
+        ``DO NOTHING`` não trava a linha existente: quem espera pela
+        resposta não bloqueia a gravação dela.
+        """
+        result = await self.session.execute(
+            insert(IdempotencyKeyModel)
+            .values(
+                user_id=user_id,
+                key=key,
+                request_hash=request_hash,
+                expires_at=func.now()
+                + func.make_interval(0, 0, 0, 0, 0, 0, lease_seconds),
+            )
+            .on_conflict_do_nothing(
+                index_elements=[
+                    IdempotencyKeyModel.user_id,
+                    IdempotencyKeyModel.key,
+                ]
+            )
+            .returning(IdempotencyKeyModel.id)
+        )
+        return result.scalar_one_or_none()
+
+    async def delete_expired(self, user_id: UUID, key: str) -> None:
+        """Libera a chave vencida para uma nova reserva."""
+        await self.session.execute(
+            delete(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.user_id == user_id,
+                IdempotencyKeyModel.key == key,
+                IdempotencyKeyModel.expires_at <= func.now(),
+            )
+        )
+
+    async def get(self, user_id: UUID, key: str) -> Row | None:
+        result = await self.session.execute(
+            select(
+                IdempotencyKeyModel.request_hash,
+                IdempotencyKeyModel.response_status,
+                IdempotencyKeyModel.response_body,
+                IdempotencyKeyModel.response_etag,
+            ).where(
+                IdempotencyKeyModel.user_id == user_id,
+                IdempotencyKeyModel.key == key,
+                IdempotencyKeyModel.expires_at > func.now(),
+            )
+        )
+        return result.first()
+
+    async def save_response(  # noqa: PLR0913, PLR0917
+        self,
+        id: UUID,
+        status_code: int,
+        body: bytes,
+        etag: str | None,
+        ttl_seconds: int,
+    ) -> None:
+        """
+        Grava a resposta na reserva ``id`` e estende a validade para o TTL
+        da chave, sem commit: a resposta é confirmada com a operação. Uma
+        reserva cujo prazo venceu e foi retomada por outra requisição não
+        existe mais, e nada é gravado.
+        """
+        await self.session.execute(
+            update(IdempotencyKeyModel)
+            .where(
+                IdempotencyKeyModel.id == id,
+                IdempotencyKeyModel.response_status.is_(None),
+            )
+            .values(
+                response_status=status_code,
+                response_body=body,
+                response_etag=etag,
+                expires_at=func.now()
+                + func.make_interval(0, 0, 0, 0, 0, 0, ttl_seconds),
+            )
+        )
+
+    async def release(self) -> None:
+        """
+        Encerra a transação corrente e devolve a conexão ao pool. Só é
+        usada enquanto esta sessão não reservou nada.
+        """
+        await self.session.rollback()
+
+    async def purge_expired(self, limit: int) -> int:
+        expired = (
+            select(IdempotencyKeyModel.id)
+            .where(IdempotencyKeyModel.expires_at <= func.now())
+            .limit(limit)
+        )
+        result = await self.session.execute(
+            delete(IdempotencyKeyModel).where(
+                IdempotencyKeyModel.id.in_(expired.scalar_subquery())
+            )
+        )
+        await self.session.commit()
+        return result.rowcount
@@ -2,34 +2,34 @@ from abc import ABC, abstractmethod
 from uuid import UUID
 
 from enums import WeekDay
-from models.admin_daily_limit_model import AdminDailyLimitModel
+from models.admin_weekly_capacity_model import AdminWeeklyCapacityModel
 
 
 class IAdminDailyLimitRepository(ABC):
     @abstractmethod
-    async def get_by_id(self, id: UUID) -> AdminDailyLimitModel | None:
+    async def get_by_id(self, id: UUID) -> AdminWeeklyCapacityModel | None:
         pass
 
     @abstractmethod
     async def get_by_week_day(
         self, admin_id: UUID, week_day: WeekDay
-    ) -> AdminDailyLimitModel | None:
+    ) -> AdminWeeklyCapacityModel | None:
         pass
 
     @abstractmethod
-    async def get_all(self) -> list[AdminDailyLimitModel]:
+    async def get_all(self) -> list[AdminWeeklyCapacityModel]:
         pass
 
     @abstractmethod
     async def save(
-        self, admin_daily_limit: AdminDailyLimitModel
-    ) -> AdminDailyLimitModel:
+        self, admin_daily_limit: AdminWeeklyCapacityModel
+    ) -> AdminWeeklyCapacityModel:
         pass
 
     @abstractmethod
     async def update(
-        self, admin_daily_limit: AdminDailyLimitModel
-    ) -> AdminDailyLimitModel:
+        self, admin_daily_limit: AdminWeeklyCapacityModel
+    ) -> AdminWeeklyCapacityModel:
         pass
 
     @abstractmethod
@@ -0,0 +1,29 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from uuid import UUID
+
+from models import AppointmentSeriesModel
+
+
+class IAppointmentSeriesRepository(ABC):
+    @abstractmethod
+    async def add(
+        self, series: AppointmentSeriesModel
+    ) -> AppointmentSeriesModel:
+        pass
+
+    @abstractmethod
+    async def update(
+        self, series: AppointmentSeriesModel
+    ) -> AppointmentSeriesModel:
+        pass
+
+    @abstractmethod
+    async def get_for_update(self, id: UUID) -> AppointmentSeriesModel | None:
+        pass
+
+    @abstractmethod
+    async def claim_due(
+        self, window_end: date, limit: int
+    ) -> list[AppointmentSeriesModel]:
+        pass
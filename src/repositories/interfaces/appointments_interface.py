@@ -1,29 +1,83 @@
 from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime
 from uuid import UUID
 
 from fastapi_pagination import Page, Params
+from sqlalchemy import Row
 
 from enums import AppointmentStatus, FutureDateFilter
 from models import AppointmentModel
+from schemas.appointments_schema import AppointmentVersion
+from schemas.pagination_schema import CursorPage, CursorParams
+
+# Roda depois do flush e antes do commit, na mesma transação da escrita.
+BeforeCommit = Callable[[], Awaitable[None]]
 
 
 class IAppointmentRepository(ABC):
     @abstractmethod
-    async def save(self, appointment: AppointmentModel) -> AppointmentModel:
+    async def save(
+        self,
+        appointment: AppointmentModel,
+        before_commit: BeforeCommit | None = None,
+    ) -> AppointmentModel:
+        pass
+
+    @abstractmethod
+    async def save_all(
+        self, appointments: list[AppointmentModel]
+    ) -> list[AppointmentModel]:
         pass
 
     @abstractmethod
-    async def update(self, appointment: AppointmentModel) -> AppointmentModel:
+    async def update(
+        self,
+        appointment: AppointmentModel,
+        before_commit: BeforeCommit | None = None,
+    ) -> AppointmentModel:
         pass
 
     @abstractmethod
     async def delete(self, appointment: AppointmentModel) -> None:
         pass
 
+    @abstractmethod
+    async def lock_admin_day(self, admin_id: UUID, day: date) -> None:
+        pass
+
+    @abstractmethod
+    async def lock_admin_days(self, slots: list[tuple[UUID, date]]) -> None:
+        pass
+
+    @abstractmethod
+    async def get_for_transition(self, ids: list[UUID]) -> list[Row]:
+        pass
+
+    @abstractmethod
+    async def confirm_many(
+        self, versions: dict[UUID, int], admin_id: UUID
+    ) -> list[Row]:
+        pass
+
+    @abstractmethod
+    async def cancel_many(
+        self,
+        ids: list[UUID],
+        cancel_reason: str,
+        client_id: UUID | None = None,
+        admin_id: UUID | None = None,
+    ) -> list[Row]:
+        pass
+
     @abstractmethod
     async def get_by_id(self, id: UUID) -> AppointmentModel | None:
         pass
 
+    @abstractmethod
+    async def get_version(self, id: UUID) -> AppointmentVersion | None:
+        pass
+
     @abstractmethod
     async def get_all(
         self,
@@ -34,3 +88,24 @@ class IAppointmentRepository(ABC):
         date_filter: FutureDateFilter | None = None,
     ) -> Page[AppointmentModel]:
         pass
+
+    @abstractmethod
+    async def cancel_by_series(
+        self,
+        series_id: UUID,
+        start: date,
+        cancel_reason: str,
+        cancelled_at: datetime,
+    ) -> int:
+        pass
+
+    @abstractmethod
+    async def get_all_by_cursor(
+        self,
+        params: CursorParams,
+        client_id: UUID | None = None,
+        admin_id: UUID | None = None,
+        status: AppointmentStatus | None = None,
+        date_filter: FutureDateFilter | None = None,
+    ) -> CursorPage[AppointmentModel]:
+        pass
@@ -0,0 +1,16 @@
+from abc import ABC, abstractmethod
+from datetime import date
+from uuid import UUID
+
+from schemas.availability_schema import AdminDayAvailability
+
+
+class IAvailabilityRepository(ABC):
+    @abstractmethod
+    async def get_range(
+        self,
+        start: date,
+        end: date,
+        admin_ids: list[UUID] | None = None,
+    ) -> list[AdminDayAvailability]:
+        pass
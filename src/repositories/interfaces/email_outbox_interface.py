@@ -0,0 +1,31 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from uuid import UUID
+
+from models import EmailOutboxModel
+
+
+class IEmailOutboxRepository(ABC):
+    @abstractmethod
+    def add(self, message: EmailOutboxModel) -> None:
+        pass
+
+    @abstractmethod
+    async def claim_batch(
+        self, limit: int, lease_seconds: int
+    ) -> list[EmailOutboxModel]:
+        pass
+
+    @abstractmethod
+    async def due_backlog(self) -> tuple[int, float]:
+        pass
+
+    @abstractmethod
+    async def mark_sent(self, ids: list[UUID]) -> None:
+        pass
+
+    @abstractmethod
+    async def mark_failed(
+        self, id: UUID, error: str, retry_at: datetime | None
+    ) -> None:
+        pass
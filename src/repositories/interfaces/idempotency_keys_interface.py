@@ -0,0 +1,39 @@
+from abc import ABC, abstractmethod
+from uuid import UUID
+
+from sqlalchemy import Row
+
+
+class IIdempotencyKeysRepository(ABC):
+    @abstractmethod
+    async def claim(
+        self, user_id: UUID, key: str, request_hash: str, lease_seconds: int
+    ) -> UUID | None:
+        pass
+
+    @abstractmethod
+    async def delete_expired(self, user_id: UUID, key: str) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, user_id: UUID, key: str) -> Row | None:
+        pass
+
+    @abstractmethod
+    async def save_response(  # noqa: PLR0913, PLR0917
+        self,
+        id: UUID,
+        status_code: int,
+        body: bytes,
+        etag: str | None,
+        ttl_seconds: int,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    async def release(self) -> None:
+        pass
+
+    @abstractmethod
+    async def purge_expired(self, limit: int) -> int:
+        pass
@@ -5,6 +5,7 @@ from fastapi_pagination import Page, Params
 
 from enums import DateFilter
 from models import UserModel
+from schemas.pagination_schema import CursorPage, CursorParams
 
 
 class IUserRepository(ABC):
@@ -28,6 +29,10 @@ class IUserRepository(ABC):
     async def get_by_id(self, id: UUID) -> UserModel | None:
         pass
 
+    @abstractmethod
+    async def release_connection(self) -> None:
+        pass
+
     @abstractmethod
     async def get_all_clients(
         self,
@@ -37,3 +42,13 @@ class IUserRepository(ABC):
         date_filter: DateFilter | None = None,
     ) -> Page[UserModel]:
         pass
+
+    @abstractmethod
+    async def get_all_clients_by_cursor(
+        self,
+        params: CursorParams,
+        name: str | None = None,
+        email: str | None = None,
+        date_filter: DateFilter | None = None,
+    ) -> CursorPage[UserModel]:
+        pass
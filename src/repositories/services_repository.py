@@ -5,7 +5,6 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from models import ServiceModel
 from repositories.interfaces.services_interface import IServiceRepository
-from schemas.services_schema import ServiceUpdate
 
 
 class ServicesRepository(IServiceRepository):
@@ -37,11 +36,11 @@ class ServicesRepository(IServiceRepository):
         await self.session.refresh(service)
         return service
 
-    async def update(self, id: UUID, data: ServiceUpdate) -> ServiceModel:
-        self.session.add(data)
+    async def update(self, service: ServiceModel) -> ServiceModel:
+        self.session.add(service)
         await self.session.commit()
-        await self.session.refresh(data)
-        return data
+        await self.session.refresh(service)
+        return service
 
     async def delete(self, data: ServiceModel) -> None:
         await self.session.delete(data)
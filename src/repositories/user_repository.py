@@ -3,13 +3,15 @@ from uuid import UUID
 
 from fastapi_pagination import Page, Params
 from fastapi_pagination.ext.sqlalchemy import paginate
-from sqlalchemy import select
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from enums import DateFilter, UserRole
 from models import UserModel
 from repositories.interfaces.user_interface import IUserRepository
+from schemas.pagination_schema import CursorPage, CursorParams
 from utils import DATE_FILTERS
+from utils.cursor import keyset_paginate
 from utils.date_filters import get_date_filter
 
 
@@ -36,6 +38,14 @@ class UserRepository(IUserRepository):
         )
         return result.scalar_one_or_none()
 
+    async def release_connection(self) -> None:
+        """
+        Encerra a transação de leitura e devolve a conexão ao pool, para
+        que ela não fique presa durante trabalho demorado fora do banco.
+        Os objetos carregados continuam utilizáveis.
+        """
+        await self.session.commit()
+
     async def update(self, user: UserModel) -> UserModel:
         merged_user = await self.session.merge(user)
         await self.session.commit()
@@ -46,13 +56,12 @@ class UserRepository(IUserRepository):
         await self.session.delete(user)
         await self.session.commit()
 
-    async def get_all_clients(
-        self,
-        params: Params,
+    @staticmethod
+    def _clients_stmt(
         name: str | None = None,
         email: str | None = None,
         date_filter: DateFilter | None = None,
-    ) -> Page[UserModel]:
+    ) -> Select:
         stmt = select(UserModel).where(UserModel.role == UserRole.CLIENT)
 
         if name:
@@ -67,5 +76,30 @@ class UserRepository(IUserRepository):
                 >= datetime.now(UTC) - date_filter_timedelta
             )
 
+        return stmt
+
+    async def get_all_clients(
+        self,
+        params: Params,
+        name: str | None = None,
+        email: str | None = None,
+        date_filter: DateFilter | None = None,
+    ) -> Page[UserModel]:
+        stmt = self._clients_stmt(name, email, date_filter)
         stmt = stmt.order_by(UserModel.created_at)
         return await paginate(self.session, stmt, params)
+
+    async def get_all_clients_by_cursor(
+        self,
+        params: CursorParams,
+        name: str | None = None,
+        email: str | None = None,
+        date_filter: DateFilter | None = None,
+    ) -> CursorPage[UserModel]:
+        stmt = self._clients_stmt(name, email, date_filter)
+        return await keyset_paginate(
+            self.session,
+            stmt,
+            params,
+            (UserModel.created_at, UserModel.id),
+        )
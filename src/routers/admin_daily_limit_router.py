@@ -3,22 +3,27 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, status
 
-from models import UserModel
+from dependencies.cache_dependencies import NO_STORE, cache_control
 from routers.user_router import require_admin_user
 from schemas.admin_daily_limit_schema import (
     AdminDailyLimitCreate,
     AdminDailyLimitRead,
     AdminDailyLimitUpdate,
 )
+from schemas.user_schema import CurrentUser
 from services.admin_daily_limit_service import (
     AdminDailyLimitService,
+    get_admin_daily_limit_read_service,
     get_admin_daily_limit_service,
 )
 
 protected_admin_daily_router = APIRouter(
     prefix="/admin_daily_limits",
     tags=["Admin Daily Limits"],
-    dependencies=[Depends(require_admin_user)],
+    dependencies=[
+        Depends(require_admin_user),
+        Depends(cache_control(NO_STORE)),
+    ],
 )
 
 
@@ -31,7 +36,7 @@ async def get_all_admin_daily_limits(
     service: Annotated[
         AdminDailyLimitService,
         Depends(
-            get_admin_daily_limit_service,
+            get_admin_daily_limit_read_service,
         ),
     ],
 ):
@@ -48,7 +53,7 @@ async def get_admin_daily_limit_by_id(
     service: Annotated[
         AdminDailyLimitService,
         Depends(
-            get_admin_daily_limit_service,
+            get_admin_daily_limit_read_service,
         ),
     ],
 ):
@@ -62,7 +67,7 @@ async def get_admin_daily_limit_by_id(
 )
 async def create_admin_daily_limit(
     admin_daily_limit: AdminDailyLimitCreate,
-    current_user: Annotated[UserModel, Depends(require_admin_user)],
+    current_user: Annotated[CurrentUser, Depends(require_admin_user)],
     service: Annotated[
         AdminDailyLimitService,
         Depends(
@@ -1,37 +1,97 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Depends,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
 from fastapi_pagination import Page, Params
 
 from dependencies.auth_dependencies import get_current_user, require_admin_user
-from dependencies.pagination_dependencies import get_pagination_params
+from dependencies.cache_dependencies import PRIVATE_REVALIDATE, cache_control
+from dependencies.idempotency_dependencies import (
+    IdempotentRequest,
+    get_idempotent_request,
+)
+from dependencies.pagination_dependencies import (
+    get_cursor_params,
+    get_pagination_params,
+)
 from enums import AppointmentStatus, FutureDateFilter, UserRole
-from models import UserModel
+from schemas.appointment_series_schema import (
+    AppointmentSeriesCreate,
+    AppointmentSeriesRead,
+    appointment_series_adapter,
+)
 from schemas.appointments_schema import (
+    AppointmentBatchCancel,
+    AppointmentBatchConfirm,
+    AppointmentBatchResult,
+    AppointmentBulkCreate,
+    AppointmentBulkResult,
     AppointmentCancel,
     AppointmentClientUpdate,
     AppointmentCreate,
     AppointmentRead,
+    AppointmentVersion,
+    appointment_adapter,
+    appointment_batch_result_adapter,
+    appointment_bulk_result_adapter,
+    appointment_cursor_page_adapter,
+    appointment_page_adapter,
+)
+from schemas.pagination_schema import CursorPage, CursorParams
+from schemas.user_schema import CurrentUser
+from services.appointment_series_service import (
+    AppointmentSeriesService,
+    get_appointment_series_service,
 )
 from services.appointments_service import (
     AppointmentsService,
+    get_appointments_read_service,
     get_appointments_service,
 )
+from utils.http_cache import is_not_modified, not_modified
+from utils.responses import json_response
 
 protected_user_router = APIRouter(
     prefix="/appointments",
     tags=["appointments"],
-    dependencies=[Depends(get_current_user)],
+    dependencies=[
+        Depends(get_current_user),
+        Depends(cache_control(PRIVATE_REVALIDATE)),
+    ],
 )
 
 protected_admin_router = APIRouter(
     prefix="/appointments",
     tags=["appointments"],
-    dependencies=[Depends(require_admin_user)],
+    dependencies=[
+        Depends(require_admin_user),
+        Depends(cache_control(PRIVATE_REVALIDATE)),
+    ],
 )
 
 
+def _ensure_can_view(
+    current_user: CurrentUser,
+    appointment: AppointmentVersion | AppointmentRead,
+) -> None:
+    if current_user.role != UserRole.ADMIN and current_user.id not in {
+        appointment.client_id,
+        appointment.admin_id,
+    }:
+        raise HTTPException(
+            status_code=403,
+            detail="You don't have permission to view this appointment",
+        )
+
+
 @protected_user_router.post(
     "/",
     response_model=AppointmentRead,
@@ -39,10 +99,148 @@ protected_admin_router = APIRouter(
 )
 async def create_appointment(
     appointment: AppointmentCreate,
-    current_user: Annotated[UserModel, Depends(get_current_user)],
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: Annotated[AppointmentsService, Depends(get_appointments_service)],
+    idempotency: Annotated[IdempotentRequest, Depends(get_idempotent_request)],
+):
+    """
+    Cria um agendamento. Com ``Idempotency-Key``, uma repetição da mesma
+    requisição devolve a resposta original sem criar outro.
+    """
+    if idempotency.replay is not None:
+        return idempotency.replay
+
+    def render(created: AppointmentRead) -> Response:
+        return json_response(
+            appointment_adapter.dump_json(created),
+            response,
+            status.HTTP_201_CREATED,
+        )
+
+    created = await service.create_appointment(
+        appointment,
+        current_user.id,
+        appointment.admin_id,
+        before_commit=idempotency.before_commit(render),
+    )
+    return render(created)
+
+
+@protected_user_router.post(
+    "/bulk",
+    response_model=AppointmentBulkResult,
+    status_code=status.HTTP_201_CREATED,
+    responses={
+        status.HTTP_207_MULTI_STATUS: {
+            "model": AppointmentBulkResult,
+            "description": "Some items failed; see each item's status_code",
+        }
+    },
+)
+async def create_appointments_bulk(
+    bulk: AppointmentBulkCreate,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     service: Annotated[AppointmentsService, Depends(get_appointments_service)],
 ):
-    return await service.create_appointment(appointment, current_user.id)
+    """
+    Cria vários agendamentos do usuário em uma transação. Responde 201 se
+    todos foram criados e 207 se algum falhou, com o resultado de cada
+    item na ordem do pedido.
+    """
+    result = await service.create_appointments_bulk(
+        bulk.items, current_user.id
+    )
+    return json_response(
+        appointment_bulk_result_adapter.dump_json(result),
+        response,
+        status.HTTP_207_MULTI_STATUS
+        if result.failed
+        else status.HTTP_201_CREATED,
+    )
+
+
+@protected_user_router.post(
+    "/series",
+    response_model=AppointmentSeriesRead,
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_appointment_series(
+    series: AppointmentSeriesCreate,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: Annotated[
+        AppointmentSeriesService, Depends(get_appointment_series_service)
+    ],
+):
+    """
+    Cria uma série recorrente do usuário. As ocorrências das próximas
+    semanas viram agendamentos; as seguintes aparecem na listagem como
+    virtuais até entrarem na janela.
+    """
+    created = await service.create_series(series, current_user.id)
+    return json_response(
+        appointment_series_adapter.dump_json(created),
+        response,
+        status.HTTP_201_CREATED,
+    )
+
+
+@protected_user_router.post(
+    "/series/{id}/cancel",
+    response_model=AppointmentSeriesRead,
+    status_code=status.HTTP_200_OK,
+)
+async def cancel_appointment_series(
+    id: UUID,
+    cancel_data: AppointmentCancel,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: Annotated[
+        AppointmentSeriesService, Depends(get_appointment_series_service)
+    ],
+):
+    """Encerra a série e cancela as ocorrências futuras já geradas."""
+    cancelled = await service.cancel_series(
+        id, cancel_data.cancel_reason, current_user.id
+    )
+    return json_response(
+        appointment_series_adapter.dump_json(cancelled), response
+    )
+
+
+@protected_user_router.get(
+    "/cursor",
+    response_model=CursorPage[AppointmentRead],
+    status_code=status.HTTP_200_OK,
+)
+async def get_all_appointments_by_cursor(  # noqa: PLR0913, PLR0917
+    params: Annotated[CursorParams, Depends(get_cursor_params)],
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: Annotated[
+        AppointmentsService, Depends(get_appointments_read_service)
+    ],
+    status: AppointmentStatus | None = None,
+    date_filter: FutureDateFilter | None = None,
+):
+    """Lista agendamentos paginando por cursor (sem OFFSET)."""
+    client_id = (
+        None if current_user.role == UserRole.ADMIN else current_user.id
+    )
+    admin_id = current_user.id if current_user.role == UserRole.ADMIN else None
+
+    page = await service.get_all_appointments_by_cursor(
+        params=params,
+        client_id=client_id,
+        admin_id=admin_id,
+        status=status,
+        date_filter=date_filter,
+    )
+    return json_response(
+        appointment_cursor_page_adapter.dump_json(page), response
+    )
 
 
 @protected_user_router.get(
@@ -52,21 +250,26 @@ async def create_appointment(
 )
 async def get_appointment_by_id(
     id: UUID,
-    current_user: Annotated[UserModel, Depends(get_current_user)],
+    request: Request,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     service: Annotated[AppointmentsService, Depends(get_appointments_service)],
 ):
-    """Busca um appointment por ID."""
-    appointment = await service.get_appointment_by_id(id)
+    """
+    Busca um appointment por ID. Com If-None-Match, compara o ETag usando
+    só a versão do agendamento e responde 304 sem carregá-lo.
+    """
+    if "if-none-match" in request.headers:
+        version = await service.get_appointment_version(id)
+        _ensure_can_view(current_user, version)
+        etag = service.get_appointment_etag(version)
+        if is_not_modified(request, etag):
+            return not_modified(response, etag)
 
-    if current_user.role != UserRole.ADMIN and current_user.id not in {
-        appointment.client_id,
-        appointment.admin_id,
-    }:
-        raise HTTPException(
-            status_code=403,
-            detail="You don't have permission to view this appointment",
-        )
-    return appointment
+    appointment = await service.get_appointment_by_id(id)
+    _ensure_can_view(current_user, appointment)
+    response.headers["ETag"] = service.get_appointment_etag(appointment)
+    return json_response(appointment_adapter.dump_json(appointment), response)
 
 
 @protected_user_router.get(
@@ -74,10 +277,13 @@ async def get_appointment_by_id(
     response_model=Page[AppointmentRead],
     status_code=status.HTTP_200_OK,
 )
-async def get_all_appointments(
+async def get_all_appointments(  # noqa: PLR0913, PLR0917
     params: Annotated[Params, Depends(get_pagination_params)],
-    current_user: Annotated[UserModel, Depends(get_current_user)],
-    service: Annotated[AppointmentsService, Depends(get_appointments_service)],
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: Annotated[
+        AppointmentsService, Depends(get_appointments_read_service)
+    ],
     status: AppointmentStatus | None = None,
     date_filter: FutureDateFilter | None = None,
 ):
@@ -86,13 +292,14 @@ async def get_all_appointments(
     )
     admin_id = current_user.id if current_user.role == UserRole.ADMIN else None
 
-    return await service.get_all_appointments(
+    page = await service.get_all_appointments(
         params=params,
         client_id=client_id,
         admin_id=admin_id,
         status=status,
         date_filter=date_filter,
     )
+    return json_response(appointment_page_adapter.dump_json(page), response)
 
 
 @protected_user_router.put(
@@ -100,14 +307,63 @@ async def get_all_appointments(
     response_model=AppointmentRead,
     status_code=status.HTTP_200_OK,
 )
-async def update_appointment_by_client(
+async def update_appointment_by_client(  # noqa: PLR0913, PLR0917
     id: UUID,
     appointment: AppointmentClientUpdate,
-    current_user: Annotated[UserModel, Depends(get_current_user)],
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: Annotated[AppointmentsService, Depends(get_appointments_service)],
+    if_match: Annotated[str | None, Header()] = None,
+):
+    """
+    Atualiza um appointment (apenas cliente, apenas quando está PENDING).
+    Com If-Match, responde 412 se o agendamento mudou desde a leitura.
+    """
+    updated = await service.update_by_client(
+        id, appointment, current_user.id, if_match
+    )
+    response.headers["ETag"] = service.get_appointment_etag(updated)
+    return json_response(appointment_adapter.dump_json(updated), response)
+
+
+@protected_user_router.post(
+    "/cancel-batch",
+    response_model=AppointmentBatchResult,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_207_MULTI_STATUS: {
+            "model": AppointmentBatchResult,
+            "description": "Some ids failed; see each item's status_code",
+        }
+    },
+)
+async def cancel_appointments_batch(
+    batch: AppointmentBatchCancel,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     service: Annotated[AppointmentsService, Depends(get_appointments_service)],
 ):
-    """Atualiza um appointment (apenas cliente, apenas quando está PENDING)."""
-    return await service.update_by_client(id, appointment, current_user.id)
+    """
+    Cancela vários agendamentos de uma vez. Responde 200 se todos foram
+    cancelados e 207 se algum falhou, com o resultado de cada id na ordem
+    do pedido.
+    """
+    client_id = (
+        current_user.id if current_user.role == UserRole.CLIENT else None
+    )
+    admin_id = current_user.id if current_user.role == UserRole.ADMIN else None
+
+    result = await service.cancel_batch(
+        batch.ids,
+        batch.cancel_reason,
+        client_id=client_id,
+        admin_id=admin_id,
+    )
+    return json_response(
+        appointment_batch_result_adapter.dump_json(result),
+        response,
+        status.HTTP_207_MULTI_STATUS if result.failed else status.HTTP_200_OK,
+    )
 
 
 @protected_user_router.post(
@@ -115,23 +371,71 @@ async def update_appointment_by_client(
     response_model=AppointmentRead,
     status_code=status.HTTP_200_OK,
 )
-async def cancel_appointment(
+async def cancel_appointment(  # noqa: PLR0913, PLR0917
     id: UUID,
     cancel_data: AppointmentCancel,
-    current_user: Annotated[UserModel, Depends(get_current_user)],
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     service: Annotated[AppointmentsService, Depends(get_appointments_service)],
+    idempotency: Annotated[IdempotentRequest, Depends(get_idempotent_request)],
+    if_match: Annotated[str | None, Header()] = None,
 ):
+    """
+    Cancela um agendamento (cliente ou admin atribuído). Com If-Match,
+    responde 412 se o agendamento mudou desde a leitura.
+    """
+    if idempotency.replay is not None:
+        return idempotency.replay
 
     client_id = (
         current_user.id if current_user.role == UserRole.CLIENT else None
     )
     admin_id = current_user.id if current_user.role == UserRole.ADMIN else None
 
-    return await service.cancel_appointment(
+    def render(cancelled: AppointmentRead) -> Response:
+        response.headers["ETag"] = service.get_appointment_etag(cancelled)
+        return json_response(
+            appointment_adapter.dump_json(cancelled), response
+        )
+
+    cancelled = await service.cancel_appointment(
         appointment_id=id,
         cancel_reason=cancel_data.cancel_reason,
         client_id=client_id,
         admin_id=admin_id,
+        if_match=if_match,
+        before_commit=idempotency.before_commit(render),
+    )
+    return render(cancelled)
+
+
+@protected_admin_router.post(
+    "/confirm-batch",
+    response_model=AppointmentBatchResult,
+    status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_207_MULTI_STATUS: {
+            "model": AppointmentBatchResult,
+            "description": "Some ids failed; see each item's status_code",
+        }
+    },
+)
+async def confirm_appointments_batch(
+    batch: AppointmentBatchConfirm,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(require_admin_user)],
+    service: Annotated[AppointmentsService, Depends(get_appointments_service)],
+):
+    """
+    Confirma vários agendamentos para o admin. Responde 200 se todos
+    foram confirmados e 207 se algum falhou, com o resultado de cada id
+    na ordem do pedido.
+    """
+    result = await service.confirm_batch(batch.ids, current_user.id)
+    return json_response(
+        appointment_batch_result_adapter.dump_json(result),
+        response,
+        status.HTTP_207_MULTI_STATUS if result.failed else status.HTTP_200_OK,
     )
 
 
@@ -140,12 +444,34 @@ async def cancel_appointment(
     response_model=AppointmentRead,
     status_code=status.HTTP_200_OK,
 )
-async def confirm_appointment_by_admin(
+async def confirm_appointment_by_admin(  # noqa: PLR0913, PLR0917
     id: UUID,
-    current_user: Annotated[UserModel, Depends(require_admin_user)],
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(require_admin_user)],
     service: Annotated[AppointmentsService, Depends(get_appointments_service)],
+    idempotency: Annotated[IdempotentRequest, Depends(get_idempotent_request)],
+    if_match: Annotated[str | None, Header()] = None,
 ):
-    return await service.confirm_by_admin(id, current_user.id)
+    """
+    Confirma um agendamento para o admin. Com If-Match, responde 412 se o
+    agendamento mudou desde a leitura.
+    """
+    if idempotency.replay is not None:
+        return idempotency.replay
+
+    def render(confirmed: AppointmentRead) -> Response:
+        response.headers["ETag"] = service.get_appointment_etag(confirmed)
+        return json_response(
+            appointment_adapter.dump_json(confirmed), response
+        )
+
+    confirmed = await service.confirm_by_admin(
+        id,
+        current_user.id,
+        if_match,
+        before_commit=idempotency.before_commit(render),
+    )
+    return render(confirmed)
 
 
 @protected_admin_router.delete(
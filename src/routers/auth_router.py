@@ -11,15 +11,25 @@ from fastapi import (
 from fastapi.security import OAuth2PasswordRequestForm
 from starlette.responses import RedirectResponse
 
-from core.oauth import oauth
+from core.oauth import get_google_oauth
 from core.security import AUTH_COOKIE_NAME
 from core.settings import get_settings
-from src.dependencies.auth_dependencies import get_current_user
-from src.models import UserModel
-from src.schemas import TokenSchema, UserRead
-from src.services.auth_service import AuthService, get_auth_service
-
-auth_public_router = APIRouter(prefix="/auth", tags=["Auth"])
+from dependencies.auth_dependencies import get_current_user
+from dependencies.cache_dependencies import (
+    NO_STORE,
+    PRIVATE_REVALIDATE,
+    cache_control,
+)
+from schemas import CurrentUser, TokenSchema, UserRead
+from services.auth_service import AuthService, get_auth_service
+from services.user_service import UserService, get_user_service
+from utils.http_cache import is_not_modified, make_etag, not_modified
+
+auth_public_router = APIRouter(
+    prefix="/auth",
+    tags=["Auth"],
+    dependencies=[Depends(cache_control(NO_STORE))],
+)
 
 settings = get_settings()
 
@@ -52,19 +62,33 @@ async def login(
 
 
 @auth_public_router.get(
-    "/me", response_model=UserRead, status_code=status.HTTP_200_OK
+    "/me",
+    response_model=UserRead,
+    status_code=status.HTTP_200_OK,
+    dependencies=[Depends(cache_control(PRIVATE_REVALIDATE))],
 )
 async def get_me(
-    current_user: Annotated[UserModel, Depends(get_current_user)],
+    request: Request,
+    response: Response,
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    service: Annotated[UserService, Depends(get_user_service)],
 ):
-    """Retorna os dados do usuário autenticado."""
-    return current_user
+    """
+    Retorna os dados do usuário autenticado. O ETag vem do snapshot em
+    cache, então um 304 não consulta o banco.
+    """
+    etag = make_etag(current_user.id, current_user.updated_at.isoformat())
+    if is_not_modified(request, etag):
+        return not_modified(response, etag)
+    user = await service.get_user_by_id(current_user.id)
+    response.headers["ETag"] = make_etag(user.id, user.updated_at.isoformat())
+    return user
 
 
 @auth_public_router.get("/google")
 async def google_login(request: Request):
 
-    return await oauth.google.authorize_redirect(
+    return await get_google_oauth().authorize_redirect(
         request, redirect_uri=settings.GOOGLE_REDIRECT_URI
     )
 
@@ -74,14 +98,17 @@ async def google_callback(
     request: Request,
     auth_service: Annotated[AuthService, Depends(get_auth_service)],
 ):
-    token = await oauth.google.authorize_access_token(request)
+    google = get_google_oauth()
+    token = await google.authorize_access_token(request)
 
+    # As claims do ID token já foram validadas localmente com o JWKS em
+    # cache; o endpoint de userinfo só é chamado se faltar o email.
     claims = token.get("userinfo") or {}
 
-    if not claims:
-        userinfo_response = await oauth.google.get(
-            "https://openidconnect.googleapis.com/v1/userinfo",
-            token=token,
+    if not claims.get("email"):
+        metadata = await google.load_server_metadata()
+        userinfo_response = await google.get(
+            metadata["userinfo_endpoint"], token=token
         )
         if userinfo_response.is_success:
             claims = userinfo_response.json()
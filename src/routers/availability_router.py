@@ -0,0 +1,37 @@
+from datetime import date
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, Query, status
+
+from dependencies.auth_dependencies import get_current_user
+from dependencies.cache_dependencies import PRIVATE_REVALIDATE, cache_control
+from schemas.availability_schema import AvailabilityCalendarRead
+from services.availability_service import (
+    AvailabilityService,
+    get_availability_service,
+)
+
+protected_availability_router = APIRouter(
+    prefix="/appointments",
+    tags=["appointments"],
+    dependencies=[
+        Depends(get_current_user),
+        Depends(cache_control(PRIVATE_REVALIDATE)),
+    ],
+)
+
+
+@protected_availability_router.get(
+    "/availability",
+    response_model=AvailabilityCalendarRead,
+    status_code=status.HTTP_200_OK,
+)
+async def get_availability(
+    start: Annotated[date, Query(alias="from")],
+    end: Annotated[date, Query(alias="to")],
+    service: Annotated[AvailabilityService, Depends(get_availability_service)],
+    admin_id: UUID | None = None,
+):
+    """Vagas restantes por dia, de cada admin, no intervalo informado."""
+    return await service.get_calendar(start, end, admin_id)
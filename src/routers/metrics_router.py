@@ -0,0 +1,21 @@
+from typing import Annotated
+
+from fastapi import APIRouter, Depends, Response
+from prometheus_client import CONTENT_TYPE_LATEST
+
+from core.metrics import render_metrics
+from services.email_outbox_service import (
+    EmailOutboxService,
+    get_email_outbox_service,
+)
+
+metrics_router = APIRouter(tags=["Metrics"])
+
+
+@metrics_router.get("/metrics", include_in_schema=False)
+async def get_metrics(
+    service: Annotated[EmailOutboxService, Depends(get_email_outbox_service)],
+):
+    """Métricas no formato de exposição do Prometheus."""
+    await service.report_backlog()
+    return Response(render_metrics(), media_type=CONTENT_TYPE_LATEST)
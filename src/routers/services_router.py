@@ -1,17 +1,25 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Request, Response, status
 
 from dependencies.auth_dependencies import get_current_user, require_admin_user
+from dependencies.cache_dependencies import (
+    NO_STORE,
+    PRIVATE_REVALIDATE,
+    cache_control,
+)
 from schemas.services_schema import ServiceCreate, ServiceRead, ServiceUpdate
 from services.services_service import ServicesService, get_services_service
+from utils.http_cache import is_not_modified, not_modified
+from utils.responses import json_response
 
 public_services_router = APIRouter(
     prefix="/services",
     tags=["Services"],
     dependencies=[
         Depends(get_current_user),
+        Depends(cache_control(PRIVATE_REVALIDATE)),
     ],
 )
 services_router = APIRouter(
@@ -19,6 +27,7 @@ services_router = APIRouter(
     tags=["Services"],
     dependencies=[
         Depends(require_admin_user),
+        Depends(cache_control(NO_STORE)),
     ],
 )
 
@@ -77,6 +86,13 @@ async def get_service_by_id(
     status_code=status.HTTP_200_OK,
 )
 async def get_all_services(
+    request: Request,
+    response: Response,
     service: Annotated[ServicesService, Depends(get_services_service)],
 ):
-    return await service.get_all_services()
+    """Lista os serviços; responde 304 se o catálogo não mudou."""
+    etag = await service.get_catalog_etag()
+    if is_not_modified(request, etag):
+        return not_modified(response, etag)
+    response.headers["ETag"] = etag
+    return json_response(await service.get_all_services_json(), response)
@@ -1,21 +1,40 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, status
+from fastapi import APIRouter, Depends, Response, status
 from fastapi_pagination import Page, Params
 
 from dependencies.auth_dependencies import get_current_user, require_admin_user
-from dependencies.pagination_dependencies import get_pagination_params
+from dependencies.cache_dependencies import NO_STORE, cache_control
+from dependencies.pagination_dependencies import (
+    get_cursor_params,
+    get_pagination_params,
+)
 from enums import DateFilter
-from models import UserModel
-from schemas import UserCreate, UserRead, UserUpdate
-from services.user_service import UserService, get_user_service
+from schemas import CurrentUser, UserCreate, UserRead, UserUpdate
+from schemas.pagination_schema import CursorPage, CursorParams
+from schemas.user_schema import user_cursor_page_adapter, user_page_adapter
+from services.user_service import (
+    UserService,
+    get_user_read_service,
+    get_user_service,
+)
+from utils.responses import model_response
 
-user_public_router = APIRouter(prefix="/users", tags=["Users"])
+user_public_router = APIRouter(
+    prefix="/users",
+    tags=["Users"],
+    dependencies=[Depends(cache_control(NO_STORE))],
+)
 
 
 protected_user_router = APIRouter(
-    prefix="/users", tags=["Users"], dependencies=[Depends(get_current_user)]
+    prefix="/users",
+    tags=["Users"],
+    dependencies=[
+        Depends(get_current_user),
+        Depends(cache_control(NO_STORE)),
+    ],
 )
 
 
@@ -56,7 +75,7 @@ async def delete_user(
 async def get_user_by_id(
     id: UUID,
     service: Annotated[UserService, Depends(get_user_service)],
-    _: Annotated[UserModel, Depends(require_admin_user)],
+    _: Annotated[CurrentUser, Depends(require_admin_user)],
 ):
     return await service.get_user_by_id(id)
 
@@ -64,12 +83,34 @@ async def get_user_by_id(
 @protected_user_router.get(
     "/", response_model=Page[UserRead], status_code=status.HTTP_200_OK
 )
-async def get_all_clients(
+async def get_all_clients(  # noqa: PLR0913, PLR0917
     params: Annotated[Params, Depends(get_pagination_params)],
-    service: Annotated[UserService, Depends(get_user_service)],
-    _: Annotated[UserModel, Depends(require_admin_user)],
+    response: Response,
+    service: Annotated[UserService, Depends(get_user_read_service)],
+    _: Annotated[CurrentUser, Depends(require_admin_user)],
+    name: str | None = None,
+    email: str | None = None,
+    date_filter: DateFilter | None = None,
+):
+    page = await service.get_all_clients(params, name, email, date_filter)
+    return model_response(user_page_adapter, page, response)
+
+
+@protected_user_router.get(
+    "/cursor",
+    response_model=CursorPage[UserRead],
+    status_code=status.HTTP_200_OK,
+)
+async def get_all_clients_by_cursor(  # noqa: PLR0913, PLR0917
+    params: Annotated[CursorParams, Depends(get_cursor_params)],
+    response: Response,
+    service: Annotated[UserService, Depends(get_user_read_service)],
+    _: Annotated[CurrentUser, Depends(require_admin_user)],
     name: str | None = None,
     email: str | None = None,
     date_filter: DateFilter | None = None,
 ):
-    return await service.get_all_clients(params, name, email, date_filter)
+    page = await service.get_all_clients_by_cursor(
+        params, name, email, date_filter
+    )
+    return model_response(user_cursor_page_adapter, page, response)
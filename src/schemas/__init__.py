@@ -3,12 +3,18 @@
 from schemas.appointments_schema import AppointmentCreate, AppointmentRead
 from schemas.services_schema import ServiceCreate, ServiceRead, ServiceUpdate
 from schemas.token_schema import TokenPayload, TokenSchema
-from schemas.user_schema import UserCreate, UserRead, UserUpdate
+from schemas.user_schema import (
+    CurrentUser,
+    UserCreate,
+    UserRead,
+    UserUpdate,
+)
 
 __all__ = [
     "UserCreate",
     "UserRead",
     "UserUpdate",
+    "CurrentUser",
     "TokenSchema",
     "TokenPayload",
     "AppointmentCreate",
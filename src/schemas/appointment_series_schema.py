@@ -0,0 +1,46 @@
+from datetime import date as DateType
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+
+from enums import RecurrenceFrequency
+from utils.recurrence import MAX_SERIES_OCCURRENCES
+
+
+class AppointmentSeriesCreate(BaseModel):
+    frequency: RecurrenceFrequency
+    start_date: DateType
+    services: list[UUID] = Field(min_length=1)
+    until: Optional[DateType] = None
+    occurrences: Optional[int] = Field(
+        default=None, ge=1, le=MAX_SERIES_OCCURRENCES
+    )
+
+    @model_validator(mode="after")
+    def check_end(self):
+        if (self.until is None) == (self.occurrences is None):
+            raise ValueError("Provide exactly one of until or occurrences")
+        return self
+
+
+class AppointmentSeriesRead(BaseModel):
+    id: UUID
+    client_id: UUID
+    frequency: RecurrenceFrequency
+    start_date: DateType
+    until: Optional[DateType] = None
+    occurrences: Optional[int] = None
+    ends_on: DateType
+    service_ids: list[UUID]
+    materialized_until: Optional[DateType] = None
+    cancelled_at: Optional[datetime] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+appointment_series_adapter = TypeAdapter(AppointmentSeriesRead)
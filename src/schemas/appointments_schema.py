@@ -3,15 +3,24 @@ from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, field_validator
+from fastapi_pagination import Page
+from pydantic import (
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationInfo,
+    field_validator,
+)
 
 from enums import AppointmentStatus
+from schemas.pagination_schema import CursorPage
 from schemas.services_schema import ServiceRead
 
 
 class AppointmentCreate(BaseModel):
     date: DateType
     services: list[UUID]
+    admin_id: Optional[UUID] = None
 
 
 # TODO: Adicionar campo meio de pagamento (pix, cartão de crédito, dinheiro)
@@ -25,15 +34,29 @@ class AppointmentRead(BaseModel):
 
     services: List[ServiceRead]
 
+    series_id: Optional[UUID] = None
+    # Ocorrência futura de uma série, ainda não materializada.
+    virtual: bool = False
+
     cancel_reason: Optional[str] = None
     cancelled_at: Optional[datetime] = None
 
     created_at: datetime
     updated_at: datetime
+    version: int
 
     @field_validator("services", mode="before")
     @classmethod
-    def extract_services(cls, value):
+    def extract_services(cls, value, info: ValidationInfo):
+        # Com o catálogo no contexto, os vínculos são resolvidos por
+        # service_id, sem precisar do ServiceModel carregado.
+        catalog = (info.context or {}).get("services")
+        if catalog is not None and isinstance(value, list):
+            return [
+                catalog[item.service_id]
+                for item in value
+                if getattr(item, "service_id", None) in catalog
+            ]
         if isinstance(value, list):
             return [
                 item.service if hasattr(item, "service") else item
@@ -47,6 +70,77 @@ class AppointmentRead(BaseModel):
         from_attributes = True
 
 
+class AppointmentBulkCreate(BaseModel):
+    items: list[AppointmentCreate] = Field(min_length=1, max_length=100)
+
+
+class AppointmentBulkItemResult(BaseModel):
+    """
+    Resultado de um item do lote, na posição ``index`` do pedido. Em caso
+    de erro, ``message`` e ``detail`` seguem o corpo das respostas de erro.
+    """
+
+    index: int
+    status_code: int
+    appointment: Optional[AppointmentRead] = None
+    message: Optional[str] = None
+    detail: Optional[str] = None
+
+
+class AppointmentBulkResult(BaseModel):
+    created: int
+    failed: int
+    items: list[AppointmentBulkItemResult]
+
+
+class AppointmentBatchConfirm(BaseModel):
+    ids: list[UUID] = Field(min_length=1, max_length=100)
+
+
+class AppointmentBatchCancel(AppointmentBatchConfirm):
+    cancel_reason: str
+
+
+class AppointmentBatchItemResult(BaseModel):
+    """
+    Resultado de um id do lote: o novo status em caso de sucesso ou,
+    em caso de erro, ``message`` e ``detail`` como nas respostas de erro.
+    """
+
+    id: UUID
+    status_code: int
+    status: Optional[AppointmentStatus] = None
+    message: Optional[str] = None
+    detail: Optional[str] = None
+
+
+class AppointmentBatchResult(BaseModel):
+    succeeded: int
+    failed: int
+    items: list[AppointmentBatchItemResult]
+
+
+# Criados uma vez: montar um TypeAdapter compila o schema inteiro.
+appointment_adapter = TypeAdapter(AppointmentRead)
+appointment_page_adapter = TypeAdapter(Page[AppointmentRead])
+appointment_cursor_page_adapter = TypeAdapter(CursorPage[AppointmentRead])
+appointment_bulk_result_adapter = TypeAdapter(AppointmentBulkResult)
+appointment_batch_result_adapter = TypeAdapter(AppointmentBatchResult)
+
+
+class AppointmentVersion(BaseModel):
+    """Colunas mínimas para autorizar e versionar um agendamento."""
+
+    id: UUID
+    client_id: UUID
+    admin_id: Optional[UUID] = None
+    updated_at: datetime
+    version: int
+
+    class Config:
+        from_attributes = True
+
+
 class AppointmentCancel(BaseModel):
     cancel_reason: str
 
@@ -0,0 +1,26 @@
+from datetime import date as DateType
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class AdminDayAvailability(BaseModel):
+    admin_id: UUID
+    date: DateType
+    capacity: int
+    booked: int
+    remaining: int
+
+    class Config:
+        from_attributes = True
+
+
+class AdminAvailabilityRead(BaseModel):
+    admin_id: UUID
+    remaining: list[int]
+
+
+class AvailabilityCalendarRead(BaseModel):
+    start: DateType
+    end: DateType
+    admins: list[AdminAvailabilityRead]
@@ -0,0 +1,21 @@
+from typing import Generic, TypeVar
+
+from pydantic import BaseModel, ConfigDict, Field
+
+T = TypeVar("T")
+
+
+class CursorParams(BaseModel):
+    cursor: str | None = None
+    size: int = Field(default=20, ge=1, le=100)
+    include_total: bool = False
+
+
+class CursorPage(BaseModel, Generic[T]):
+    # Repositórios parametrizam a página com modelos ORM.
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    items: list[T]
+    size: int
+    next_cursor: str | None = None
+    total: int | None = None
@@ -2,7 +2,7 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, field_serializer
+from pydantic import BaseModel, TypeAdapter, field_validator
 
 
 class ServiceCreate(BaseModel):
@@ -19,16 +19,21 @@ class ServiceRead(BaseModel):
     created_at: datetime
     updated_at: datetime
 
-    @field_serializer("price")
-    @staticmethod
-    def serialize_price(value: Decimal) -> str:
-        quantized = value.quantize(Decimal("0.01"))
-        return f"{quantized:.2f}"
+    @field_validator("price")
+    @classmethod
+    def quantize_price(cls, value: Decimal) -> Decimal:
+        # Arredondado uma vez na validação (o catálogo reaproveita a
+        # instância), o Decimal sai no JSON como "12.50" sem passar por um
+        # serializer Python a cada resposta.
+        return value.quantize(Decimal("0.01"))
 
     class Config:
         from_attributes = True
 
 
+service_list_adapter = TypeAdapter(list[ServiceRead])
+
+
 class ServiceUpdate(BaseModel):
     name: str | None = None
     description: str | None = None
@@ -1,10 +1,12 @@
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel
+from fastapi_pagination import Page
+from pydantic import BaseModel, TypeAdapter
 
 from enums import UserRole
 from enums.auth_provider import AuthProvider
+from schemas.pagination_schema import CursorPage
 
 
 class UserCreate(BaseModel):
@@ -30,6 +32,24 @@ class UserRead(BaseModel):
         from_attributes = True
 
 
+user_page_adapter = TypeAdapter(Page[UserRead])
+user_cursor_page_adapter = TypeAdapter(CursorPage[UserRead])
+
+
+class CurrentUser(BaseModel):
+    """Snapshot enxuto do usuário autenticado, mantido em cache."""
+
+    id: UUID
+    name: str
+    email: str
+    role: UserRole
+    # Versão do usuário, usada no ETag de /auth/me sem ir ao banco.
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
 class UserUpdate(BaseModel):
     name: str | None = None
     email: str | None = None
@@ -4,12 +4,12 @@ from uuid import UUID
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.db.dependencies import get_session
+from core.db.dependencies import get_read_session, get_session
 from core.exceptions import (
     AdminDailyLimitAlreadyExistsException,
     AdminDailyLimitNotFoundException,
 )
-from models.admin_daily_limit_model import AdminDailyLimitModel
+from models.admin_weekly_capacity_model import AdminWeeklyCapacityModel
 from repositories.admin_daily_limit_repository import AdminDailyLimitRepository
 from repositories.interfaces.admin_daily_limit_interface import (
     IAdminDailyLimitRepository,
@@ -32,7 +32,7 @@ class AdminDailyLimitService:
     async def get_admin_daily_limit_by_id(
         self,
         id: UUID,
-    ) -> AdminDailyLimitModel:
+    ) -> AdminWeeklyCapacityModel:
         existing_admin_daily_limit = (
             await self.admin_daily_limit_repository.get_by_id(id)
         )
@@ -43,7 +43,9 @@ class AdminDailyLimitService:
         logger.info(f"Admin daily limit found: {existing_admin_daily_limit}")
         return existing_admin_daily_limit
 
-    async def get_all_admin_daily_limits(self) -> list[AdminDailyLimitModel]:
+    async def get_all_admin_daily_limits(
+        self,
+    ) -> list[AdminWeeklyCapacityModel]:
         existing_admin_daily_limits = (
             await self.admin_daily_limit_repository.get_all()
         )
@@ -56,7 +58,7 @@ class AdminDailyLimitService:
 
     async def create_admin_daily_limit(
         self, admin_daily_limit: AdminDailyLimitCreate, admin_id: UUID
-    ) -> AdminDailyLimitModel:
+    ) -> AdminWeeklyCapacityModel:
         existing_admin_daily_limit = (
             await self.admin_daily_limit_repository.get_by_week_day(
                 admin_id, admin_daily_limit.week_day
@@ -66,7 +68,7 @@ class AdminDailyLimitService:
             raise AdminDailyLimitAlreadyExistsException(
                 detail=f"Admin daily limit with week day {admin_daily_limit.week_day} already exists for this admin",
             )
-        admin_daily_limit_model = AdminDailyLimitModel(
+        admin_daily_limit_model = AdminWeeklyCapacityModel(
             admin_id=admin_id,
             week_day=admin_daily_limit.week_day,
             limit=admin_daily_limit.limit,
@@ -78,7 +80,7 @@ class AdminDailyLimitService:
 
     async def update_admin_daily_limit(
         self, id: UUID, admin_daily_limit: AdminDailyLimitUpdate
-    ) -> AdminDailyLimitModel:
+    ) -> AdminWeeklyCapacityModel:
         existing_admin_daily_limit = (
             await self.admin_daily_limit_repository.get_by_id(id)
         )
@@ -112,3 +114,11 @@ def get_admin_daily_limit_service(
 ) -> AdminDailyLimitService:
     repo = AdminDailyLimitRepository(db)
     return AdminDailyLimitService(repo)
+
+
+def get_admin_daily_limit_read_service(
+    db: AsyncSession = Depends(get_read_session),
+) -> AdminDailyLimitService:
+    """Serviço para consultas, lendo da réplica."""
+    repo = AdminDailyLimitRepository(db)
+    return AdminDailyLimitService(repo)
@@ -0,0 +1,223 @@
+import logging
+from datetime import UTC, date, datetime, timedelta
+from itertools import chain, islice
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache.service_catalog import service_catalog
+from core.db.dependencies import get_session
+from core.exceptions import (
+    AppointmentSeriesNotFoundException,
+    InvalidAppointmentDataException,
+    InvalidAppointmentStateException,
+    ServiceNotFoundException,
+)
+from core.metrics import appointment_transitions
+from core.settings import get_settings
+from enums import AppointmentStatus
+from models import AppointmentSeriesModel
+from repositories.appointment_series_repository import (
+    AppointmentSeriesRepository,
+)
+from repositories.appointments_repository import AppointmentsRepository
+from repositories.interfaces.appointment_series_interface import (
+    IAppointmentSeriesRepository,
+)
+from repositories.interfaces.appointments_interface import (
+    IAppointmentRepository,
+)
+from repositories.interfaces.services_interface import IServiceRepository
+from repositories.services_repository import ServicesRepository
+from schemas.appointment_series_schema import (
+    AppointmentSeriesCreate,
+    AppointmentSeriesRead,
+)
+from utils.recurrence import (
+    MAX_SERIES_OCCURRENCES,
+    build_occurrences,
+    occurrence_dates,
+)
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+def _today() -> date:
+    return datetime.now(UTC).date()
+
+
+class AppointmentSeriesService:
+    def __init__(
+        self,
+        series_repository: IAppointmentSeriesRepository,
+        appointment_repository: IAppointmentRepository,
+        services_repository: IServiceRepository,
+    ):
+        self.series_repository = series_repository
+        self.appointment_repository = appointment_repository
+        self.services_repository = services_repository
+
+    async def create_series(
+        self,
+        series: AppointmentSeriesCreate,
+        client_id: UUID,
+    ) -> AppointmentSeriesRead:
+        """
+        Cria a série e materializa, na mesma transação, as ocorrências que
+        já estão dentro da janela. As demais ficam para o worker.
+        """
+        if series.start_date < _today():
+            raise InvalidAppointmentDataException(
+                detail="A series cannot start in the past",
+            )
+        dates = list(
+            islice(
+                occurrence_dates(
+                    series.frequency,
+                    series.start_date,
+                    series.until,
+                    series.occurrences,
+                ),
+                MAX_SERIES_OCCURRENCES + 1,
+            )
+        )
+        if not dates:
+            raise InvalidAppointmentDataException(
+                detail="The series has no occurrences",
+            )
+        if len(dates) > MAX_SERIES_OCCURRENCES:
+            raise InvalidAppointmentDataException(
+                detail=(
+                    "A series cannot have more than "
+                    f"{MAX_SERIES_OCCURRENCES} occurrences"
+                ),
+            )
+
+        service_ids = list(dict.fromkeys(series.services))
+        services = await service_catalog.resolve(
+            self.services_repository, service_ids
+        )
+        missing = [id for id in service_ids if id not in services]
+        if missing:
+            raise ServiceNotFoundException(
+                detail=f"Services not found: {', '.join(map(str, missing))}",
+            )
+
+        series_model = await self.series_repository.add(
+            AppointmentSeriesModel(
+                client_id=client_id,
+                frequency=series.frequency,
+                start_date=series.start_date,
+                until=series.until,
+                occurrences=series.occurrences,
+                ends_on=dates[-1][1],
+                service_ids=service_ids,
+            )
+        )
+        await self._materialize([series_model])
+        return AppointmentSeriesRead.model_validate(series_model)
+
+    async def cancel_series(
+        self,
+        series_id: UUID,
+        cancel_reason: str,
+        client_id: UUID,
+    ) -> AppointmentSeriesRead:
+        """
+        Encerra a série: nenhuma ocorrência nova é gerada, e as já
+        materializadas a partir de hoje que ainda estão ativas são
+        canceladas.
+        """
+        series = await self.series_repository.get_for_update(series_id)
+        if series is None or series.client_id != client_id:
+            raise AppointmentSeriesNotFoundException(
+                detail=f"Appointment series with id {series_id} not found",
+            )
+        if series.cancelled_at is not None:
+            raise InvalidAppointmentStateException(
+                detail=f"Appointment series with id {series_id} is cancelled",
+            )
+
+        now = datetime.now(UTC)
+        series.cancelled_at = now
+        cancelled = await self.appointment_repository.cancel_by_series(
+            series_id, _today(), cancel_reason, now
+        )
+        series = await self.series_repository.update(series)
+        appointment_transitions.labels(AppointmentStatus.CANCELLED).inc(
+            cancelled
+        )
+        return AppointmentSeriesRead.model_validate(series)
+
+    async def materialize_due(self) -> int:
+        """
+        Avança a janela de um lote de séries. Retorna quantas séries foram
+        processadas.
+        """
+        window_end = _today() + timedelta(
+            days=settings.APPOINTMENT_SERIES_WINDOW_DAYS
+        )
+        series = await self.series_repository.claim_due(
+            window_end, settings.APPOINTMENT_SERIES_BATCH_SIZE
+        )
+        await self._materialize(series)
+        return len(series)
+
+    async def _materialize(self, series: list[AppointmentSeriesModel]) -> None:
+        """
+        Grava as ocorrências até o fim da janela e avança
+        ``materialized_until``, tudo em um commit. Os ids são derivados da
+        série e da data, então a mesma ocorrência nunca é gravada duas
+        vezes.
+
+        ``service_ids`` não tem chave estrangeira: serviços removidos do
+        catálogo depois da criação da série saem da série, e a série sem
+        nenhum serviço restante é encerrada. Senão o INSERT das
+        ocorrências falharia e derrubaria o lote inteiro, que o worker
+        tentaria de novo a cada execução.
+        """
+        window_end = _today() + timedelta(
+            days=settings.APPOINTMENT_SERIES_WINDOW_DAYS
+        )
+        services = await service_catalog.resolve(
+            self.services_repository,
+            chain.from_iterable(item.service_ids for item in series),
+        )
+        now = datetime.now(UTC)
+        occurrences = []
+        for item in series:
+            service_ids = [id for id in item.service_ids if id in services]
+            if service_ids != item.service_ids:
+                logger.warning(
+                    f"Appointment series {item.id} references deleted "
+                    f"services: {set(item.service_ids) - set(service_ids)}"
+                )
+                item.service_ids = service_ids
+            if not service_ids:
+                item.cancelled_at = now
+                continue
+            through = min(item.ends_on, window_end)
+            occurrences.extend(
+                build_occurrences(
+                    item, after=item.materialized_until, through=through
+                )
+            )
+            item.materialized_until = through
+
+        await self.appointment_repository.save_all(occurrences)
+        appointment_transitions.labels(AppointmentStatus.PENDING).inc(
+            len(occurrences)
+        )
+
+
+def get_appointment_series_service(
+    db: AsyncSession = Depends(get_session),
+) -> AppointmentSeriesService:
+    series_repo = AppointmentSeriesRepository(db)
+    appointments_repo = AppointmentsRepository(db)
+    services_repo = ServicesRepository(db)
+    return AppointmentSeriesService(
+        series_repo, appointments_repo, services_repo
+    )
@@ -1,52 +1,292 @@
-from datetime import UTC, datetime
+from collections.abc import Awaitable, Callable
+from datetime import UTC, date, datetime
 from uuid import UUID
 
 from fastapi import Depends
 from fastapi_pagination import Page, Params
+from fastapi_pagination.api import set_items_transformer
+from sqlalchemy import func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.exc import StaleDataError
 
-from core.db.dependencies import get_session
+from core.cache.service_catalog import service_catalog
+from core.db.dependencies import get_read_session, get_session
 from core.exceptions import (
+    AdminNotAvailableException,
     AppointmentNotFoundException,
+    AppointmentVersionConflictException,
+    BaseAppException,
     InvalidAppointmentStateException,
+    ServiceNotFoundException,
 )
+from core.metrics import appointment_transitions
 from enums import AppointmentStatus, FutureDateFilter
 from models.appointment_model import AppointmentModel
 from models.appointment_service_model import AppointmentServiceModel
 from repositories.appointments_repository import AppointmentsRepository
+from repositories.availability_repository import AvailabilityRepository
 from repositories.interfaces.appointments_interface import (
+    BeforeCommit,
     IAppointmentRepository,
 )
+from repositories.interfaces.availability_interface import (
+    IAvailabilityRepository,
+)
+from repositories.interfaces.services_interface import IServiceRepository
+from repositories.services_repository import ServicesRepository
 from schemas.appointments_schema import (
+    AppointmentBatchItemResult,
+    AppointmentBatchResult,
+    AppointmentBulkItemResult,
+    AppointmentBulkResult,
     AppointmentClientUpdate,
     AppointmentCreate,
+    AppointmentRead,
+    AppointmentVersion,
 )
+from schemas.pagination_schema import CursorPage, CursorParams
+from utils.http_cache import is_precondition_met, make_strong_etag
+
+# Recebe o agendamento gravado, antes do commit da operação.
+AppointmentHook = Callable[[AppointmentRead], Awaitable[None]]
 
 
 class AppointmentsService:
-    def __init__(self, appointment_repository: IAppointmentRepository):
+    def __init__(
+        self,
+        appointment_repository: IAppointmentRepository,
+        availability_repository: IAvailabilityRepository,
+        services_repository: IServiceRepository,
+    ):
         self.appointment_repository = appointment_repository
+        self.availability_repository = availability_repository
+        self.services_repository = services_repository
+
+    async def _build_services(
+        self, service_ids: list[UUID]
+    ) -> list[AppointmentServiceModel]:
+        """
+        Valida os serviços pelo catálogo em memória e monta os vínculos
+        apenas com o service_id.
+        """
+        unique_ids = list(dict.fromkeys(service_ids))
+        services = await service_catalog.resolve(
+            self.services_repository, unique_ids
+        )
+        missing = [id for id in unique_ids if id not in services]
+        if missing:
+            raise ServiceNotFoundException(
+                detail=f"Services not found: {', '.join(map(str, missing))}",
+            )
+        return [AppointmentServiceModel(service_id=id) for id in unique_ids]
+
+    async def _serialize(
+        self, appointments: list[AppointmentModel]
+    ) -> list[AppointmentRead]:
+        """
+        Converte os agendamentos resolvendo os serviços pelo catálogo em
+        memória, em vez de carregar ServiceModel junto com cada consulta.
+        """
+        catalog = await service_catalog.resolve(
+            self.services_repository,
+            {
+                link.service_id
+                for appointment in appointments
+                for link in appointment.services
+            },
+        )
+        return [
+            AppointmentRead.model_validate(
+                appointment, context={"services": catalog}
+            )
+            for appointment in appointments
+        ]
+
+    def _before_commit(
+        self,
+        appointment: AppointmentModel,
+        before_commit: AppointmentHook | None,
+    ) -> BeforeCommit | None:
+        """Entrega ``appointment`` serializado depois do flush."""
+        if before_commit is None:
+            return None
+
+        async def hook() -> None:
+            await before_commit((await self._serialize([appointment]))[0])
+
+        return hook
+
+    async def _reserve_slot(self, admin_id: UUID, day: date) -> None:
+        """
+        Garante uma vaga do admin no dia dentro da transação corrente.
+
+        O advisory lock por (admin, dia) é liberado no commit do insert ou
+        update seguinte, então a contagem e a escrita são atômicas sem
+        depender de retries de serialização.
+        """
+        await self.appointment_repository.lock_admin_day(admin_id, day)
+        availability = await self.availability_repository.get_range(
+            day, day, [admin_id]
+        )
+        if not availability or availability[0].remaining <= 0:
+            raise AdminNotAvailableException(
+                detail=f"Admin {admin_id} has no available slots on {day}",
+            )
+
+    async def _check_if_match(
+        self, appointment: AppointmentModel, if_match: str | None
+    ) -> None:
+        """Exige que o cliente tenha lido a versão atual (``If-Match``)."""
+        if if_match is not None and not is_precondition_met(
+            if_match, self.get_appointment_etag(appointment)
+        ):
+            raise AppointmentVersionConflictException()
+
+    async def _save_version(
+        self,
+        appointment: AppointmentModel,
+        before_commit: AppointmentHook | None = None,
+    ) -> AppointmentModel:
+        """
+        Grava o agendamento lido antes, sem travar a linha: se outra
+        escrita mudou a versão no meio, o UPDATE não encontra a linha e
+        nada é sobrescrito.
+        """
+        try:
+            return await self.appointment_repository.update(
+                appointment, self._before_commit(appointment, before_commit)
+            )
+        except StaleDataError as exc:
+            raise AppointmentVersionConflictException() from exc
 
     async def create_appointment(
         self,
         appointment: AppointmentCreate,
         client_id: UUID,
         admin_id: UUID | None = None,
-    ) -> AppointmentModel:
+        before_commit: AppointmentHook | None = None,
+    ) -> AppointmentRead:
+        """
+        Cria o agendamento. ``before_commit`` recebe o agendamento criado
+        antes do commit, para gravar algo na mesma transação.
+        """
+        if admin_id is not None:
+            await self._reserve_slot(admin_id, appointment.date)
+
         appointment_model = AppointmentModel(
             date=appointment.date,
             client_id=client_id,
             admin_id=admin_id,
+            services=await self._build_services(appointment.services),
         )
 
-        for service_id in appointment.services:
-            appointment_service = AppointmentServiceModel(
-                appointment_id=appointment_model.id,
-                service_id=service_id,
-            )
-            appointment_model.services.append(appointment_service)
+        appointment_model = await self.appointment_repository.save(
+            appointment_model,
+            self._before_commit(appointment_model, before_commit),
+        )
+        appointment_transitions.labels(appointment_model.status).inc()
+        return (await self._serialize([appointment_model]))[0]
 
-        return await self.appointment_repository.save(appointment_model)
+    async def create_appointments_bulk(
+        self,
+        items: list[AppointmentCreate],
+        client_id: UUID,
+    ) -> AppointmentBulkResult:
+        """
+        Cria vários agendamentos em uma transação. Os serviços de todos os
+        itens são validados juntos pelo catálogo e as vagas de todos os
+        (admin, dia) vêm de uma única consulta de disponibilidade, feita
+        depois de travar esses pares. Itens inválidos ou sem vaga viram
+        erros no resultado sem impedir os demais.
+        """
+        catalog = await service_catalog.resolve(
+            self.services_repository,
+            {id for item in items for id in item.services},
+        )
+        errors: dict[int, BaseAppException] = {}
+        for index, item in enumerate(items):
+            missing = [
+                id for id in dict.fromkeys(item.services) if id not in catalog
+            ]
+            if missing:
+                missing_ids = ", ".join(map(str, missing))
+                errors[index] = ServiceNotFoundException(
+                    detail=f"Services not found: {missing_ids}",
+                )
+
+        slots = [
+            (item.admin_id, item.date)
+            for index, item in enumerate(items)
+            if index not in errors and item.admin_id is not None
+        ]
+        if slots:
+            await self.appointment_repository.lock_admin_days(slots)
+            availability = await self.availability_repository.get_range(
+                min(day for _, day in slots),
+                max(day for _, day in slots),
+                list({admin_id for admin_id, _ in slots}),
+            )
+            remaining = {
+                (row.admin_id, row.date): row.remaining for row in availability
+            }
+            # Itens do mesmo lote disputam as vagas na ordem do pedido.
+            for index, item in enumerate(items):
+                slot = (item.admin_id, item.date)
+                if index in errors or item.admin_id is None:
+                    continue
+                if remaining.get(slot, 0) <= 0:
+                    errors[index] = AdminNotAvailableException(
+                        detail=(
+                            f"Admin {item.admin_id} has no available "
+                            f"slots on {item.date}"
+                        ),
+                    )
+                    continue
+                remaining[slot] -= 1
+
+        models = {
+            index: AppointmentModel(
+                date=item.date,
+                client_id=client_id,
+                admin_id=item.admin_id,
+                services=[
+                    AppointmentServiceModel(service_id=id)
+                    for id in dict.fromkeys(item.services)
+                ],
+            )
+            for index, item in enumerate(items)
+            if index not in errors
+        }
+        if models:
+            await self.appointment_repository.save_all(list(models.values()))
+        for model in models.values():
+            appointment_transitions.labels(model.status).inc()
+
+        created = dict(
+            zip(
+                models,
+                await self._serialize(list(models.values())),
+                strict=True,
+            )
+        )
+        results = [
+            AppointmentBulkItemResult(
+                index=index,
+                status_code=201,
+                appointment=created[index],
+            )
+            if index in created
+            else AppointmentBulkItemResult(
+                index=index,
+                status_code=errors[index].status_code,
+                message=errors[index].message,
+                detail=errors[index].detail,
+            )
+            for index in range(len(items))
+        ]
+        return AppointmentBulkResult(
+            created=len(created), failed=len(errors), items=results
+        )
 
     async def delete_appointment(self, id: UUID) -> None:
         existing_appointment = await self.appointment_repository.get_by_id(id)
@@ -61,7 +301,8 @@ class AppointmentsService:
         appointment_id: UUID,
         appointment: AppointmentClientUpdate,
         client_id: UUID | None = None,
-    ) -> AppointmentModel:
+        if_match: str | None = None,
+    ) -> AppointmentRead:
         existing_appointment = await self.appointment_repository.get_by_id(
             appointment_id
         )
@@ -74,6 +315,7 @@ class AppointmentsService:
             raise InvalidAppointmentStateException(
                 detail=f"Appointment with id {appointment_id} does not belong to the client",
             )
+        await self._check_if_match(existing_appointment, if_match)
 
         if existing_appointment.status != AppointmentStatus.PENDING:
             raise InvalidAppointmentStateException(
@@ -81,27 +323,35 @@ class AppointmentsService:
             )
 
         if appointment.date is not None:
+            if (
+                existing_appointment.admin_id is not None
+                and appointment.date != existing_appointment.date
+            ):
+                await self._reserve_slot(
+                    existing_appointment.admin_id, appointment.date
+                )
             existing_appointment.date = appointment.date
 
         if appointment.services is not None:
-            existing_appointment.services.clear()
-
-            for service_id in appointment.services:
-                appointment_service = AppointmentServiceModel(
-                    appointment_id=existing_appointment.id,
-                    service_id=service_id,
-                )
-                existing_appointment.services.append(appointment_service)
+            existing_appointment.services = await self._build_services(
+                appointment.services
+            )
+            # Trocar só os vínculos não altera a linha do agendamento;
+            # ela precisa ser atualizada para a versão (e o ETag) mudar.
+            existing_appointment.updated_at = func.now()
 
-        return await self.appointment_repository.update(existing_appointment)
+        existing_appointment = await self._save_version(existing_appointment)
+        return (await self._serialize([existing_appointment]))[0]
 
-    async def cancel_appointment(
+    async def cancel_appointment(  # noqa: PLR0913, PLR0917
         self,
         appointment_id: UUID,
         cancel_reason: str,
         client_id: UUID | None = None,
         admin_id: UUID | None = None,
-    ) -> AppointmentModel:
+        if_match: str | None = None,
+        before_commit: AppointmentHook | None = None,
+    ) -> AppointmentRead:
         existing_appointment = await self.appointment_repository.get_by_id(
             appointment_id
         )
@@ -122,6 +372,7 @@ class AppointmentsService:
             raise InvalidAppointmentStateException(
                 detail=f"Appointment with id {appointment_id} can only be cancelled by the client or assigned admin",
             )
+        await self._check_if_match(existing_appointment, if_match)
 
         if existing_appointment.status not in {
             AppointmentStatus.PENDING,
@@ -135,13 +386,19 @@ class AppointmentsService:
         existing_appointment.cancel_reason = cancel_reason
         existing_appointment.cancelled_at = datetime.now(UTC)
 
-        return await self.appointment_repository.update(existing_appointment)
+        existing_appointment = await self._save_version(
+            existing_appointment, before_commit
+        )
+        appointment_transitions.labels(AppointmentStatus.CANCELLED).inc()
+        return (await self._serialize([existing_appointment]))[0]
 
     async def confirm_by_admin(
         self,
         appointment_id: UUID,
         admin_id: UUID | None = None,
-    ) -> AppointmentModel:
+        if_match: str | None = None,
+        before_commit: AppointmentHook | None = None,
+    ) -> AppointmentRead:
         if admin_id is None:
             raise InvalidAppointmentStateException(
                 detail="Admin ID is required to confirm an appointment",
@@ -155,6 +412,8 @@ class AppointmentsService:
                 detail=f"Appointment with id {appointment_id} not found",
             )
 
+        await self._check_if_match(existing_appointment, if_match)
+
         if existing_appointment.status == AppointmentStatus.CANCELLED:
             raise InvalidAppointmentStateException(
                 detail=f"Appointment with id {appointment_id} is cancelled",
@@ -165,21 +424,205 @@ class AppointmentsService:
                 detail=f"Appointment with id {appointment_id} is already confirmed",
             )
 
-        if existing_appointment.admin_id is not None:
-            if existing_appointment.admin_id != admin_id:
-                raise InvalidAppointmentStateException(
-                    detail=f"Appointment with id {appointment_id} is already assigned to a different admin",
-                )
-        else:
+        if existing_appointment.status != AppointmentStatus.PENDING:
+            raise InvalidAppointmentStateException(
+                detail=f"Appointment with id {appointment_id} is not pending",
+            )
+
+        # Um agendamento já atribuído a este admin (escolhido pelo cliente
+        # na criação) já ocupa a vaga; só quem não tem admin reserva uma.
+        if existing_appointment.admin_id is None:
+            await self._reserve_slot(admin_id, existing_appointment.date)
             existing_appointment.admin_id = admin_id
-            existing_appointment.status = AppointmentStatus.CONFIRMED
+        elif existing_appointment.admin_id != admin_id:
+            raise InvalidAppointmentStateException(
+                detail=f"Appointment with id {appointment_id} is already assigned to a different admin",
+            )
+        existing_appointment.status = AppointmentStatus.CONFIRMED
 
-        return await self.appointment_repository.update(existing_appointment)
+        existing_appointment = await self._save_version(
+            existing_appointment, before_commit
+        )
+        appointment_transitions.labels(AppointmentStatus.CONFIRMED).inc()
+        return (await self._serialize([existing_appointment]))[0]
+
+    async def cancel_batch(
+        self,
+        ids: list[UUID],
+        cancel_reason: str,
+        client_id: UUID | None = None,
+        admin_id: UUID | None = None,
+    ) -> AppointmentBatchResult:
+        """
+        Cancela vários agendamentos com as mesmas regras de
+        ``cancel_appointment``, em uma única instrução. Os ids que não
+        puderam ser cancelados viram erros no resultado.
+        """
+        ids = list(dict.fromkeys(ids))
+        rows = await self.appointment_repository.cancel_many(
+            ids, cancel_reason, client_id, admin_id
+        )
+        results = {}
+        for row in rows:
+            if row.cancelled:
+                results[row.id] = AppointmentBatchItemResult(
+                    id=row.id,
+                    status_code=200,
+                    status=AppointmentStatus.CANCELLED,
+                )
+                continue
+            if row.status is None:
+                error = AppointmentNotFoundException(
+                    detail=f"Appointment with id {row.id} not found",
+                )
+            elif not (
+                (client_id is not None and row.client_id == client_id)
+                or (admin_id is not None and row.admin_id == admin_id)
+            ):
+                error = InvalidAppointmentStateException(
+                    detail=(
+                        f"Appointment with id {row.id} can only be "
+                        "cancelled by the client or assigned admin"
+                    ),
+                )
+            else:
+                error = InvalidAppointmentStateException(
+                    detail="This appointment cannot be cancelled",
+                )
+            results[row.id] = self._batch_error(row.id, error)
+
+        succeeded = sum(1 for row in rows if row.cancelled)
+        appointment_transitions.labels(AppointmentStatus.CANCELLED).inc(
+            succeeded
+        )
+        return AppointmentBatchResult(
+            succeeded=succeeded,
+            failed=len(ids) - succeeded,
+            items=[results[id] for id in ids],
+        )
+
+    async def confirm_batch(
+        self,
+        ids: list[UUID],
+        admin_id: UUID,
+    ) -> AppointmentBatchResult:
+        """
+        Confirma vários agendamentos para o admin com as mesmas regras de
+        ``confirm_by_admin``. As linhas são lidas juntas, as vagas dos
+        dias ainda sem admin vêm de uma única consulta de
+        disponibilidade e a confirmação é um único UPDATE: o número de
+        consultas não depende do tamanho do lote.
+        """
+        ids = list(dict.fromkeys(ids))
+        rows = {
+            row.id: row
+            for row in await self.appointment_repository.get_for_transition(
+                ids
+            )
+        }
+        errors: dict[UUID, BaseAppException] = {}
+        for id in ids:
+            row = rows.get(id)
+            if row is None:
+                errors[id] = AppointmentNotFoundException(
+                    detail=f"Appointment with id {id} not found",
+                )
+            elif row.status == AppointmentStatus.CANCELLED:
+                errors[id] = InvalidAppointmentStateException(
+                    detail=f"Appointment with id {id} is cancelled",
+                )
+            elif row.status == AppointmentStatus.CONFIRMED:
+                errors[id] = InvalidAppointmentStateException(
+                    detail=f"Appointment with id {id} is already confirmed",
+                )
+            elif row.status != AppointmentStatus.PENDING:
+                errors[id] = InvalidAppointmentStateException(
+                    detail=f"Appointment with id {id} is not pending",
+                )
+            elif row.admin_id is not None and row.admin_id != admin_id:
+                errors[id] = InvalidAppointmentStateException(
+                    detail=(
+                        f"Appointment with id {id} is already assigned "
+                        "to a different admin"
+                    ),
+                )
+
+        # Só quem ainda não tem admin ocupa uma vaga nova.
+        unassigned = [
+            id for id in ids if id not in errors and rows[id].admin_id is None
+        ]
+        if unassigned:
+            days = sorted({rows[id].date for id in unassigned})
+            await self.appointment_repository.lock_admin_days([
+                (admin_id, day) for day in days
+            ])
+            availability = await self.availability_repository.get_range(
+                days[0], days[-1], [admin_id]
+            )
+            remaining = {row.date: row.remaining for row in availability}
+            # Agendamentos do mesmo lote disputam as vagas na ordem do
+            # pedido.
+            for id in unassigned:
+                day = rows[id].date
+                if remaining.get(day, 0) <= 0:
+                    errors[id] = AdminNotAvailableException(
+                        detail=(
+                            f"Admin {admin_id} has no available slots on {day}"
+                        ),
+                    )
+                    continue
+                remaining[day] -= 1
+
+        to_confirm = [id for id in ids if id not in errors]
+        confirmed = set()
+        if to_confirm:
+            updated = await self.appointment_repository.confirm_many(
+                {id: rows[id].version for id in to_confirm}, admin_id
+            )
+            confirmed = {row.id for row in updated}
+            # Sem trava nas linhas lidas: quem mudou de versão antes do
+            # UPDATE fica de fora dele e é reportado como conflito.
+            for id in to_confirm:
+                if id not in confirmed:
+                    errors[id] = AppointmentVersionConflictException(
+                        detail=(
+                            f"Appointment with id {id} was modified by "
+                            "another request"
+                        ),
+                    )
+        appointment_transitions.labels(AppointmentStatus.CONFIRMED).inc(
+            len(confirmed)
+        )
+        return AppointmentBatchResult(
+            succeeded=len(confirmed),
+            failed=len(ids) - len(confirmed),
+            items=[
+                AppointmentBatchItemResult(
+                    id=id,
+                    status_code=200,
+                    status=AppointmentStatus.CONFIRMED,
+                )
+                if id in confirmed
+                else self._batch_error(id, errors[id])
+                for id in ids
+            ],
+        )
+
+    @staticmethod
+    def _batch_error(
+        id: UUID, error: BaseAppException
+    ) -> AppointmentBatchItemResult:
+        return AppointmentBatchItemResult(
+            id=id,
+            status_code=error.status_code,
+            message=error.message,
+            detail=error.detail,
+        )
 
     async def get_appointment_by_id(
         self,
         appointment_id: UUID,
-    ) -> AppointmentModel:
+    ) -> AppointmentRead:
         appointment = await self.appointment_repository.get_by_id(
             appointment_id
         )
@@ -187,7 +630,29 @@ class AppointmentsService:
             raise AppointmentNotFoundException(
                 detail=f"Appointment with id {appointment_id} not found",
             )
-        return appointment
+        return (await self._serialize([appointment]))[0]
+
+    async def get_appointment_version(
+        self,
+        appointment_id: UUID,
+    ) -> AppointmentVersion:
+        version = await self.appointment_repository.get_version(appointment_id)
+        if not version:
+            raise AppointmentNotFoundException(
+                detail=f"Appointment with id {appointment_id} not found",
+            )
+        return version
+
+    @staticmethod
+    def get_appointment_etag(
+        appointment: AppointmentVersion | AppointmentRead | AppointmentModel,
+    ) -> str:
+        """
+        ETag forte do agendamento, ``"<id>:<versão>"``. Fica de fora a
+        impressão digital do catálogo: mudar um serviço não altera o
+        agendamento e não pode derrubar as escritas com ``If-Match``.
+        """
+        return make_strong_etag(appointment.id, appointment.version)
 
     async def get_all_appointments(
         self,
@@ -196,19 +661,54 @@ class AppointmentsService:
         admin_id: UUID | None = None,
         status: AppointmentStatus | None = None,
         date_filter: FutureDateFilter | None = None,
-    ) -> Page[AppointmentModel]:
-        appointments = await self.appointment_repository.get_all(
-            params, client_id, admin_id, status, date_filter
-        )
-
-        if not appointments.items:
-            return Page(items=[], total=0, page=params.page, size=params.size)
+    ) -> Page[AppointmentRead]:
+        # A página é montada já no schema de resposta; o transformer
+        # resolve os serviços pelo catálogo antes dessa validação.
+        with set_items_transformer(self._serialize):
+            appointments = await self.appointment_repository.get_all(
+                params, client_id, admin_id, status, date_filter
+            )
 
         return appointments
 
+    async def get_all_appointments_by_cursor(
+        self,
+        params: CursorParams,
+        client_id: UUID | None = None,
+        admin_id: UUID | None = None,
+        status: AppointmentStatus | None = None,
+        date_filter: FutureDateFilter | None = None,
+    ) -> CursorPage[AppointmentRead]:
+        page = await self.appointment_repository.get_all_by_cursor(
+            params, client_id, admin_id, status, date_filter
+        )
+        return CursorPage[AppointmentRead](
+            items=await self._serialize(page.items),
+            size=page.size,
+            next_cursor=page.next_cursor,
+            total=page.total,
+        )
+
 
 def get_appointments_service(
     db: AsyncSession = Depends(get_session),
 ) -> AppointmentsService:
     repo = AppointmentsRepository(db)
-    return AppointmentsService(repo)
+    availability_repo = AvailabilityRepository(db)
+    services_repo = ServicesRepository(db)
+    return AppointmentsService(repo, availability_repo, services_repo)
+
+
+def get_appointments_read_service(
+    db: AsyncSession = Depends(get_read_session),
+    primary_db: AsyncSession = Depends(get_session),
+) -> AppointmentsService:
+    """
+    Serviço para listagens, lendo agendamentos da réplica. O catálogo de
+    serviços continua sendo carregado do primário: um snapshot defasado
+    da réplica ficaria em cache até o TTL.
+    """
+    repo = AppointmentsRepository(db)
+    availability_repo = AvailabilityRepository(db)
+    services_repo = ServicesRepository(primary_db)
+    return AppointmentsService(repo, availability_repo, services_repo)
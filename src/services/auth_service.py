@@ -1,19 +1,23 @@
 import logging
+from uuid import UUID
 
 import jwt
 from fastapi import Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache.user_cache import user_cache
 from core.db.dependencies import get_session
-from core.mail import send_signup_success_email
 from core.security import create_access_token, verify_password
 from core.settings import get_settings
 from enums import UserRole
 from enums.auth_provider import AuthProvider
 from models import UserModel
+from repositories.email_outbox_repository import EmailOutboxRepository
 from repositories.interfaces.user_interface import IUserRepository
 from repositories.user_repository import UserRepository
 from schemas.token_schema import TokenSchema
+from schemas.user_schema import CurrentUser
+from services.email_outbox_service import EmailOutboxService
 
 settings = get_settings()
 
@@ -21,8 +25,13 @@ logger = logging.getLogger(__name__)
 
 
 class AuthService:
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        email_outbox_service: EmailOutboxService,
+    ):
         self.user_repository = user_repository
+        self.email_outbox_service = email_outbox_service
 
     async def authenticate_user(
         self,
@@ -43,7 +52,8 @@ class AuthService:
                 detail="This account uses Google login. Use /auth/google.",
             )
 
-        if not verify_password(password, existing_user.password_hash):
+        await self.user_repository.release_connection()
+        if not await verify_password(password, existing_user.password_hash):
             raise HTTPException(
                 status_code=401,
                 detail="Incorrect email or password",
@@ -62,30 +72,45 @@ class AuthService:
     async def get_current_user(
         self,
         token: str,
-    ) -> UserModel:
+    ) -> CurrentUser:
+        """
+        Resolve o usuário do token. O id decodificado e o snapshot do
+        usuário vêm do cache quando possível, evitando decodificar o JWT
+        e consultar a tabela de usuários a cada requisição.
+        """
         credentials_exception = HTTPException(
             status_code=401,
             detail="Could not validate credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-        try:
-            payload = jwt.decode(
-                token,
-                settings.JWT_SECRET_KEY.get_secret_value(),
-                algorithms=[settings.JWT_ALGORITHM],
-            )
-            user_id = payload.get("sub")
+        user_id = user_cache.get_token_subject(token)
 
-            if user_id is None:
+        if user_id is None:
+            try:
+                payload = jwt.decode(
+                    token,
+                    settings.JWT_SECRET_KEY.get_secret_value(),
+                    algorithms=[settings.JWT_ALGORITHM],
+                )
+                user_id = UUID(payload["sub"])
+
+            except (jwt.InvalidTokenError, KeyError, ValueError):
                 raise credentials_exception
 
-        except jwt.InvalidTokenError:
-            raise credentials_exception
+            if "exp" in payload:
+                user_cache.set_token_subject(token, user_id, payload["exp"])
+
+        user = await user_cache.get(user_id)
+        if user is not None:
+            return user
 
-        user = await self.user_repository.get_by_id(user_id)
+        existing_user = await self.user_repository.get_by_id(user_id)
 
-        if user is None:
+        if existing_user is None:
             raise credentials_exception
+
+        user = CurrentUser.model_validate(existing_user)
+        await user_cache.set(user)
         return user
 
     async def authenticate_google_user(
@@ -102,20 +127,12 @@ class AuthService:
                 # Google OAuth does not provide phone by default.
                 phone="N/A",
             )
+            self.email_outbox_service.enqueue_signup_success(
+                to=user_model.email, user_name=user_model.name
+            )
             existing_user = await self.user_repository.save(user_model)
             logger.info(f"New user created with Google OAuth: {existing_user}")
 
-            try:
-                send_signup_success_email(
-                    to=existing_user.email,
-                    user_name=existing_user.name,
-                )
-            except Exception as exc:
-                logger.exception(
-                    f"Failed to send signup success email to {existing_user.email}",
-                    exc_info=exc,
-                )
-
         token, expires_in = create_access_token({"sub": str(existing_user.id)})
         return TokenSchema(
             access_token=token,
@@ -126,4 +143,5 @@ class AuthService:
 
 def get_auth_service(db: AsyncSession = Depends(get_session)) -> AuthService:
     repo = UserRepository(db)
-    return AuthService(repo)
+    email_outbox_service = EmailOutboxService(EmailOutboxRepository(db))
+    return AuthService(repo, email_outbox_service)
@@ -0,0 +1,95 @@
+from collections import defaultdict
+from datetime import date
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache.availability_grid import (
+    AVAILABILITY_HORIZON_DAYS,
+    availability_grid,
+)
+from core.db.dependencies import get_session
+from core.exceptions import InvalidAvailabilityRangeException
+from repositories.availability_repository import AvailabilityRepository
+from repositories.interfaces.availability_interface import (
+    IAvailabilityRepository,
+)
+from schemas.availability_schema import (
+    AdminAvailabilityRead,
+    AdminDayAvailability,
+    AvailabilityCalendarRead,
+)
+
+
+class AvailabilityService:
+    def __init__(self, availability_repository: IAvailabilityRepository):
+        self.availability_repository = availability_repository
+
+    async def get_availability(
+        self,
+        start: date,
+        end: date,
+        admin_ids: list[UUID] | None = None,
+    ) -> list[AdminDayAvailability]:
+        """
+        Retorna as vagas de cada admin em cada dia do intervalo
+        (inclusivo), resolvidas em uma única consulta.
+        """
+        if end < start:
+            raise InvalidAvailabilityRangeException(
+                detail="End date must be on or after the start date",
+            )
+        return await self.availability_repository.get_range(
+            start, end, admin_ids
+        )
+
+    async def get_calendar(
+        self,
+        start: date,
+        end: date,
+        admin_id: UUID | None = None,
+    ) -> AvailabilityCalendarRead:
+        """
+        Retorna, por admin, a lista de vagas restantes de cada dia do
+        intervalo. Intervalos dentro do horizonte são servidos pela grade
+        em memória; os demais caem na consulta agregada.
+        """
+        if end < start:
+            raise InvalidAvailabilityRangeException(
+                detail="End date must be on or after the start date",
+            )
+        if (end - start).days + 1 > AVAILABILITY_HORIZON_DAYS:
+            raise InvalidAvailabilityRangeException(
+                detail=(
+                    "Availability range cannot exceed "
+                    f"{AVAILABILITY_HORIZON_DAYS} days"
+                ),
+            )
+
+        if availability_grid.covers(start, end):
+            remaining_by_admin = await availability_grid.get(
+                self.availability_repository, start, end, admin_id
+            )
+        else:
+            remaining_by_admin = defaultdict(list)
+            for day in await self.availability_repository.get_range(
+                start, end, [admin_id] if admin_id is not None else None
+            ):
+                remaining_by_admin[day.admin_id].append(day.remaining)
+
+        return AvailabilityCalendarRead(
+            start=start,
+            end=end,
+            admins=[
+                AdminAvailabilityRead(admin_id=id, remaining=remaining)
+                for id, remaining in remaining_by_admin.items()
+            ],
+        )
+
+
+def get_availability_service(
+    db: AsyncSession = Depends(get_session),
+) -> AvailabilityService:
+    repo = AvailabilityRepository(db)
+    return AvailabilityService(repo)
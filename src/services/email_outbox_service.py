@@ -0,0 +1,103 @@
+import logging
+from datetime import UTC, datetime, timedelta
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db.dependencies import get_session
+from core.mail import EmailTransport, build_send_params
+from core.metrics import email_outbox_due, email_outbox_lag
+from core.settings import get_settings
+from models import EmailOutboxModel
+from repositories.email_outbox_repository import EmailOutboxRepository
+from repositories.interfaces.email_outbox_interface import (
+    IEmailOutboxRepository,
+)
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxService:
+    def __init__(self, email_outbox_repository: IEmailOutboxRepository):
+        self.email_outbox_repository = email_outbox_repository
+
+    def enqueue_signup_success(self, to: str, user_name: str) -> None:
+        """
+        Enfileira o email de boas-vindas. A mensagem só é gravada no
+        commit da sessão, junto com o usuário.
+        """
+        if not settings.RESEND_TEMPLATE_SIGNUP_SUCCESS:
+            logger.warning(
+                "RESEND_TEMPLATE_SIGNUP_SUCCESS não configurado; "
+                f"email de cadastro para {to} não enfileirado"
+            )
+            return
+
+        self.email_outbox_repository.add(
+            EmailOutboxModel(
+                recipient=to,
+                template_id=settings.RESEND_TEMPLATE_SIGNUP_SUCCESS,
+                template_variables={"USER_NAME": user_name},
+            )
+        )
+
+    async def drain(self, transport: EmailTransport) -> int:
+        """
+        Envia um lote de mensagens pendentes e retorna quantas foram
+        processadas (enviadas ou com falha).
+        """
+        messages = await self.email_outbox_repository.claim_batch(
+            settings.EMAIL_OUTBOX_BATCH_SIZE,
+            settings.EMAIL_OUTBOX_LEASE_SECONDS,
+        )
+
+        sent = []
+        for message in messages:
+            try:
+                transport.send(
+                    build_send_params(
+                        to=message.recipient,
+                        template_id=message.template_id,
+                        template_variables=message.template_variables,
+                    )
+                )
+            except Exception as exc:
+                retry_at = self._retry_at(message.attempts)
+                logger.warning(
+                    f"Failed to send outbox email {message.id} "
+                    f"(attempt {message.attempts}): {exc}"
+                )
+                await self.email_outbox_repository.mark_failed(
+                    message.id, str(exc), retry_at
+                )
+            else:
+                sent.append(message.id)
+
+        if sent:
+            await self.email_outbox_repository.mark_sent(sent)
+        return len(messages)
+
+    async def report_backlog(self) -> None:
+        """Atualiza as métricas do outbox; chamado a cada scrape."""
+        due, lag = await self.email_outbox_repository.due_backlog()
+        email_outbox_due.set(due)
+        email_outbox_lag.set(lag)
+
+    @staticmethod
+    def _retry_at(attempts: int) -> datetime | None:
+        if attempts >= settings.EMAIL_OUTBOX_MAX_ATTEMPTS:
+            return None
+        delay = min(
+            settings.EMAIL_OUTBOX_RETRY_BASE_SECONDS * 2 ** (attempts - 1),
+            settings.EMAIL_OUTBOX_RETRY_MAX_SECONDS,
+        )
+        return datetime.now(UTC) + timedelta(seconds=delay)
+
+
+def get_email_outbox_service(
+    db: AsyncSession = Depends(get_session),
+) -> EmailOutboxService:
+    repo = EmailOutboxRepository(db)
+    return EmailOutboxService(repo)
@@ -0,0 +1,107 @@
+import asyncio
+import time
+from uuid import UUID
+
+from fastapi import Depends
+from sqlalchemy import Row
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.db.dependencies import get_session
+from core.exceptions import (
+    IdempotencyKeyInProgressException,
+    IdempotencyKeyMismatchException,
+)
+from core.settings import get_settings
+from repositories.idempotency_keys_repository import IdempotencyKeysRepository
+from repositories.interfaces.idempotency_keys_interface import (
+    IIdempotencyKeysRepository,
+)
+
+settings = get_settings()
+
+# Intervalo entre consultas enquanto a requisição original termina de
+# gravar a resposta, dobrando até o máximo.
+POLL_INITIAL_SECONDS = 0.02
+POLL_MAX_SECONDS = 0.5
+PURGE_BATCH_SIZE = 1000
+
+
+class IdempotencyService:
+    def __init__(
+        self, idempotency_keys_repository: IIdempotencyKeysRepository
+    ):
+        self.idempotency_keys_repository = idempotency_keys_repository
+
+    async def begin(
+        self, user_id: UUID, key: str, request_hash: str
+    ) -> UUID | Row:
+        """
+        Reserva a chave para esta requisição e retorna o id da reserva; se
+        ela já foi usada, retorna a resposta gravada (``response_status``,
+        ``response_body`` e ``response_etag``) sem executar a operação de
+        novo.
+
+        Uma requisição concorrente com a mesma chave espera a original, que
+        grava a reserva e a resposta no mesmo commit da operação, por até
+        IDEMPOTENCY_WAIT_SECONDS. Entre as consultas ela não segura conexão
+        nem transação. Uma reserva que nunca recebeu resposta é retomada
+        depois de IDEMPOTENCY_LEASE_SECONDS.
+        """
+        deadline = time.monotonic() + settings.IDEMPOTENCY_WAIT_SECONDS
+        delay = POLL_INITIAL_SECONDS
+        while True:
+            claim_id = await self.idempotency_keys_repository.claim(
+                user_id,
+                key,
+                request_hash,
+                settings.IDEMPOTENCY_LEASE_SECONDS,
+            )
+            if claim_id is not None:
+                return claim_id
+
+            stored = await self.idempotency_keys_repository.get(user_id, key)
+            if stored is None:
+                # A chave (ou a reserva sem resposta) venceu: é liberada e
+                # reservada de novo.
+                await self.idempotency_keys_repository.delete_expired(
+                    user_id, key
+                )
+                continue
+            if stored.request_hash != request_hash:
+                raise IdempotencyKeyMismatchException()
+            if stored.response_status is not None:
+                return stored
+            if time.monotonic() >= deadline:
+                raise IdempotencyKeyInProgressException()
+            await self.idempotency_keys_repository.release()
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, POLL_MAX_SECONDS)
+
+    async def complete(
+        self,
+        claim_id: UUID,
+        status_code: int,
+        body: bytes,
+        etag: str | None = None,
+    ) -> None:
+        """Grava a resposta na reserva, na transação da operação."""
+        await self.idempotency_keys_repository.save_response(
+            claim_id,
+            status_code,
+            body,
+            etag,
+            settings.IDEMPOTENCY_KEY_TTL_SECONDS,
+        )
+
+    async def purge_expired(self) -> int:
+        """Remove um lote de chaves vencidas e retorna quantas removeu."""
+        return await self.idempotency_keys_repository.purge_expired(
+            PURGE_BATCH_SIZE
+        )
+
+
+def get_idempotency_service(
+    db: AsyncSession = Depends(get_session),
+) -> IdempotencyService:
+    repo = IdempotencyKeysRepository(db)
+    return IdempotencyService(repo)
@@ -5,6 +5,7 @@ from uuid import UUID
 from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.cache.service_catalog import service_catalog
 from core.db.dependencies import get_session
 from core.exceptions import (
     ServiceAlreadyExistsException,
@@ -15,7 +16,8 @@ from core.exceptions.services_exception import InvalidServicePriceException
 from models import ServiceModel
 from repositories.interfaces.services_interface import IServiceRepository
 from repositories.services_repository import ServicesRepository
-from schemas.services_schema import ServiceCreate, ServiceUpdate
+from schemas.services_schema import ServiceCreate, ServiceRead, ServiceUpdate
+from utils.http_cache import make_etag
 
 logger = logging.getLogger(__name__)
 
@@ -46,7 +48,9 @@ class ServicesService:
         )
 
         logger.info(f"Creating service name={service.name}")
-        return await self.services_repository.save(service_model)
+        created_service = await self.services_repository.save(service_model)
+        await service_catalog.bump()
+        return created_service
 
     async def update_service(
         self,
@@ -70,7 +74,11 @@ class ServicesService:
             existing_service.price = service.price
 
         logger.info(f"Updating service: {service}")
-        return await self.services_repository.update(id, service)
+        updated_service = await self.services_repository.update(
+            existing_service
+        )
+        await service_catalog.bump()
+        return updated_service
 
     async def delete_service(self, id: UUID) -> None:
         existing_service = await self.services_repository.get_by_id(id)
@@ -80,10 +88,13 @@ class ServicesService:
                 detail=f"Service with id {id} not found",
             )
         logger.info(f"Deleting service: {id}")
-        return await self.services_repository.delete(existing_service)
+        await self.services_repository.delete(existing_service)
+        await service_catalog.bump()
 
-    async def get_service_by_id(self, id: UUID) -> ServiceModel:
-        existing_service = await self.services_repository.get_by_id(id)
+    async def get_service_by_id(self, id: UUID) -> ServiceRead:
+        existing_service = (
+            await service_catalog.resolve(self.services_repository, [id])
+        ).get(id)
 
         if not existing_service:
             raise ServiceNotFoundException(
@@ -92,14 +103,34 @@ class ServicesService:
         logger.info(f"Getting service by id: {id}")
         return existing_service
 
-    async def get_all_services(self) -> list[ServiceModel]:
-        existing_services = await self.services_repository.get_all()
+    async def get_catalog_etag(self) -> str:
+        """ETag da listagem, derivado do catálogo sem serializá-lo."""
+        return make_etag(
+            "services",
+            await service_catalog.fingerprint(self.services_repository),
+        )
+
+    async def get_all_services(self) -> list[ServiceRead]:
+        existing_services = await service_catalog.get_all(
+            self.services_repository
+        )
 
         if not existing_services:
             raise ServicesNotFoundException(detail="No services found")
         logger.info("Getting all services")
         return existing_services
 
+    async def get_all_services_json(self) -> bytes:
+        """Listagem pré-serializada pelo catálogo, pronta para a resposta."""
+        services_json = await service_catalog.get_all_json(
+            self.services_repository
+        )
+
+        if services_json == b"[]":
+            raise ServicesNotFoundException(detail="No services found")
+        logger.info("Getting all services")
+        return services_json
+
 
 def get_services_service(
     db: AsyncSession = Depends(get_session),
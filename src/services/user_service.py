@@ -5,27 +5,35 @@ from fastapi import Depends
 from fastapi_pagination import Page, Params
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from core.db.dependencies import get_session
+from core.cache.user_cache import user_cache
+from core.db.dependencies import get_read_session, get_session
 from core.exceptions import (
     UserAlreadyExistsException,
     UserNotFoundException,
 )
-from core.mail import send_signup_success_email
 from core.security import (
     get_password_hash,
 )
 from enums import DateFilter
 from models import UserModel
+from repositories.email_outbox_repository import EmailOutboxRepository
 from repositories.interfaces.user_interface import IUserRepository
 from repositories.user_repository import UserRepository
 from schemas import UserCreate, UserUpdate
+from schemas.pagination_schema import CursorPage, CursorParams
+from services.email_outbox_service import EmailOutboxService
 
 logger = logging.getLogger(__name__)
 
 
 class UserService:
-    def __init__(self, user_repository: IUserRepository):
+    def __init__(
+        self,
+        user_repository: IUserRepository,
+        email_outbox_service: EmailOutboxService,
+    ):
         self.user_repository = user_repository
+        self.email_outbox_service = email_outbox_service
 
     async def create_user(self, user: UserCreate) -> UserModel:
 
@@ -36,9 +44,10 @@ class UserService:
                 detail=f"User with email {user.email} already exists"
             )
 
+        await self.user_repository.release_connection()
         user_model = UserModel(
             name=user.name,
-            password_hash=get_password_hash(user.password)
+            password_hash=await get_password_hash(user.password)
             if user.password
             else None,
             email=user.email,
@@ -48,20 +57,10 @@ class UserService:
 
         logger.info(f"Creating user with email={user.email}")
 
-        created_user = await self.user_repository.save(user_model)
-
-        try:
-            send_signup_success_email(
-                to=created_user.email,
-                user_name=created_user.name,
-            )
-        except Exception as exc:
-            logger.exception(
-                f"Failed to send signup success email to {created_user.email}",
-                exc_info=exc,
-            )
-
-        return created_user
+        self.email_outbox_service.enqueue_signup_success(
+            to=user_model.email, user_name=user_model.name
+        )
+        return await self.user_repository.save(user_model)
 
     async def update_user(self, id: UUID, user: UserUpdate) -> UserModel:
         existing_user = await self.user_repository.get_by_id(id)
@@ -78,7 +77,9 @@ class UserService:
         if user.phone is not None:
             existing_user.phone = user.phone
 
-        return await self.user_repository.update(existing_user)
+        updated_user = await self.user_repository.update(existing_user)
+        await user_cache.invalidate(id)
+        return updated_user
 
     async def delete_user(self, id: UUID) -> None:
         existing_user = await self.user_repository.get_by_id(id)
@@ -86,7 +87,8 @@ class UserService:
         if not existing_user:
             raise UserNotFoundException(detail=f"User with id {id} not found")
 
-        return await self.user_repository.delete(existing_user)
+        await self.user_repository.delete(existing_user)
+        await user_cache.invalidate(id)
 
     async def get_user_by_email(self, email: str) -> UserModel | None:
 
@@ -129,7 +131,28 @@ class UserService:
 
         return existing_users
 
+    async def get_all_clients_by_cursor(
+        self,
+        params: CursorParams,
+        name: str | None = None,
+        email: str | None = None,
+        date_filter: DateFilter | None = None,
+    ) -> CursorPage[UserModel]:
+        return await self.user_repository.get_all_clients_by_cursor(
+            params, name, email, date_filter
+        )
+
 
 def get_user_service(db: AsyncSession = Depends(get_session)) -> UserService:
     repo = UserRepository(db)
-    return UserService(repo)
+    email_outbox_service = EmailOutboxService(EmailOutboxRepository(db))
+    return UserService(repo, email_outbox_service)
+
+
+def get_user_read_service(
+    db: AsyncSession = Depends(get_read_session),
+) -> UserService:
+    """Serviço para listagens, lendo da réplica."""
+    repo = UserRepository(db)
+    email_outbox_service = EmailOutboxService(EmailOutboxRepository(db))
+    return UserService(repo, email_outbox_service)
@@ -0,0 +1,40 @@
+import asyncio
+import logging
+
+from core.celery_app import celery_app
+from core.settings import get_settings
+from repositories.appointment_series_repository import (
+    AppointmentSeriesRepository,
+)
+from repositories.appointments_repository import AppointmentsRepository
+from repositories.services_repository import ServicesRepository
+from services.appointment_series_service import AppointmentSeriesService
+from tasks.db import WorkerSessionLocal
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+async def _materialize_appointment_series() -> int:
+    processed = 0
+    async with WorkerSessionLocal() as session:
+        service = AppointmentSeriesService(
+            AppointmentSeriesRepository(session),
+            AppointmentsRepository(session),
+            ServicesRepository(session),
+        )
+        while True:
+            batch = await service.materialize_due()
+            processed += batch
+            if batch < settings.APPOINTMENT_SERIES_BATCH_SIZE:
+                return processed
+
+
+@celery_app.task
+def materialize_appointment_series() -> int:
+    """Avança a janela de ocorrências materializadas das séries."""
+    processed = asyncio.run(_materialize_appointment_series())
+    if processed:
+        logger.info(f"Appointment series materialized: {processed} series")
+    return processed
@@ -0,0 +1,22 @@
+"""
+Sessões de banco das tasks do Celery.
+
+Cada execução de task roda em um event loop novo (asyncio.run), então o
+worker não reaproveita conexões entre execuções.
+"""
+
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from core.db.session import connect_args
+from core.settings import get_settings
+
+settings = get_settings()
+
+engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    echo=settings.DB_ECHO,
+    poolclass=NullPool,
+    connect_args=connect_args(),
+)
+WorkerSessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False)
@@ -0,0 +1,34 @@
+import asyncio
+import logging
+
+from core.celery_app import celery_app
+from core.mail import get_email_transport
+from core.settings import get_settings
+from repositories.email_outbox_repository import EmailOutboxRepository
+from services.email_outbox_service import EmailOutboxService
+from tasks.db import WorkerSessionLocal
+
+settings = get_settings()
+
+logger = logging.getLogger(__name__)
+
+
+async def _drain_email_outbox() -> int:
+    transport = get_email_transport()
+    processed = 0
+    async with WorkerSessionLocal() as session:
+        service = EmailOutboxService(EmailOutboxRepository(session))
+        while True:
+            batch = await service.drain(transport)
+            processed += batch
+            if batch < settings.EMAIL_OUTBOX_BATCH_SIZE:
+                return processed
+
+
+@celery_app.task
+def drain_email_outbox() -> int:
+    """Esvazia o outbox de emails, lote a lote."""
+    processed = asyncio.run(_drain_email_outbox())
+    if processed:
+        logger.info(f"Email outbox drained: {processed} messages")
+    return processed
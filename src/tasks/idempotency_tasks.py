@@ -0,0 +1,29 @@
+import asyncio
+import logging
+
+from core.celery_app import celery_app
+from repositories.idempotency_keys_repository import IdempotencyKeysRepository
+from services.idempotency_service import PURGE_BATCH_SIZE, IdempotencyService
+from tasks.db import WorkerSessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+async def _purge_idempotency_keys() -> int:
+    purged = 0
+    async with WorkerSessionLocal() as session:
+        service = IdempotencyService(IdempotencyKeysRepository(session))
+        while True:
+            batch = await service.purge_expired()
+            purged += batch
+            if batch < PURGE_BATCH_SIZE:
+                return purged
+
+
+@celery_app.task
+def purge_idempotency_keys() -> int:
+    """Remove as chaves de idempotência vencidas."""
+    purged = asyncio.run(_purge_idempotency_keys())
+    if purged:
+        logger.info(f"Idempotency keys purged: {purged}")
+    return purged
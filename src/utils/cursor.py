@@ -0,0 +1,75 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from uuid import UUID
+
+from sqlalchemy import Select, func, select, tuple_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from core.exceptions import InvalidCursorException
+from schemas.pagination_schema import CursorPage, CursorParams
+
+
+def encode_cursor(created_at: datetime, id: UUID) -> str:
+    raw = f"{created_at.isoformat()}|{id}".encode()
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, UUID]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, id = urlsafe_b64decode(padded).decode().split("|")
+        return datetime.fromisoformat(created_at), UUID(id)
+    except ValueError as exc:
+        raise InvalidCursorException() from exc
+
+
+async def keyset_paginate(
+    session: AsyncSession,
+    stmt: Select,
+    params: CursorParams,
+    key: tuple[InstrumentedAttribute, InstrumentedAttribute],
+    descending: bool = False,
+) -> CursorPage:
+    """
+    Pagina por (created_at, id) sem OFFSET: cada página continua a partir
+    da última linha da anterior, então o custo não cresce com a
+    profundidade. O COUNT(*) só roda quando ``include_total`` é pedido.
+    """
+    created_at, id = key
+    stmt = stmt.order_by(None)
+
+    total = None
+    if params.include_total:
+        total = await session.scalar(
+            select(func.count()).select_from(stmt.subquery())
+        )
+
+    if params.cursor is not None:
+        row_key = tuple_(created_at, id)
+        position = tuple_(*decode_cursor(params.cursor))
+        stmt = stmt.where(
+            row_key < position if descending else row_key > position
+        )
+
+    if descending:
+        stmt = stmt.order_by(created_at.desc(), id.desc())
+    else:
+        stmt = stmt.order_by(created_at.asc(), id.asc())
+
+    rows = (await session.scalars(stmt.limit(params.size + 1))).all()
+    items = rows[: params.size]
+
+    next_cursor = None
+    if len(rows) > params.size:
+        last = items[-1]
+        next_cursor = encode_cursor(
+            getattr(last, created_at.key), getattr(last, id.key)
+        )
+
+    return CursorPage(
+        items=items,
+        size=params.size,
+        next_cursor=next_cursor,
+        total=total,
+    )
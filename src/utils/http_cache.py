@@ -0,0 +1,74 @@
+"""
+Helpers de requisições condicionais (ETag / If-None-Match / If-Match).
+
+Os ETags são derivados de versões já conhecidas (``version`` do
+agendamento, impressão digital do catálogo), nunca do corpo serializado:
+assim a comparação acontece antes de buscar ou serializar o recurso. Os
+de leitura são fracos; o do agendamento, usado em ``If-Match``, é forte.
+"""
+
+import hashlib
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Monta um ETag fraco a partir das partes que versionam o recurso."""
+    digest = hashlib.blake2b(
+        "|".join(map(str, parts)).encode(), digest_size=16
+    ).hexdigest()
+    return f'W/"{digest}"'
+
+
+def make_strong_etag(*parts: object) -> str:
+    """
+    ETag forte com as partes legíveis (``"<id>:<versão>"``), para
+    recursos cujas escritas aceitam ``If-Match``.
+    """
+    return '"' + ":".join(map(str, parts)) + '"'
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """
+    Indica se algum dos ETags de ``If-None-Match`` corresponde ao atual.
+    A comparação é fraca, como exige a RFC 9110 para esse cabeçalho.
+    """
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return _matches(header, etag)
+
+
+def is_precondition_met(if_match: str, etag: str) -> bool:
+    """
+    Indica se ``If-Match`` aceita o ETag atual. A comparação é forte, como
+    exige a RFC 9110 para esse cabeçalho: um ETag fraco nunca satisfaz a
+    precondição.
+    """
+    return _matches(if_match, etag, weak=False)
+
+
+def _matches(header: str, etag: str, weak: bool = True) -> bool:
+    if header.strip() == "*":
+        return True
+    if not weak:
+        return not etag.startswith("W/") and any(
+            tag.strip() == etag for tag in header.split(",")
+        )
+    opaque = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == opaque for tag in header.split(",")
+    )
+
+
+def not_modified(response: Response, etag: str) -> Response:
+    """
+    Resposta 304 vazia. Os cabeçalhos definidos pelas dependências no
+    ``response`` injetado (como ``Cache-Control``) não são aplicados a uma
+    ``Response`` retornada diretamente, então são copiados aqui.
+    """
+    headers = {"ETag": etag}
+    cache_control = response.headers.get("cache-control")
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
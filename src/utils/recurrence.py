@@ -0,0 +1,110 @@
+"""
+Datas e identidade das ocorrências de uma série de agendamentos.
+
+As ocorrências são calculadas a partir da série: só as que entram na
+janela de materialização viram linhas em ``appointments``, as demais
+aparecem nas listagens como ocorrências virtuais. O id e o created_at de
+cada ocorrência são derivados da série, então a linha materializada tem
+os mesmos valores (e a mesma posição na listagem) que a ocorrência
+virtual exibida antes dela.
+"""
+
+import calendar
+from collections.abc import Iterator
+from datetime import date, datetime, timedelta
+from uuid import UUID, uuid5
+
+from enums import AppointmentStatus, RecurrenceFrequency
+from models import (
+    AppointmentModel,
+    AppointmentSeriesModel,
+    AppointmentServiceModel,
+)
+
+MAX_SERIES_OCCURRENCES = 260
+
+_STEP_WEEKS = {
+    RecurrenceFrequency.WEEKLY: 1,
+    RecurrenceFrequency.BIWEEKLY: 2,
+}
+
+
+def _add_months(day: date, months: int) -> date:
+    index = day.month - 1 + months
+    year, month = day.year + index // 12, index % 12 + 1
+    return date(year, month, min(day.day, calendar.monthrange(year, month)[1]))
+
+
+def occurrence_dates(
+    frequency: RecurrenceFrequency,
+    start: date,
+    until: date | None = None,
+    count: int | None = None,
+) -> Iterator[tuple[int, date]]:
+    """
+    Gera (posição, data) das ocorrências a partir de ``start``, até
+    ``until`` (inclusive) ou até ``count`` ocorrências. A série mensal
+    mantém o dia do mês de ``start``, limitado ao último dia nos meses
+    mais curtos.
+    """
+    index = 0
+    while count is None or index < count:
+        if frequency == RecurrenceFrequency.MONTHLY:
+            day = _add_months(start, index)
+        else:
+            day = start + timedelta(weeks=_STEP_WEEKS[frequency] * index)
+        if until is not None and day > until:
+            return
+        yield index, day
+        index += 1
+
+
+def occurrence_id(series_id: UUID, day: date) -> UUID:
+    return uuid5(series_id, day.isoformat())
+
+
+def occurrence_created_at(created_at: datetime, index: int) -> datetime:
+    """
+    created_at da ocorrência: o da série, recuado ``index`` microssegundos.
+    Nas listagens (mais recentes primeiro) a série fica contígua e em
+    ordem de data, esteja a ocorrência materializada ou não.
+    """
+    return created_at - timedelta(microseconds=index)
+
+
+def build_occurrences(
+    series: AppointmentSeriesModel,
+    after: date | None = None,
+    through: date | None = None,
+    virtual: bool = False,
+) -> Iterator[AppointmentModel]:
+    """
+    Ocorrências da série com data em (``after``, ``through``], como
+    agendamentos pendentes sem admin, na ordem das datas. As virtuais não
+    vão para o banco, usam o ``updated_at`` da série e a versão inicial.
+    """
+    dates = occurrence_dates(
+        series.frequency, series.start_date, series.until, series.occurrences
+    )
+    for index, day in dates:
+        if after is not None and day <= after:
+            continue
+        if through is not None and day > through:
+            return
+        occurrence = AppointmentModel(
+            id=occurrence_id(series.id, day),
+            date=day,
+            client_id=series.client_id,
+            series_id=series.id,
+            created_at=occurrence_created_at(series.created_at, index),
+            services=[
+                AppointmentServiceModel(service_id=id)
+                for id in series.service_ids
+            ],
+        )
+        if virtual:
+            occurrence.status = AppointmentStatus.PENDING
+            occurrence.updated_at = series.updated_at
+            occurrence.version = 1
+            occurrence.virtual = True
+        yield occurrence
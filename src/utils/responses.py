@@ -0,0 +1,47 @@
+"""
+Respostas com o JSON já serializado.
+
+Quando o endpoint retorna um modelo, o FastAPI o valida de novo contra o
+``response_model``, converte tudo em dicts e só então gera o JSON. Nas
+respostas grandes e já validadas pelo service, os bytes saem direto de um
+``TypeAdapter`` do schema (ou de um snapshot pré-serializado); o
+``response_model`` continua na rota para a documentação.
+
+As demais rotas usam o ``ORJSONResponse``, classe padrão da aplicação.
+"""
+
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import TypeAdapter
+
+
+def json_response(
+    content: bytes,
+    response: Response,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Resposta com o JSON pronto. Assim como em ``not_modified``, os
+    cabeçalhos definidos no ``response`` injetado (``Cache-Control``,
+    ``ETag``) são copiados para a resposta retornada.
+    """
+    rendered = Response(
+        content, status_code=status_code, media_type="application/json"
+    )
+    rendered.raw_headers.extend(response.raw_headers)
+    return rendered
+
+
+def model_response(
+    adapter: TypeAdapter[Any],
+    content: Any,
+    response: Response,
+    status_code: int = status.HTTP_200_OK,
+) -> Response:
+    """
+    Valida ``content`` (modelos ORM, por exemplo) contra o schema do
+    adapter uma única vez e serializa o resultado direto em bytes.
+    """
+    validated = adapter.validate_python(content, from_attributes=True)
+    return json_response(adapter.dump_json(validated), response, status_code)
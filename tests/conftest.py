@@ -0,0 +1,172 @@
+"""
+Fixtures dos testes.
+
+Os testes que tocam o banco usam um Postgres de verdade (advisory locks,
+``= ANY``, ``EXPLAIN``): o banco ``TEST_POSTGRES_DB`` (padrão
+``appointment_test``) no mesmo servidor de ``POSTGRES_*`` é recriado a
+partir dos modelos no início da sessão e esvaziado depois de cada teste.
+Sem Postgres acessível, esses testes são pulados.
+"""
+
+import asyncio
+import os
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from uuid import uuid4
+
+# Precisa valer antes de qualquer import do app: engine e settings são
+# criados na importação.
+os.environ["POSTGRES_DB"] = os.environ.get(
+    "TEST_POSTGRES_DB", "appointment_test"
+)
+os.environ.pop("DATABASE_URL", None)
+os.environ.pop("DB_REPLICA_URL", None)
+os.environ.setdefault("DEBUG", "false")
+os.environ.setdefault("EMAIL_TRANSPORT", "fake")
+os.environ.setdefault("SQL_BUDGET_RAISE", "true")
+
+import httpx  # noqa: E402
+import pytest  # noqa: E402
+import pytest_asyncio  # noqa: E402
+from sqlalchemy import text  # noqa: E402
+from sqlalchemy.engine import make_url  # noqa: E402
+from sqlalchemy.exc import DBAPIError  # noqa: E402
+from sqlalchemy.ext.asyncio import create_async_engine  # noqa: E402
+
+from app import app_fast  # noqa: E402
+from core.cache.service_catalog import service_catalog  # noqa: E402
+from core.db.base import Base  # noqa: E402
+from core.db.session import AsyncSessionLocal, engine  # noqa: E402
+from core.security import create_access_token  # noqa: E402
+from core.settings import get_settings  # noqa: E402
+from enums import UserRole, WeekDay  # noqa: E402
+from models import (  # noqa: E402
+    AdminWeeklyCapacityModel,
+    ServiceModel,
+    UserModel,
+)
+
+settings = get_settings()
+
+
+async def _create_schema() -> None:
+    url = make_url(settings.ASYNC_DATABASE_URL)
+    server = create_async_engine(
+        url.set(database="postgres"), isolation_level="AUTOCOMMIT"
+    )
+    try:
+        async with server.connect() as connection:
+            exists = await connection.scalar(
+                text("SELECT 1 FROM pg_database WHERE datname = :name"),
+                {"name": url.database},
+            )
+            if not exists:
+                await connection.execute(
+                    text(f'CREATE DATABASE "{url.database}"')
+                )
+    finally:
+        await server.dispose()
+
+    database = create_async_engine(url)
+    try:
+        async with database.begin() as connection:
+            await connection.run_sync(Base.metadata.drop_all)
+            await connection.run_sync(Base.metadata.create_all)
+    finally:
+        await database.dispose()
+
+
+@pytest.fixture(scope="session")
+def database() -> None:
+    try:
+        asyncio.run(_create_schema())
+    except (OSError, DBAPIError) as exc:
+        pytest.skip(f"Postgres indisponível: {exc}")
+
+
+@pytest_asyncio.fixture
+async def db(database):
+    """
+    Banco limpo para o teste. As conexões do engine do app ficam presas
+    ao event loop de cada teste, então o pool é descartado no fim.
+    """
+    await service_catalog.bump()
+    yield
+    tables = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    async with engine.begin() as connection:
+        await connection.execute(text(f"TRUNCATE {tables} CASCADE"))
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def session(db):
+    async with AsyncSessionLocal() as session:
+        yield session
+
+
+@pytest_asyncio.fixture
+async def client(db):
+    transport = httpx.ASGITransport(app=app_fast)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def make_user(session):
+    async def make_user(role: UserRole = UserRole.CLIENT) -> UserModel:
+        user = UserModel(
+            name=f"{role.value} {uuid4().hex[:8]}",
+            email=f"{uuid4().hex}@example.com",
+            role=role,
+            phone="11999999999",
+        )
+        session.add(user)
+        await session.commit()
+        return user
+
+    return make_user
+
+
+@pytest_asyncio.fixture
+async def make_admin(session, make_user):
+    async def make_admin(daily_limit: int = 5) -> UserModel:
+        admin = await make_user(UserRole.ADMIN)
+        session.add_all(
+            AdminWeeklyCapacityModel(
+                admin_id=admin.id, week_day=week_day, limit=daily_limit
+            )
+            for week_day in WeekDay
+        )
+        await session.commit()
+        return admin
+
+    return make_admin
+
+
+@pytest_asyncio.fixture
+async def service(session) -> ServiceModel:
+    service = ServiceModel(
+        name=f"service {uuid4().hex[:8]}",
+        description="Serviço de teste",
+        price=Decimal("50.00"),
+    )
+    session.add(service)
+    await session.commit()
+    return service
+
+
+@pytest.fixture
+def day() -> date:
+    """Um dia dentro da janela de disponibilidade."""
+    return datetime.now(UTC).date() + timedelta(days=7)
+
+
+@pytest.fixture
+def auth_headers():
+    def auth_headers(user: UserModel, **headers: str) -> dict[str, str]:
+        token, _ = create_access_token({"sub": str(user.id)})
+        return {"Authorization": f"Bearer {token}", **headers}
+
+    return auth_headers
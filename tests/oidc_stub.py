@@ -0,0 +1,101 @@
+"""
+Provedor OIDC falso para os testes do login com Google.
+
+Serve discovery, JWKS, token e userinfo como um app ASGI, usado pelo
+cliente do authlib através de ``httpx.ASGITransport``, e conta quantas
+vezes cada endpoint foi chamado. A chave de assinatura pode ser trocada
+(rotação) e o email pode ser omitido do ID token, para forçar o uso do
+endpoint de userinfo.
+"""
+
+import time
+from collections import Counter
+from secrets import token_urlsafe
+
+from authlib.jose import JsonWebKey, jwt
+from starlette.applications import Starlette
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+from starlette.routing import Route
+
+ISSUER = "https://oidc.test"
+DISCOVERY_URL = f"{ISSUER}/.well-known/openid-configuration"
+CLIENT_ID = "test-client"
+EMAIL = "stub-user@example.com"
+
+
+class StubOIDCProvider:
+    def __init__(self):
+        self.hits: Counter[str] = Counter()
+        self.include_email = True
+        self._codes: dict[str, str] = {}
+        self._key = self._generate_key()
+        self.app = Starlette(
+            routes=[
+                Route("/.well-known/openid-configuration", self.discovery),
+                Route("/jwks", self.jwks),
+                Route("/token", self.token, methods=["POST"]),
+                Route("/userinfo", self.userinfo),
+            ]
+        )
+
+    @staticmethod
+    def _generate_key():
+        return JsonWebKey.generate_key(
+            "RSA", 2048, is_private=True, options={"kid": token_urlsafe(8)}
+        )
+
+    def rotate_key(self) -> None:
+        self._key = self._generate_key()
+
+    def authorize(self, nonce: str) -> str:
+        """Código de autorização que o ``/token`` troca por um ID token."""
+        code = token_urlsafe(16)
+        self._codes[code] = nonce
+        return code
+
+    async def discovery(self, request: Request) -> JSONResponse:
+        self.hits["discovery"] += 1
+        return JSONResponse({
+            "issuer": ISSUER,
+            "authorization_endpoint": f"{ISSUER}/authorize",
+            "token_endpoint": f"{ISSUER}/token",
+            "userinfo_endpoint": f"{ISSUER}/userinfo",
+            "jwks_uri": f"{ISSUER}/jwks",
+            "id_token_signing_alg_values_supported": ["RS256"],
+        })
+
+    async def jwks(self, request: Request) -> JSONResponse:
+        self.hits["jwks"] += 1
+        return JSONResponse({"keys": [self._key.as_dict(is_private=False)]})
+
+    async def token(self, request: Request) -> JSONResponse:
+        self.hits["token"] += 1
+        form = await request.form()
+        now = int(time.time())
+        claims = {
+            "iss": ISSUER,
+            "aud": CLIENT_ID,
+            "sub": "stub-user",
+            "name": "Stub User",
+            "nonce": self._codes.pop(form["code"]),
+            "iat": now,
+            "exp": now + 600,
+        }
+        if self.include_email:
+            claims["email"] = EMAIL
+        header = {"alg": "RS256", "kid": self._key.as_dict()["kid"]}
+        return JSONResponse({
+            "access_token": token_urlsafe(16),
+            "token_type": "Bearer",
+            "expires_in": 600,
+            "id_token": jwt.encode(header, claims, self._key).decode(),
+        })
+
+    async def userinfo(self, request: Request) -> JSONResponse:
+        self.hits["userinfo"] += 1
+        return JSONResponse({
+            "sub": "stub-user",
+            "email": EMAIL,
+            "name": "Stub User",
+        })
@@ -0,0 +1,91 @@
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+from test_appointment_statements import statements
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def book(client, service, day, auth_headers):
+    async def book(user, admin=None) -> str:
+        payload = {"date": day.isoformat(), "services": [str(service.id)]}
+        if admin is not None:
+            payload["admin_id"] = str(admin.id)
+        response = await client.post(
+            "/appointments/", json=payload, headers=auth_headers(user)
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.text
+        return response.json()["id"]
+
+    return book
+
+
+@pytest.fixture
+def remaining(client, day, auth_headers):
+    async def remaining(admin) -> list[int]:
+        response = await client.get(
+            "/appointments/availability",
+            params={
+                "from": day.isoformat(),
+                "to": day.isoformat(),
+                "admin_id": str(admin.id),
+            },
+            headers=auth_headers(admin),
+        )
+        assert response.status_code == HTTPStatus.OK, response.text
+        return response.json()["admins"][0]["remaining"]
+
+    return remaining
+
+
+async def test_cancel_batch_reports_each_id(  # noqa: PLR0913, PLR0917
+    client, make_user, make_admin, book, remaining, auth_headers
+):
+    admin = await make_admin(daily_limit=1)
+    user = await make_user()
+    other = await make_user()
+    assigned = await book(user, admin)
+    unassigned = await book(user)
+    already_cancelled = await book(user)
+    response = await client.post(
+        f"/appointments/{already_cancelled}/cancel",
+        json={"cancel_reason": "Imprevisto"},
+        headers=auth_headers(user),
+    )
+    assert response.status_code == HTTPStatus.OK
+    not_owned = await book(other)
+    missing = str(uuid4())
+    # Carrega a vaga ocupada na grade antes do cancelamento.
+    assert await remaining(admin) == [0]
+
+    ids = [assigned, missing, not_owned, unassigned, already_cancelled]
+    response = await client.post(
+        "/appointments/cancel-batch",
+        json={"ids": ids, "cancel_reason": "Mudança de planos"},
+        headers=auth_headers(user),
+    )
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS, response.text
+    assert statements(response) == 1
+    body = response.json()
+    assert (body["succeeded"], body["failed"]) == (2, 3)
+    assert [item["id"] for item in body["items"]] == ids
+    assert [item["status_code"] for item in body["items"]] == [
+        HTTPStatus.OK,
+        HTTPStatus.NOT_FOUND,
+        HTTPStatus.BAD_REQUEST,
+        HTTPStatus.OK,
+        HTTPStatus.BAD_REQUEST,
+    ]
+    assert body["items"][2]["detail"].endswith(
+        "can only be cancelled by the client or assigned admin"
+    )
+    assert body["items"][4]["detail"] == "This appointment cannot be cancelled"
+    # A vaga liberada aparece na grade sem esperar o TTL.
+    assert await remaining(admin) == [1]
+    stored = await client.get(
+        f"/appointments/{not_owned}", headers=auth_headers(other)
+    )
+    assert stored.json()["status"] == "pending"
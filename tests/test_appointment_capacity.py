@@ -0,0 +1,54 @@
+import asyncio
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import func, select
+
+from enums import UserRole
+from models import AppointmentModel
+
+pytestmark = pytest.mark.asyncio
+
+CAPACITY = 5
+CONCURRENT_BOOKINGS = 200
+
+
+async def test_parallel_bookings_never_exceed_admin_capacity(  # noqa: PLR0913, PLR0917
+    client, session, make_user, make_admin, service, day, auth_headers
+):
+    admin = await make_admin(daily_limit=CAPACITY)
+    clients = [await make_user(UserRole.CLIENT) for _ in range(20)]
+    payload = {
+        "date": day.isoformat(),
+        "services": [str(service.id)],
+        "admin_id": str(admin.id),
+    }
+
+    responses = await asyncio.gather(
+        *(
+            client.post(
+                "/appointments/",
+                json=payload,
+                headers=auth_headers(clients[index % len(clients)]),
+            )
+            for index in range(CONCURRENT_BOOKINGS)
+        )
+    )
+
+    created = [r for r in responses if r.status_code == HTTPStatus.CREATED]
+    rejected = [r for r in responses if r.status_code != HTTPStatus.CREATED]
+    assert len(created) == CAPACITY
+    assert len(rejected) == CONCURRENT_BOOKINGS - CAPACITY
+    for response in rejected:
+        assert response.status_code == HTTPStatus.BAD_REQUEST
+        assert response.json()["message"] == "Admin not available"
+
+    stored = await session.scalar(
+        select(func.count())
+        .select_from(AppointmentModel)
+        .where(
+            AppointmentModel.admin_id == admin.id,
+            AppointmentModel.date == day,
+        )
+    )
+    assert stored == CAPACITY
@@ -0,0 +1,73 @@
+from http import HTTPStatus
+
+import pytest
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def book(client, service, day, auth_headers):
+    async def book(user, admin=None) -> dict:
+        payload = {"date": day.isoformat(), "services": [str(service.id)]}
+        if admin is not None:
+            payload["admin_id"] = str(admin.id)
+        response = await client.post(
+            "/appointments/", json=payload, headers=auth_headers(user)
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.text
+        return response.json()
+
+    return book
+
+
+async def test_single_and_batch_confirm_agree_on_assigned_appointments(
+    client, make_user, make_admin, book, auth_headers
+):
+    admin = await make_admin()
+    user = await make_user()
+    single = await book(user, admin)
+    batch = await book(user, admin)
+    assert single["status"] == batch["status"] == "pending"
+
+    confirmed = await client.post(
+        f"/appointments/{single['id']}/confirm", headers=auth_headers(admin)
+    )
+    batch_confirmed = await client.post(
+        "/appointments/confirm-batch",
+        json={"ids": [batch["id"]]},
+        headers=auth_headers(admin),
+    )
+
+    assert confirmed.status_code == HTTPStatus.OK, confirmed.text
+    assert confirmed.json()["status"] == "confirmed"
+    assert batch_confirmed.status_code == HTTPStatus.OK, batch_confirmed.text
+    assert batch_confirmed.json()["items"][0]["status"] == "confirmed"
+    for appointment in (single, batch):
+        stored = await client.get(
+            f"/appointments/{appointment['id']}", headers=auth_headers(admin)
+        )
+        assert stored.json()["status"] == "confirmed"
+        assert stored.json()["admin_id"] == str(admin.id)
+
+
+async def test_single_and_batch_confirm_reject_another_admins_appointment(
+    client, make_user, make_admin, book, auth_headers
+):
+    owner = await make_admin()
+    other = await make_admin()
+    appointment = await book(await make_user(), owner)
+
+    confirmed = await client.post(
+        f"/appointments/{appointment['id']}/confirm",
+        headers=auth_headers(other),
+    )
+    batch_confirmed = await client.post(
+        "/appointments/confirm-batch",
+        json={"ids": [appointment["id"]]},
+        headers=auth_headers(other),
+    )
+
+    assert confirmed.status_code == HTTPStatus.BAD_REQUEST
+    item = batch_confirmed.json()["items"][0]
+    assert item["status_code"] == confirmed.status_code
+    assert item["detail"] == confirmed.json()["detail"]
@@ -0,0 +1,89 @@
+import json
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import event
+
+from core.db.session import engine
+from enums import UserRole
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def captured():
+    """Statements (com parâmetros) que tocam ``appointments``."""
+    statements = []
+
+    def capture(statement, parameters, **kw):
+        if "FROM appointments" in statement:
+            statements.append((statement, parameters))
+
+    event.listen(
+        engine.sync_engine, "before_cursor_execute", capture, named=True
+    )
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+
+def seq_scans(plan: dict) -> list[str]:
+    """Relações lidas com Seq Scan em qualquer nível do plano."""
+    found = []
+    if plan["Node Type"] == "Seq Scan":
+        found.append(plan["Relation Name"])
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child))
+    return found
+
+
+async def explain(statement: str, parameters) -> dict:
+    async with engine.connect() as connection:
+        await connection.exec_driver_sql("SET enable_seqscan = off")
+        result = await connection.exec_driver_sql(
+            f"EXPLAIN (FORMAT JSON) {statement}", parameters
+        )
+        plan = result.scalar_one()
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]
+
+
+async def test_listing_and_availability_use_indexes(  # noqa: PLR0913, PLR0917
+    client, captured, make_user, make_admin, service, day, auth_headers
+):
+    admin = await make_admin()
+    user = await make_user(UserRole.CLIENT)
+    payload = {
+        "date": day.isoformat(),
+        "services": [str(service.id)],
+        "admin_id": str(admin.id),
+    }
+    await client.post(
+        "/appointments/", json=payload, headers=auth_headers(user)
+    )
+    captured.clear()
+
+    window = {"from": day.isoformat(), "to": day.isoformat()}
+    requests = [
+        ("/appointments/", {}, user),
+        ("/appointments/", {"status": "pending"}, admin),
+        ("/appointments/cursor", {}, user),
+        ("/appointments/cursor", {"status": "pending"}, admin),
+        ("/appointments/availability", window, user),
+        (
+            "/appointments/availability",
+            {**window, "admin_id": str(admin.id)},
+            user,
+        ),
+    ]
+    for path, params, requester in requests:
+        response = await client.get(
+            path, params=params, headers=auth_headers(requester)
+        )
+        assert response.status_code == HTTPStatus.OK, response.text
+
+    # A grade de disponibilidade em cache só consulta o banco uma vez.
+    assert any("days.day" in statement for statement, _ in captured)
+    for statement, parameters in list(captured):
+        plan = await explain(statement, parameters)
+        assert "appointments" not in seq_scans(plan), statement
@@ -0,0 +1,329 @@
+from datetime import UTC, date, datetime, timedelta
+from decimal import Decimal
+from http import HTTPStatus
+from uuid import UUID
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+
+from core.db.session import AsyncSessionLocal
+from core.settings import get_settings
+from enums import RecurrenceFrequency, UserRole
+from models import (
+    AppointmentModel,
+    AppointmentSeriesModel,
+    AppointmentServiceModel,
+    ServiceModel,
+)
+from repositories.appointment_series_repository import (
+    AppointmentSeriesRepository,
+)
+from repositories.appointments_repository import AppointmentsRepository
+from repositories.services_repository import ServicesRepository
+from services.appointment_series_service import AppointmentSeriesService
+from utils.recurrence import MAX_SERIES_OCCURRENCES, occurrence_dates
+
+pytestmark = pytest.mark.asyncio
+
+OCCURRENCES = 10
+# Com a janela padrão de 28 dias, uma série semanal que começa amanhã
+# tem 4 ocorrências materializadas na criação.
+MATERIALIZED = 4
+WIDE_WINDOW_DAYS = 60
+
+
+@pytest.fixture
+def today() -> date:
+    return datetime.now(UTC).date()
+
+
+@pytest.fixture
+def create_series(client, service, today, auth_headers):
+    async def create_series(user, **payload) -> dict:
+        payload = {
+            "frequency": RecurrenceFrequency.WEEKLY.value,
+            "start_date": (today + timedelta(days=1)).isoformat(),
+            "services": [str(service.id)],
+            "occurrences": OCCURRENCES,
+            **payload,
+        }
+        response = await client.post(
+            "/appointments/series", json=payload, headers=auth_headers(user)
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.text
+        return response.json()
+
+    return create_series
+
+
+@pytest_asyncio.fixture
+async def materialize(db, monkeypatch):
+    """Uma execução do worker, com a janela aumentada para 60 dias."""
+
+    async def materialize() -> int:
+        with monkeypatch.context() as patch:
+            patch.setattr(
+                get_settings(),
+                "APPOINTMENT_SERIES_WINDOW_DAYS",
+                WIDE_WINDOW_DAYS,
+            )
+            async with AsyncSessionLocal() as session:
+                service = AppointmentSeriesService(
+                    AppointmentSeriesRepository(session),
+                    AppointmentsRepository(session),
+                    ServicesRepository(session),
+                )
+                return await service.materialize_due()
+
+    return materialize
+
+
+async def materialized(series_id: str) -> list[AppointmentModel]:
+    async with AsyncSessionLocal() as session:
+        result = await session.scalars(
+            select(AppointmentModel)
+            .where(AppointmentModel.series_id == UUID(series_id))
+            .order_by(AppointmentModel.date)
+        )
+        return list(result)
+
+
+async def list_all(client, headers, size: int) -> tuple[list[dict], int]:
+    items, page = [], 1
+    while True:
+        response = await client.get(
+            "/appointments/",
+            params={"page": page, "size": size},
+            headers=headers,
+        )
+        assert response.status_code == HTTPStatus.OK, response.text
+        body = response.json()
+        items.extend(body["items"])
+        if page >= body["pages"]:
+            return items, body["total"]
+        page += 1
+
+
+@pytest.mark.parametrize(
+    ("start", "expected"),
+    [
+        (
+            date(2027, 1, 31),
+            [
+                date(2027, 1, 31),
+                date(2027, 2, 28),
+                date(2027, 3, 31),
+                date(2027, 4, 30),
+            ],
+        ),
+        (
+            date(2027, 12, 31),
+            [
+                date(2027, 12, 31),
+                date(2028, 1, 31),
+                date(2028, 2, 29),
+                date(2028, 3, 31),
+            ],
+        ),
+        (
+            date(2027, 3, 15),
+            [
+                date(2027, 3, 15),
+                date(2027, 4, 15),
+                date(2027, 5, 15),
+                date(2027, 6, 15),
+            ],
+        ),
+    ],
+)
+def test_monthly_series_clamps_to_the_last_day_of_the_month(start, expected):
+    dates = occurrence_dates(RecurrenceFrequency.MONTHLY, start, count=4)
+
+    assert [day for _, day in dates] == expected
+
+
+@pytest.mark.parametrize(
+    ("frequency", "until", "count", "expected"),
+    [
+        # ``until`` inclusivo, mesmo caindo entre duas ocorrências.
+        (RecurrenceFrequency.WEEKLY, date(2027, 1, 15), None, 3),
+        (RecurrenceFrequency.WEEKLY, date(2027, 1, 14), None, 2),
+        (RecurrenceFrequency.BIWEEKLY, date(2027, 1, 28), None, 2),
+        (RecurrenceFrequency.MONTHLY, date(2027, 3, 1), None, 3),
+        (RecurrenceFrequency.BIWEEKLY, None, 5, 5),
+    ],
+)
+def test_series_ends_on_until_or_after_count(
+    frequency, until, count, expected
+):
+    dates = list(occurrence_dates(frequency, date(2027, 1, 1), until, count))
+
+    assert len(dates) == expected
+    assert [index for index, _ in dates] == list(range(expected))
+
+
+async def test_series_stops_at_the_occurrence_cap(  # noqa: PLR0913, PLR0917
+    client, make_user, create_series, service, today, auth_headers
+):
+    user = await make_user()
+    start = today + timedelta(days=1)
+    last = start + timedelta(weeks=MAX_SERIES_OCCURRENCES - 1)
+
+    created = await create_series(user, occurrences=None, until=str(last))
+    too_long = await client.post(
+        "/appointments/series",
+        json={
+            "frequency": RecurrenceFrequency.WEEKLY.value,
+            "start_date": start.isoformat(),
+            "services": [str(service.id)],
+            "until": (last + timedelta(weeks=1)).isoformat(),
+        },
+        headers=auth_headers(user),
+    )
+
+    assert created["ends_on"] == last.isoformat()
+    assert too_long.status_code == HTTPStatus.BAD_REQUEST, too_long.text
+    assert str(MAX_SERIES_OCCURRENCES) in too_long.json()["detail"]
+
+
+async def test_listing_merges_virtual_occurrences_across_pages(  # noqa: PLR0913, PLR0917
+    client, make_user, create_series, service, today, auth_headers
+):
+    user = await make_user()
+    series = await create_series(user)
+    # Agendamentos avulsos, mais recentes que a série, abrem a listagem.
+    for _ in range(3):
+        response = await client.post(
+            "/appointments/",
+            json={
+                "date": (today + timedelta(days=3)).isoformat(),
+                "services": [str(service.id)],
+            },
+            headers=auth_headers(user),
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.text
+
+    one_page, total = await list_all(client, auth_headers(user), size=100)
+    paged, paged_total = await list_all(client, auth_headers(user), size=4)
+
+    assert total == paged_total == OCCURRENCES + 3
+    assert [item["id"] for item in paged] == [item["id"] for item in one_page]
+    occurrences = [item for item in one_page if item["series_id"]]
+    assert [item["date"] for item in occurrences] == [
+        (today + timedelta(days=1, weeks=week)).isoformat()
+        for week in range(OCCURRENCES)
+    ]
+    assert [item["virtual"] for item in occurrences] == [
+        week >= MATERIALIZED for week in range(OCCURRENCES)
+    ]
+    assert all(item["series_id"] == series["id"] for item in occurrences)
+
+
+async def test_worker_advances_the_window_once(  # noqa: PLR0913, PLR0917
+    client, make_user, create_series, materialize, today, auth_headers
+):
+    user = await make_user()
+    series = await create_series(user)
+    before, _ = await list_all(client, auth_headers(user), size=100)
+    assert len(await materialized(series["id"])) == MATERIALIZED
+
+    first = await materialize()
+    second = await materialize()
+
+    assert (first, second) == (1, 0)
+    rows = await materialized(series["id"])
+    window_end = today + timedelta(days=WIDE_WINDOW_DAYS)
+    expected = [
+        day
+        for week in range(OCCURRENCES)
+        if (day := today + timedelta(days=1, weeks=week)) <= window_end
+    ]
+    assert [row.date for row in rows] == expected
+    # As ocorrências materializadas mantêm id e posição das virtuais.
+    after, _ = await list_all(client, auth_headers(user), size=100)
+    assert [item["id"] for item in after] == [item["id"] for item in before]
+    assert sum(item["virtual"] for item in after) == OCCURRENCES - len(
+        expected
+    )
+
+
+async def test_worker_skips_services_deleted_after_the_series(  # noqa: PLR0913, PLR0917
+    client, session, make_user, create_series, materialize, auth_headers
+):
+    user = await make_user()
+    admin = await make_user(UserRole.ADMIN)
+    kept, deleted = (
+        ServiceModel(name=name, description=name, price=Decimal("10.00"))
+        for name in ("kept", "deleted")
+    )
+    session.add_all([kept, deleted])
+    await session.commit()
+    partial = await create_series(
+        user, services=[str(kept.id), str(deleted.id)]
+    )
+    orphan = await create_series(user, services=[str(deleted.id)])
+
+    response = await client.delete(
+        f"/services/{deleted.id}", headers=auth_headers(admin)
+    )
+    assert response.status_code == HTTPStatus.NO_CONTENT
+
+    assert await materialize() == 2  # noqa: PLR2004
+    assert await materialize() == 0
+
+    rows = await materialized(partial["id"])
+    assert len(rows) > MATERIALIZED
+    async with AsyncSessionLocal() as fresh:
+        links = await fresh.scalars(
+            select(AppointmentServiceModel.service_id).where(
+                AppointmentServiceModel.appointment_id.in_([
+                    row.id for row in rows
+                ])
+            )
+        )
+        assert set(links) == {kept.id}
+        stored = {
+            item.id: item
+            for item in await fresh.scalars(select(AppointmentSeriesModel))
+        }
+    assert stored[UUID(partial["id"])].service_ids == [kept.id]
+    assert stored[UUID(partial["id"])].cancelled_at is None
+    assert stored[UUID(orphan["id"])].cancelled_at is not None
+    assert len(await materialized(orphan["id"])) == MATERIALIZED
+
+
+async def test_cancel_series(
+    client, make_user, create_series, materialize, auth_headers
+):
+    user = await make_user()
+    series = await create_series(user)
+    path = f"/appointments/series/{series['id']}/cancel"
+    payload = {"cancel_reason": "mudança de planos"}
+
+    other = await client.post(
+        path, json=payload, headers=auth_headers(await make_user())
+    )
+    cancelled = await client.post(
+        path, json=payload, headers=auth_headers(user)
+    )
+    again = await client.post(path, json=payload, headers=auth_headers(user))
+
+    assert other.status_code == HTTPStatus.NOT_FOUND
+    assert cancelled.status_code == HTTPStatus.OK, cancelled.text
+    assert cancelled.json()["cancelled_at"] is not None
+    assert again.status_code == HTTPStatus.BAD_REQUEST
+    items, total = await list_all(client, auth_headers(user), size=100)
+    assert total == MATERIALIZED
+    assert {item["status"] for item in items} == {"cancelled"}
+    assert {item["cancel_reason"] for item in items} == {
+        payload["cancel_reason"]
+    }
+    assert await materialize() == 0
+    async with AsyncSessionLocal() as session:
+        count = await session.scalar(
+            select(func.count()).where(
+                AppointmentModel.series_id == UUID(series["id"])
+            )
+        )
+    assert count == MATERIALIZED
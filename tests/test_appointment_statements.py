@@ -0,0 +1,131 @@
+import re
+from http import HTTPStatus
+from uuid import uuid4
+
+import pytest
+from sqlalchemy import func, select
+
+from models import AppointmentModel
+
+pytestmark = pytest.mark.asyncio
+
+# Statements por escrita com o catálogo de serviços já carregado. Subir
+# algum desses números é regressão: a escrita voltou a recarregar o
+# agendamento depois do commit.
+CREATE_STATEMENTS = 2
+UPDATE_STATEMENTS = 2
+CONFIRM_STATEMENTS = 6
+CANCEL_STATEMENTS = 3
+# Criação em lote: trava dos (admin, dia), vagas e um INSERT por tabela,
+# qualquer que seja o tamanho do lote.
+BULK_STATEMENTS = 4
+
+_QUERIES = re.compile(r'desc="(\d+) queries"')
+
+
+def statements(response) -> int:
+    """Statements contados pelo QueryStatsMiddleware (Server-Timing)."""
+    match = _QUERIES.search(response.headers["Server-Timing"])
+    assert match is not None, response.headers["Server-Timing"]
+    return int(match.group(1))
+
+
+async def test_writes_do_not_reload_the_appointment(  # noqa: PLR0913, PLR0917
+    client, make_user, make_admin, service, day, auth_headers
+):
+    admin = await make_admin()
+    user = await make_user()
+    payload = {"date": day.isoformat(), "services": [str(service.id)]}
+    # Carrega o catálogo de serviços antes de medir.
+    await client.post(
+        "/appointments/", json=payload, headers=auth_headers(user)
+    )
+
+    created = await client.post(
+        "/appointments/", json=payload, headers=auth_headers(user)
+    )
+    assert created.status_code == HTTPStatus.CREATED
+    assert statements(created) == CREATE_STATEMENTS
+    appointment_id = created.json()["id"]
+
+    updated = await client.put(
+        f"/appointments/{appointment_id}",
+        json={"date": day.isoformat()},
+        headers=auth_headers(user),
+    )
+    assert updated.status_code == HTTPStatus.OK
+    assert statements(updated) == UPDATE_STATEMENTS
+
+    confirmed = await client.post(
+        f"/appointments/{appointment_id}/confirm",
+        headers=auth_headers(admin),
+    )
+    assert confirmed.status_code == HTTPStatus.OK
+    assert statements(confirmed) == CONFIRM_STATEMENTS
+
+    cancelled = await client.post(
+        f"/appointments/{appointment_id}/cancel",
+        json={"cancel_reason": "Imprevisto"},
+        headers=auth_headers(user),
+    )
+    assert cancelled.status_code == HTTPStatus.OK
+    assert statements(cancelled) == CANCEL_STATEMENTS
+    assert [item["id"] for item in cancelled.json()["services"]] == [
+        str(service.id)
+    ]
+
+
+async def test_bulk_create_uses_one_round_trip_per_step(  # noqa: PLR0913, PLR0917
+    client, session, make_user, make_admin, service, day, auth_headers
+):
+    admin = await make_admin(daily_limit=2)
+    user = await make_user()
+    await client.post(
+        "/appointments/",
+        json={"date": day.isoformat(), "services": [str(service.id)]},
+        headers=auth_headers(user),
+    )
+    assigned = {
+        "date": day.isoformat(),
+        "services": [str(service.id)],
+        "admin_id": str(admin.id),
+    }
+    unassigned = {"date": day.isoformat(), "services": [str(service.id)]}
+    unknown_service = {"date": day.isoformat(), "services": [str(uuid4())]}
+
+    response = await client.post(
+        "/appointments/bulk",
+        json={
+            "items": [
+                assigned,
+                unassigned,
+                assigned,
+                unknown_service,
+                assigned,
+                unassigned,
+            ]
+        },
+        headers=auth_headers(user),
+    )
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS, response.text
+    assert statements(response) == BULK_STATEMENTS
+    body = response.json()
+    assert (body["created"], body["failed"]) == (4, 2)
+    assert [item["status_code"] for item in body["items"]] == [
+        HTTPStatus.CREATED,
+        HTTPStatus.CREATED,
+        HTTPStatus.CREATED,
+        HTTPStatus.NOT_FOUND,
+        HTTPStatus.BAD_REQUEST,
+        HTTPStatus.CREATED,
+    ]
+    # O terceiro pedido para o admin não cabe no limite de 2 por dia,
+    # mesmo com as duas vagas ocupadas por itens do próprio lote.
+    assert body["items"][4]["message"] == "Admin not available"
+    booked = await session.scalar(
+        select(func.count())
+        .select_from(AppointmentModel)
+        .where(AppointmentModel.admin_id == admin.id)
+    )
+    assert booked == 2  # noqa: PLR2004
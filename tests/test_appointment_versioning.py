@@ -0,0 +1,159 @@
+from datetime import timedelta
+from decimal import Decimal
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import func, select
+
+from core.db.session import AsyncSessionLocal
+from models import AppointmentModel, ServiceModel
+from repositories.appointments_repository import AppointmentsRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_batch_confirm_skips_appointments_rescheduled_after_the_read(  # noqa: PLR0913, PLR0917
+    client,
+    session,
+    make_user,
+    make_admin,
+    service,
+    day,
+    auth_headers,
+    monkeypatch,
+):
+    admin = await make_admin(daily_limit=1)
+    full_day = day + timedelta(days=1)
+
+    async def book(on, admin_id=None):
+        payload = {"date": on.isoformat(), "services": [str(service.id)]}
+        if admin_id is not None:
+            payload["admin_id"] = str(admin_id)
+        response = await client.post(
+            "/appointments/",
+            json=payload,
+            headers=auth_headers(await make_user()),
+        )
+        assert response.status_code == HTTPStatus.CREATED, response.text
+        return response.json()["id"]
+
+    # A única vaga do admin em full_day já está ocupada.
+    await book(full_day, admin.id)
+    appointment_id = await book(day)
+
+    read = AppointmentsRepository.get_for_transition
+
+    async def read_then_reschedule(self, ids):
+        rows = await read(self, ids)
+        # O cliente remarca entre a leitura (vaga conferida em ``day``) e
+        # o UPDATE da confirmação.
+        async with AsyncSessionLocal() as other:
+            appointment = await other.get(AppointmentModel, appointment_id)
+            appointment.date = full_day
+            await other.commit()
+        return rows
+
+    monkeypatch.setattr(
+        AppointmentsRepository, "get_for_transition", read_then_reschedule
+    )
+    response = await client.post(
+        "/appointments/confirm-batch",
+        json={"ids": [appointment_id]},
+        headers=auth_headers(admin),
+    )
+
+    assert response.status_code == HTTPStatus.MULTI_STATUS, response.text
+    assert (
+        response.json()["items"][0]["status_code"]
+        == HTTPStatus.PRECONDITION_FAILED
+    )
+    appointment = await session.get(
+        AppointmentModel, appointment_id, populate_existing=True
+    )
+    assert appointment.status == "pending"
+    assert appointment.admin_id is None
+    booked = await session.scalar(
+        select(func.count())
+        .select_from(AppointmentModel)
+        .where(
+            AppointmentModel.admin_id == admin.id,
+            AppointmentModel.date == full_day,
+        )
+    )
+    assert booked == 1
+
+
+@pytest.fixture
+def appointment(client, make_user, service, day, auth_headers):
+    async def appointment() -> tuple[dict, dict]:
+        user = await make_user()
+        created = await client.post(
+            "/appointments/",
+            json={"date": day.isoformat(), "services": [str(service.id)]},
+            headers=auth_headers(user),
+        )
+        assert created.status_code == HTTPStatus.CREATED, created.text
+        return created.json(), auth_headers(user)
+
+    return appointment
+
+
+async def test_if_match_survives_unrelated_catalog_changes(  # noqa: PLR0913, PLR0917
+    client, session, make_admin, appointment, day, auth_headers
+):
+    created, headers = await appointment()
+    read = await client.get(f"/appointments/{created['id']}", headers=headers)
+    etag = read.headers["ETag"]
+    assert etag == f'"{created["id"]}:{created["version"]}"'
+
+    unrelated = ServiceModel(
+        name="unrelated", description="Outro", price=Decimal("10.00")
+    )
+    session.add(unrelated)
+    await session.commit()
+    renamed = await client.put(
+        f"/services/{unrelated.id}",
+        json={"name": "renamed"},
+        headers=auth_headers(await make_admin()),
+    )
+    assert renamed.status_code == HTTPStatus.OK, renamed.text
+
+    updated = await client.put(
+        f"/appointments/{created['id']}",
+        json={"date": (day + timedelta(days=2)).isoformat()},
+        headers={**headers, "If-Match": etag},
+    )
+
+    assert updated.status_code == HTTPStatus.OK, updated.text
+    assert updated.headers["ETag"] != etag
+
+
+@pytest.mark.parametrize(
+    "if_match",
+    [
+        "stale",  # versão anterior
+        "weak",  # If-Match exige comparação forte
+    ],
+)
+async def test_if_match_rejects_stale_or_weak_tags(
+    client, appointment, day, if_match
+):
+    created, headers = await appointment()
+    etag = f'"{created["id"]}:{created["version"]}"'
+    if if_match == "stale":
+        first = await client.put(
+            f"/appointments/{created['id']}",
+            json={"date": (day + timedelta(days=2)).isoformat()},
+            headers={**headers, "If-Match": etag},
+        )
+        assert first.status_code == HTTPStatus.OK, first.text
+    else:
+        etag = f"W/{etag}"
+
+    response = await client.put(
+        f"/appointments/{created['id']}",
+        json={"date": (day + timedelta(days=3)).isoformat()},
+        headers={**headers, "If-Match": etag},
+    )
+
+    assert response.status_code == HTTPStatus.PRECONDITION_FAILED
@@ -0,0 +1,64 @@
+from datetime import UTC, datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+
+from core.cache.availability_grid import AvailabilityGrid
+from repositories.interfaces.availability_interface import (
+    IAvailabilityRepository,
+)
+from schemas.availability_schema import AdminDayAvailability
+
+pytestmark = pytest.mark.asyncio
+
+HORIZON_DAYS = 30
+
+
+class CountingAvailabilityRepository(IAvailabilityRepository):
+    """Um admin com 3 vagas por dia; conta as consultas feitas."""
+
+    def __init__(self, admin_id: UUID):
+        self.admin_id = admin_id
+        self.calls: list[list[UUID] | None] = []
+
+    async def get_range(self, start, end, admin_ids=None):
+        self.calls.append(admin_ids)
+        if admin_ids is not None and self.admin_id not in admin_ids:
+            return []
+        return [
+            AdminDayAvailability(
+                admin_id=self.admin_id,
+                date=start + timedelta(days=offset),
+                capacity=3,
+                booked=0,
+                remaining=3,
+            )
+            for offset in range((end - start).days + 1)
+        ]
+
+
+async def test_unknown_admin_is_not_reloaded_on_every_read():
+    repository = CountingAvailabilityRepository(uuid4())
+    grid = AvailabilityGrid(HORIZON_DAYS, ttl_seconds=60)
+    today = datetime.now(UTC).date()
+    unknown = uuid4()
+
+    for _ in range(3):
+        assert await grid.get(repository, today, today, unknown) == {}
+
+    assert repository.calls == [[unknown]]
+
+
+async def test_known_admin_is_served_from_the_grid():
+    admin_id = uuid4()
+    repository = CountingAvailabilityRepository(admin_id)
+    grid = AvailabilityGrid(HORIZON_DAYS, ttl_seconds=60)
+    today = datetime.now(UTC).date()
+
+    for _ in range(3):
+        calendar = await grid.get(
+            repository, today, today + timedelta(days=1), admin_id
+        )
+        assert calendar == {admin_id: [3, 3]}
+
+    assert repository.calls == [[admin_id]]
@@ -0,0 +1,136 @@
+import asyncio
+from http import HTTPStatus
+from urllib.parse import parse_qs, urlparse
+
+import httpx
+import pytest
+from authlib.integrations.starlette_client import OAuth
+from oidc_stub import CLIENT_ID, DISCOVERY_URL, StubOIDCProvider
+
+from app import app_fast
+from core.cache.oidc_cache import OIDCDocumentCache
+from core.oidc_client import CachedOIDCApp
+
+pytestmark = pytest.mark.asyncio
+
+TTL_SECONDS = 3600
+
+
+@pytest.fixture
+def provider() -> StubOIDCProvider:
+    return StubOIDCProvider()
+
+
+@pytest.fixture
+def use_cache(monkeypatch):
+    """Troca o ``oidc_cache`` do cliente, como um worker novo."""
+
+    def use_cache(cache: OIDCDocumentCache) -> OIDCDocumentCache:
+        monkeypatch.setattr("core.oidc_client.oidc_cache", cache)
+        return cache
+
+    return use_cache
+
+
+@pytest.fixture
+def google(monkeypatch, provider, use_cache, tmp_path) -> CachedOIDCApp:
+    """Cliente OAuth do login com Google apontando para o provedor falso."""
+    use_cache(OIDCDocumentCache(TTL_SECONDS, directory=str(tmp_path)))
+    client = OAuth().register(
+        name="google",
+        client_cls=CachedOIDCApp,
+        client_id=CLIENT_ID,
+        client_secret="secret",
+        server_metadata_url=DISCOVERY_URL,
+        client_kwargs={
+            "scope": "openid profile email",
+            "transport": httpx.ASGITransport(app=provider.app),
+        },
+    )
+    monkeypatch.setattr("routers.auth_router.get_google_oauth", lambda: client)
+    return client
+
+
+async def login(provider: StubOIDCProvider) -> httpx.Response:
+    """Fluxo completo: redirect para o provedor e callback com o código."""
+    transport = httpx.ASGITransport(app=app_fast)
+    async with httpx.AsyncClient(
+        transport=transport, base_url="http://test"
+    ) as client:
+        redirect = await client.get("/auth/google")
+        assert redirect.status_code == HTTPStatus.FOUND, redirect.text
+        query = parse_qs(urlparse(redirect.headers["location"]).query)
+        callback = await client.get(
+            "/auth/google/callback",
+            params={
+                "code": provider.authorize(query["nonce"][0]),
+                "state": query["state"][0],
+            },
+        )
+    assert callback.status_code == HTTPStatus.FOUND, callback.text
+    assert "set-cookie" in callback.headers
+    return callback
+
+
+async def test_cold_cache_downloads_documents_once(db, provider, google):
+    for _ in range(3):
+        await login(provider)
+
+    # O ID token é validado localmente: sem chamadas ao userinfo.
+    assert provider.hits == {"discovery": 1, "jwks": 1, "token": 3}
+
+
+async def test_new_worker_reads_documents_from_disk(
+    db, provider, google, use_cache, tmp_path
+):
+    await login(provider)
+    use_cache(OIDCDocumentCache(TTL_SECONDS, directory=str(tmp_path)))
+
+    await login(provider)
+
+    assert provider.hits == {"discovery": 1, "jwks": 1, "token": 2}
+
+
+async def test_expired_documents_are_downloaded_again(tmp_path):
+    fetches = []
+
+    async def fetch() -> dict:
+        fetches.append(1)
+        return {"issuer": "https://oidc.test"}
+
+    cache = OIDCDocumentCache(1, directory=str(tmp_path))
+    await cache.get(DISCOVERY_URL, fetch)
+    await cache.get(DISCOVERY_URL, fetch)
+    assert len(fetches) == 1
+
+    await asyncio.sleep(1.1)
+    # A cópia em disco também expirou: um worker novo baixa de novo...
+    await OIDCDocumentCache(1, directory=str(tmp_path)).get(
+        DISCOVERY_URL, fetch
+    )
+    assert len(fetches) == 2  # noqa: PLR2004
+    # ...e o worker antigo, com a memória expirada, lê a cópia nova.
+    await cache.get(DISCOVERY_URL, fetch)
+    assert len(fetches) == 2  # noqa: PLR2004
+
+
+async def test_key_rotation_refreshes_jwks_once(db, provider, google):
+    await login(provider)
+    provider.rotate_key()
+
+    await asyncio.gather(*(login(provider) for _ in range(5)))
+
+    assert provider.hits == {"discovery": 1, "jwks": 2, "token": 6}
+
+
+async def test_userinfo_only_when_id_token_has_no_email(db, provider, google):
+    provider.include_email = False
+
+    await login(provider)
+
+    assert provider.hits == {
+        "discovery": 1,
+        "jwks": 1,
+        "token": 1,
+        "userinfo": 1,
+    }
@@ -0,0 +1,163 @@
+from datetime import UTC, datetime, timedelta
+from http import HTTPStatus
+
+import pytest
+from sqlalchemy import func, select, update
+
+from core.db.session import AsyncSessionLocal
+from dependencies.idempotency_dependencies import REPLAYED_HEADER
+from models import AppointmentModel, IdempotencyKeyModel
+from repositories.idempotency_keys_repository import IdempotencyKeysRepository
+from services.idempotency_service import IdempotencyService
+from utils import responses
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.fixture
+def create(client, service, day, auth_headers):
+    async def create(user, **headers: str):
+        return await client.post(
+            "/appointments/",
+            json={"date": day.isoformat(), "services": [str(service.id)]},
+            headers=auth_headers(user, **headers),
+        )
+
+    return create
+
+
+@pytest.mark.parametrize("action", ["cancel", "confirm"])
+async def test_replay_returns_the_original_etag(  # noqa: PLR0913, PLR0917
+    client, make_user, make_admin, create, auth_headers, action
+):
+    user = await make_user()
+    admin = await make_admin()
+    appointment_id = (await create(user)).json()["id"]
+    requester, body = (
+        (user, {"cancel_reason": "Imprevisto"})
+        if action == "cancel"
+        else (admin, None)
+    )
+
+    responses = [
+        await client.post(
+            f"/appointments/{appointment_id}/{action}",
+            json=body,
+            headers=auth_headers(requester, **{"Idempotency-Key": "k1"}),
+        )
+        for _ in range(2)
+    ]
+
+    original, replay = responses
+    assert original.status_code == replay.status_code == HTTPStatus.OK
+    assert REPLAYED_HEADER not in original.headers
+    assert replay.headers[REPLAYED_HEADER] == "true"
+    assert replay.headers["ETag"] == original.headers["ETag"]
+    assert replay.content == original.content
+
+
+async def count_appointments(session, user) -> int:
+    return await session.scalar(
+        select(func.count())
+        .select_from(AppointmentModel)
+        .where(AppointmentModel.client_id == user.id)
+    )
+
+
+async def test_failure_before_commit_undoes_claim_and_operation(
+    create, make_user, session, monkeypatch
+):
+    user = await make_user()
+    headers = {"Idempotency-Key": "crash"}
+
+    async def crash(*args, **kwargs):
+        raise RuntimeError("failed while storing the response")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(IdempotencyService, "complete", crash)
+        with pytest.raises(RuntimeError):
+            await create(user, **headers)
+
+    # Reserva, resposta e agendamento vão no mesmo commit: nada ficou.
+    assert (
+        await session.scalar(select(func.count(IdempotencyKeyModel.id))) == 0
+    )
+    assert await count_appointments(session, user) == 0
+
+    retried = await create(user, **headers)
+    replayed = await create(user, **headers)
+
+    assert retried.status_code == HTTPStatus.CREATED
+    assert REPLAYED_HEADER not in retried.headers
+    assert replayed.headers[REPLAYED_HEADER] == "true"
+    assert replayed.json()["id"] == retried.json()["id"]
+    assert await count_appointments(session, user) == 1
+
+
+async def test_failure_after_commit_replays_the_stored_response(
+    create, make_user, session, monkeypatch
+):
+    user = await make_user()
+    headers = {"Idempotency-Key": "late-crash"}
+    rendered = []
+
+    def json_response(*args, **kwargs):
+        # A primeira renderização é a gravada antes do commit; a falha
+        # vem depois dele.
+        rendered.append(args)
+        if len(rendered) > 1:
+            raise RuntimeError("failed after the commit")
+        return responses.json_response(*args, **kwargs)
+
+    with monkeypatch.context() as patch:
+        patch.setattr(
+            "routers.appointments_router.json_response", json_response
+        )
+        with pytest.raises(RuntimeError):
+            await create(user, **headers)
+
+    retried = await create(user, **headers)
+
+    assert retried.status_code == HTTPStatus.CREATED
+    assert retried.headers[REPLAYED_HEADER] == "true"
+    assert await count_appointments(session, user) == 1
+
+
+async def test_waiting_request_releases_its_connection(
+    make_user, session, monkeypatch
+):
+    user = await make_user()
+    # Reserva de outra requisição, ainda sem resposta.
+    session.add(
+        IdempotencyKeyModel(
+            user_id=user.id,
+            key="busy",
+            request_hash="hash",
+            expires_at=datetime.now(UTC) + timedelta(minutes=1),
+        )
+    )
+    await session.commit()
+    in_transaction = []
+
+    async with AsyncSessionLocal() as waiting:
+
+        async def sleep(delay: float) -> None:
+            in_transaction.append(waiting.in_transaction())
+            await session.execute(
+                update(IdempotencyKeyModel)
+                .where(IdempotencyKeyModel.key == "busy")
+                .values(
+                    response_status=HTTPStatus.CREATED, response_body=b"{}"
+                )
+            )
+            await session.commit()
+
+        monkeypatch.setattr(
+            "services.idempotency_service.asyncio.sleep", sleep
+        )
+        stored = await IdempotencyService(
+            IdempotencyKeysRepository(waiting)
+        ).begin(user.id, "busy", "hash")
+
+    assert in_transaction == [False]
+    assert stored.response_status == HTTPStatus.CREATED
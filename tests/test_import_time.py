@@ -0,0 +1,76 @@
+"""
+Cold start de um worker: importar ``app`` num processo novo com
+``-X importtime`` precisa caber no orçamento, e as integrações pesadas
+só podem ser carregadas no primeiro uso.
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+RUNS = 3
+BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", "2000"))
+
+# Só devem ser importados no primeiro uso (login com Google, envio de
+# email, worker do Celery, storage).
+LAZY_MODULES = ("authlib", "resend", "celery", "boto3")
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Módulo -> (tempo próprio, tempo acumulado), em microssegundos."""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, cumulative_us, name = line.removeprefix("import time:").split(
+            "|"
+        )
+        if not self_us.strip().isdigit():
+            continue  # cabeçalho
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def import_app() -> dict[str, tuple[int, int]]:
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import app"],
+        cwd=SRC.parent,
+        env={**os.environ, "PYTHONPATH": str(SRC)},
+        capture_output=True,
+        text=True,
+        check=False,
+    )
+    assert process.returncode == 0, process.stderr[-2000:]
+    return parse_importtime(process.stderr)
+
+
+def test_parse_importtime():
+    stderr = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |   _io\n"
+        "import time:      3000 |       4500 | app\n"
+        "unrelated warning\n"
+    )
+
+    assert parse_importtime(stderr) == {
+        "_io": (120, 120),
+        "app": (3000, 4500),
+    }
+
+
+def test_app_import_within_budget_and_lazy():
+    runs = [import_app() for _ in range(RUNS)]
+
+    # O menor tempo é o que menos sofre com outros processos na máquina.
+    import_ms = min(modules["app"][1] / 1000 for modules in runs)
+    assert import_ms <= BUDGET_MS, (
+        f"import app took {import_ms:.1f}ms, budget is {BUDGET_MS:.1f}ms"
+    )
+    eager = [
+        name
+        for name in LAZY_MODULES
+        if any(module.split(".")[0] == name for module in runs[-1])
+    ]
+    assert not eager, f"imported at startup: {', '.join(eager)}"
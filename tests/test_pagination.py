@@ -0,0 +1,33 @@
+from http import HTTPStatus
+
+import pytest
+
+pytestmark = pytest.mark.asyncio
+
+
+@pytest.mark.parametrize("path", ["/appointments/", "/appointments/cursor"])
+@pytest.mark.parametrize("size", [0, 101, 1000])
+async def test_out_of_range_page_size_is_rejected(
+    client, make_user, auth_headers, path, size
+):
+    user = await make_user()
+
+    response = await client.get(
+        path, params={"size": size}, headers=auth_headers(user)
+    )
+
+    assert response.status_code == HTTPStatus.UNPROCESSABLE_ENTITY
+
+
+@pytest.mark.parametrize("path", ["/appointments/", "/appointments/cursor"])
+async def test_largest_page_size_is_accepted(
+    client, make_user, auth_headers, path
+):
+    user = await make_user()
+
+    response = await client.get(
+        path, params={"size": 100}, headers=auth_headers(user)
+    )
+
+    assert response.status_code == HTTPStatus.OK
+    assert response.json()["size"] == 100  # noqa: PLR2004
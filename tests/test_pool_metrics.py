@@ -0,0 +1,45 @@
+import pytest
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.db.pool import InstrumentedReplicaQueuePool
+from core.settings import get_settings
+
+pytestmark = pytest.mark.asyncio
+
+
+def checkouts(pool: str) -> float:
+    return (
+        REGISTRY.get_sample_value(
+            "db_pool_checkout_wait_seconds_count", {"pool": pool}
+        )
+        or 0
+    )
+
+
+async def test_replica_pool_reports_under_its_own_label(database):
+    replica = create_async_engine(
+        get_settings().ASYNC_DATABASE_URL,
+        poolclass=InstrumentedReplicaQueuePool,
+    )
+    primary_before = checkouts("primary")
+    replica_before = checkouts("replica")
+    try:
+        async with replica.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        # dispose() recria o pool; o rótulo continua o mesmo.
+        await replica.dispose()
+        async with replica.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            assert (
+                REGISTRY.get_sample_value(
+                    "db_pool_checked_out_connections", {"pool": "replica"}
+                )
+                == 1
+            )
+    finally:
+        await replica.dispose()
+
+    assert checkouts("replica") == replica_before + 2
+    assert checkouts("primary") == primary_before
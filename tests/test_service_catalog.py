@@ -0,0 +1,99 @@
+import asyncio
+from datetime import UTC, datetime
+from decimal import Decimal
+from unittest.mock import AsyncMock, Mock
+from uuid import uuid4
+
+import pytest
+
+from core.cache.service_catalog import ServiceCatalog
+from models import ServiceModel
+from repositories.interfaces.services_interface import IServiceRepository
+
+pytestmark = pytest.mark.asyncio
+
+
+def add_service(services: list[ServiceModel]) -> ServiceModel:
+    now = datetime.now(UTC)
+    service = ServiceModel(
+        id=uuid4(),
+        name=f"service {len(services)}",
+        description="Serviço de teste",
+        price=Decimal("50.00"),
+        created_at=now,
+        updated_at=now,
+    )
+    services.append(service)
+    return service
+
+
+@pytest.fixture
+def services() -> list[ServiceModel]:
+    return []
+
+
+@pytest.fixture
+def repository(services) -> Mock:
+    """Catálogo em memória; ``get_all.await_count`` conta as cargas."""
+
+    async def get_all() -> list[ServiceModel]:
+        return list(services)
+
+    repository = Mock(spec=IServiceRepository)
+    repository.get_all = AsyncMock(side_effect=get_all)
+    return repository
+
+
+async def test_unknown_ids_reload_at_most_once_per_check_window(
+    repository, services
+):
+    known = add_service(services)
+    catalog = ServiceCatalog(ttl_seconds=300, version_check_seconds=60)
+    await catalog.resolve(repository, [known.id])
+
+    results = await asyncio.gather(
+        *(catalog.resolve(repository, [known.id, uuid4()]) for _ in range(20))
+    )
+
+    assert repository.get_all.await_count == 1
+    assert all(result.keys() == {known.id} for result in results)
+
+
+async def test_service_created_in_another_worker_is_found(
+    repository, services
+):
+    catalog = ServiceCatalog(ttl_seconds=300, version_check_seconds=0)
+    await catalog.resolve(repository, [])
+
+    created = add_service(services)
+    resolved = await catalog.resolve(repository, [created.id])
+
+    assert resolved.keys() == {created.id}
+    assert repository.get_all.await_count == 2  # noqa: PLR2004
+
+
+async def test_load_started_before_a_bump_is_discarded(repository, services):
+    catalog = ServiceCatalog(ttl_seconds=300, version_check_seconds=60)
+    add_service(services)
+    read, release = asyncio.Event(), asyncio.Event()
+
+    async def slow_get_all() -> list[ServiceModel]:
+        rows = list(services)
+        if not read.is_set():
+            read.set()
+            await release.wait()
+        return rows
+
+    repository.get_all.side_effect = slow_get_all
+    loading = asyncio.create_task(catalog.resolve(repository, []))
+    await read.wait()
+    # Escrita concluída enquanto a carga ainda não guardou o que leu.
+    created = add_service(services)
+    await catalog.bump()
+    release.set()
+    await loading
+
+    resolved = await catalog.resolve(repository, [created.id])
+
+    assert resolved.keys() == {created.id}
+    assert repository.get_all.await_count == 2  # noqa: PLR2004